@@ -0,0 +1,70 @@
+"""Report the payload size reduction of the compact markdown profile per entry.
+
+Usage:
+    uv run python benchmarks/bench_compact_markdown.py --characters 今汐 长离 --artifacts 浮星祛暗
+"""
+
+import argparse
+import asyncio
+
+from wuwa_mcp_server.core import get_container
+
+
+async def measure(characters: list[str], artifacts: list[str]) -> list[tuple[str, int, int, int]]:
+    """Render each entry in every output format and collect the UTF-8 byte sizes.
+
+    Args:
+        characters: Character names to render with get_character_info.
+        artifacts: Artifact set names to render with get_artifact_info.
+
+    Returns:
+        Rows of (entry, markdown bytes, compact bytes, json bytes).
+    """
+    container = get_container()
+    character_service = container.get_character_service()
+    artifact_service = container.get_artifact_service()
+
+    rows = []
+    try:
+        for name in characters:
+            sizes = [
+                len((await character_service.get_character_info(name, output_format)).encode("utf-8"))
+                for output_format in ("markdown", "compact", "json")
+            ]
+            rows.append((f"character:{name}", *sizes))
+
+        for name in artifacts:
+            sizes = [
+                len((await artifact_service.get_artifact_info(name, output_format)).encode("utf-8"))
+                for output_format in ("markdown", "compact", "json")
+            ]
+            rows.append((f"artifact:{name}", *sizes))
+    finally:
+        await container.cleanup()
+
+    return rows
+
+
+def main() -> None:
+    """Run the benchmark and print a per-entry table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--characters", nargs="*", default=["今汐"])
+    parser.add_argument("--artifacts", nargs="*", default=["浮星祛暗"])
+    args = parser.parse_args()
+
+    rows = asyncio.run(measure(args.characters, args.artifacts))
+
+    print(f"{'entry':<24} {'markdown':>10} {'compact':>10} {'saved':>8} {'json':>10}")
+    total_markdown = total_compact = 0
+    for entry, markdown_bytes, compact_bytes, json_bytes in rows:
+        total_markdown += markdown_bytes
+        total_compact += compact_bytes
+        saved = 1 - compact_bytes / markdown_bytes if markdown_bytes else 0.0
+        print(f"{entry:<24} {markdown_bytes:>10} {compact_bytes:>10} {saved:>7.1%} {json_bytes:>10}")
+
+    if total_markdown:
+        print(f"{'total':<24} {total_markdown:>10} {total_compact:>10} {1 - total_compact / total_markdown:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Measure logging overhead per tool call.
+
+Each configuration runs the full get_character_info pipeline (lookup, parse,
+render) against an in-memory stand-in for the Kuro API, with caching disabled,
+so the only difference between runs is how log records are handled:
+
+- ``off``: logging disabled (baseline)
+- ``queue-info``: the server's queue pipeline at the default INFO level
+- ``queue-debug``: the queue pipeline at DEBUG, every record emitted
+- ``sync-debug``: DEBUG written synchronously by a stream handler on the caller
+
+Modes are interleaved over several rounds and the best round is kept, so
+warm-up and drift do not favour whichever mode runs last. Output goes to
+os.devnull, so the numbers exclude terminal rendering.
+
+Usage:
+    uv run python benchmarks/bench_logging.py --calls 300
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Every call runs the whole pipeline
+os.environ["CACHE_ENTRY_TTL"] = "0"
+
+from bench_workers import _synthetic_corpus
+
+from wuwa_mcp_server.core import setup_logging
+from wuwa_mcp_server.core.config import LogSettings
+from wuwa_mcp_server.core.container import DIContainer
+from wuwa_mcp_server.core.logging_config import shutdown_logging
+
+MODES = ("off", "queue-info", "queue-debug", "sync-debug")
+
+
+class InMemoryKuroAPI:
+    """Kuro API client serving the synthetic corpus without any I/O."""
+
+    def __init__(self, characters: int):
+        self.records, self.details = _synthetic_corpus(characters)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def fetch_character_list(self) -> list[dict]:
+        return self.records
+
+    async def fetch_artifacts_list(self) -> list[dict]:
+        return []
+
+    async def fetch_entry_detail(self, entry_id: str) -> dict | None:
+        return self.details.get(entry_id)
+
+
+def configure(mode: str, stream) -> None:
+    """Reset the package logger and configure it for a mode."""
+    shutdown_logging()
+    logger = logging.getLogger("wuwa_mcp")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logging.disable(logging.NOTSET)
+
+    if mode == "off":
+        logging.disable(logging.CRITICAL)
+        return
+
+    if mode == "sync-debug":
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter(LogSettings().format))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        return
+
+    settings = LogSettings()
+    settings.level = "INFO" if mode == "queue-info" else "DEBUG"
+    stderr, sys.stderr = sys.stderr, stream
+    try:
+        setup_logging(settings)
+    finally:
+        sys.stderr = stderr
+
+
+async def measure(calls: int, characters: int) -> float:
+    """Run get_character_info calls sequentially.
+
+    Returns:
+        Mean seconds per call.
+    """
+    container = DIContainer()
+    container._singletons["kuro_api_client"] = InMemoryKuroAPI(characters)
+    service = container.get_character_service()
+    names = [f"角色{index % characters:03d}" for index in range(calls)]
+    try:
+        # Warm the catalogue and any lazy imports outside the timed loop
+        await service.get_character_info(names[0], "markdown")
+        started = time.perf_counter()
+        for name in names:
+            await service.get_character_info(name, "markdown")
+        return (time.perf_counter() - started) / calls
+    finally:
+        await container.cleanup()
+
+
+def main() -> None:
+    """Run every mode and print per-call cost relative to logging disabled."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--characters", type=int, default=20)
+    parser.add_argument("--modes", nargs="*", default=list(MODES), choices=MODES)
+    args = parser.parse_args()
+
+    results = dict.fromkeys(args.modes, float("inf"))
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        for _ in range(args.rounds):
+            for mode in args.modes:
+                configure(mode, devnull)
+                results[mode] = min(results[mode], asyncio.run(measure(args.calls, args.characters)))
+        configure("off", devnull)
+        shutdown_logging()
+
+    baseline = results.get("off")
+    print(f"{'mode':<12} {'ms/call':>10} {'overhead':>12}")
+    for mode, seconds in results.items():
+        overhead = f"{(seconds - baseline) * 1e6:+.0f} us" if baseline is not None else "-"
+        print(f"{mode:<12} {seconds * 1e3:>10.3f} {overhead:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Measure memory per tool call, per cached entry and for the warmed-up process.
+
+Allocations are traced with tracemalloc from before the package is imported,
+against the benchmark corpus (see ``record_fixtures.py``) served through the
+real HTTP client, so no network is involved:
+
+- process: memory traced after imports, container startup and catalogue
+  warm-up, plus the resident set size
+- per call: peak and retained allocation of each tool call with entry and
+  render caching disabled; a retained value above zero means the call leaks
+- per entry: retained size of each representation of the median character
+  page (decoded API JSON, BeautifulSoup trees of its HTML fragments, parsed
+  dict, rendered markdown) and the growth of the process per character once
+  its entries and rendered output are cached
+
+``memory_budget.json`` holds the per-call and per-entry budget and the source
+of the corpus it was measured on (the checked-in corpus is synthetic). The run
+fails when a measurement exceeds its budget by more than the tolerance, so
+changes that grow memory per request or per cached entry are caught; pass
+``--update-budget`` to accept new values deliberately.
+
+Usage:
+    uv run python benchmarks/bench_memory.py
+    uv run python benchmarks/bench_memory.py --json memory.json --update-budget
+"""
+
+# ruff: noqa: E402
+import tracemalloc
+
+# Started before anything else is imported so the process figure includes imports
+tracemalloc.start()
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from bs4 import BeautifulSoup
+from corpus import DEFAULT_CORPUS
+from corpus import Corpus
+
+from wuwa_mcp_server.core.config import ApplicationSettings
+from wuwa_mcp_server.core.container import DIContainer
+from wuwa_mcp_server.infrastructure.api.http_client import HTTPClient
+from wuwa_mcp_server.parsers import StrategyBasedContentParser
+from wuwa_mcp_server.services import MarkdownService
+
+DEFAULT_BUDGET = Path(__file__).resolve().parent / "memory_budget.json"
+
+
+def kib(size: float) -> float:
+    return round(size / 1024, 1)
+
+
+def retained(factory: Callable[[], Any]) -> tuple[Any, int]:
+    """Create an object and return it with the traced memory it keeps alive."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    value = factory()
+    gc.collect()
+    return value, tracemalloc.get_traced_memory()[0] - before
+
+
+def resident_set_kib() -> float | None:
+    """Current resident set size, where /proc is available."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return float(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def create_container(corpus: Corpus, entry_ttl: float) -> DIContainer:
+    """Container whose HTTP client answers from the corpus, with an in-memory cache."""
+    settings = ApplicationSettings()
+    settings.cache.backend = "memory"
+    settings.cache.entry_ttl = entry_ttl
+    container = DIContainer(settings)
+    container._singletons["http_client"] = HTTPClient(
+        api_settings=settings.api,
+        http_settings=settings.http_client,
+        enable_circuit_breaker=True,
+        transport=corpus.transport(),
+    )
+    return container
+
+
+def entry_footprint(corpus: Corpus) -> dict[str, float]:
+    """Retained size of each representation of the median character page, in KiB."""
+    catalogue_id = ApplicationSettings().api.character_catalogue_id
+    names = sorted(corpus.character_names, key=lambda name: len(corpus.entries[corpus.entry_id(catalogue_id, name)]))
+    body = corpus.entries[corpus.entry_id(catalogue_id, names[len(names) // 2])]
+
+    content, raw_json = retained(lambda: json.loads(body)["data"]["content"])
+    fragments = [
+        html
+        for module in content.get("modules", [])
+        for component in module.get("components", [])
+        for html in [component.get("content"), *(tab.get("content") for tab in component.get("tabs", []))]
+        if html
+    ]
+    soups, soup_trees = retained(lambda: [BeautifulSoup(html, "html.parser") for html in fragments])
+    del soups
+    parsed, parsed_size = retained(lambda: StrategyBasedContentParser().parse_main_content(content))
+    _, markdown = retained(lambda: MarkdownService().generate_character_markdown(parsed))
+    return {
+        "response_body": kib(len(body.encode("utf-8"))),
+        "raw_json": kib(raw_json),
+        "soup_trees": kib(soup_trees),
+        "parsed": kib(parsed_size),
+        "markdown": kib(markdown),
+    }
+
+
+async def call_footprint(corpus: Corpus, rounds: int) -> dict[str, dict[str, float]]:
+    """Peak and retained allocation per tool call with caching disabled, in KiB."""
+    container = create_container(corpus, entry_ttl=0)
+    await container.startup(warm_up=True)
+    character_service = container.get_character_service()
+    artifact_service = container.get_artifact_service()
+    calls = {
+        "get_character_info": [(character_service.get_character_info, name) for name in corpus.character_names],
+        "get_character_profile": [(character_service.get_character_profile, name) for name in corpus.character_names],
+        "get_artifact_info": [(artifact_service.get_artifact_info, name) for name in corpus.artifact_names],
+    }
+    results = {}
+    try:
+        for tool, tool_calls in calls.items():
+            # The first pass builds any lazily created state so it is not counted as retained
+            for method, name in tool_calls:
+                await method(name)
+            peaks = []
+            gc.collect()
+            start = tracemalloc.get_traced_memory()[0]
+            for _ in range(rounds):
+                for method, name in tool_calls:
+                    # Collect first so the peak does not depend on when the cyclic GC last ran
+                    gc.collect()
+                    before = tracemalloc.get_traced_memory()[0]
+                    tracemalloc.reset_peak()
+                    await method(name)
+                    peaks.append(tracemalloc.get_traced_memory()[1] - before)
+            gc.collect()
+            count = rounds * len(tool_calls)
+            results[tool] = {
+                "peak_median": kib(statistics.median(peaks)),
+                "peak_max": kib(max(peaks)),
+                "retained": kib((tracemalloc.get_traced_memory()[0] - start) / count),
+            }
+    finally:
+        await container.cleanup()
+    return results
+
+
+async def cache_footprint(corpus: Corpus) -> dict[str, float]:
+    """Process growth per character and artifact set once fully cached, in KiB."""
+    container = create_container(corpus, entry_ttl=3600.0)
+    await container.startup(warm_up=True)
+    character_service = container.get_character_service()
+    artifact_service = container.get_artifact_service()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        for name in corpus.character_names:
+            await character_service.get_character_info(name, "markdown")
+        gc.collect()
+        middle = tracemalloc.get_traced_memory()[0]
+        for name in corpus.artifact_names:
+            await artifact_service.get_artifact_info(name, "markdown")
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        await container.cleanup()
+    return {
+        "cached_character": kib((middle - before) / len(corpus.character_names)),
+        "cached_artifact": kib((after - middle) / len(corpus.artifact_names)),
+    }
+
+
+async def process_footprint(corpus: Corpus) -> dict[str, float | None]:
+    """Traced memory and RSS of the warmed-up process, in KiB."""
+    container = create_container(corpus, entry_ttl=3600.0)
+    await container.startup(warm_up=True)
+    gc.collect()
+    result = {"traced": kib(tracemalloc.get_traced_memory()[0]), "rss": resident_set_kib()}
+    await container.cleanup()
+    return result
+
+
+def check_budget(report: dict[str, Any], budget: dict[str, Any]) -> list[str]:
+    """Compare gated measurements with the budget.
+
+    Returns:
+        A message per measurement over budget.
+    """
+    tolerance = budget.get("tolerance", 0.1)
+    failures = []
+    for section in ("per_call", "per_entry"):
+        for key, limit in budget.get(section, {}).items():
+            value = report[section]
+            for part in key.split("."):
+                value = value[part]
+            # A small absolute slack keeps near-zero budgets (e.g. retained per call) from flapping
+            if value > limit * (1 + tolerance) + 1.0:
+                failures.append(f"{section}.{key}: {value} KiB exceeds budget {limit} KiB (+{tolerance:.0%})")
+    return failures
+
+
+def budget_from(report: dict[str, Any], tolerance: float) -> dict[str, Any]:
+    """Derive a budget from a report."""
+    return {
+        "corpus": report["corpus"],
+        "tolerance": tolerance,
+        "per_call": {
+            f"{tool}.{key}": values[key]
+            for tool, values in report["per_call"].items()
+            for key in ("peak_median", "retained")
+        },
+        "per_entry": {key: value for key, value in report["per_entry"].items() if key != "response_body"},
+    }
+
+
+def main() -> None:
+    """Run the measurements, print them and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--rounds", type=int, default=3, help="passes over the corpus per tool")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    parser.add_argument("--update-budget", action="store_true", help="write the measured values as the new budget")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed growth when updating the budget")
+    parser.add_argument("--json", type=Path, default=None, help="also write the report to this file")
+    args = parser.parse_args()
+
+    corpus = Corpus.load(args.corpus)
+    report = {
+        "python": sys.version.split()[0],
+        "corpus": corpus.source,
+        "process": asyncio.run(process_footprint(corpus)),
+        "per_call": asyncio.run(call_footprint(corpus, args.rounds)),
+        "per_entry": entry_footprint(corpus) | asyncio.run(cache_footprint(corpus)),
+    }
+
+    print(f"process after warm-up: {report['process']['traced']} KiB traced, RSS {report['process']['rss']} KiB")
+    print(f"{'tool':<24} {'peak p50 KiB':>13} {'peak max KiB':>13} {'retained KiB':>13}")
+    for tool, values in report["per_call"].items():
+        print(f"{tool:<24} {values['peak_median']:>13} {values['peak_max']:>13} {values['retained']:>13}")
+    print("per entry (KiB): " + ", ".join(f"{key}={value}" for key, value in report["per_entry"].items()))
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.update_budget:
+        args.budget.write_text(json.dumps(budget_from(report, args.tolerance), indent=2) + "\n", encoding="utf-8")
+        print(f"budget written to {args.budget}")
+        return
+
+    if args.budget.exists():
+        budget = json.loads(args.budget.read_text(encoding="utf-8"))
+        if budget.get("corpus", "unknown") != corpus.source:
+            print(
+                f"note: the budget was measured on a {budget.get('corpus', 'unknown')} corpus, this run on a {corpus.source} one"
+            )
+        failures = check_budget(report, budget)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"within budget ({args.budget.name})")
+
+
+if __name__ == "__main__":
+    main()
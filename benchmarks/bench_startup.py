@@ -0,0 +1,146 @@
+"""Measure stdio cold start: time from spawning the server to its initialize response.
+
+Smithery and desktop clients start a server process per session, so this is
+latency every session pays. Each run spawns ``python -m wuwa_mcp_server.server``
+in stdio mode, sends ``initialize`` and waits for the response. The script
+also reports where import time goes (from ``-X importtime``) and checks that
+importing the server leaves the heavy modules (parsers, BeautifulSoup,
+services, Smithery) unloaded until they are needed.
+
+The run fails when the median time to initialize exceeds ``--budget-ms`` or
+one of those modules is imported eagerly.
+
+Usage:
+    uv run python benchmarks/bench_startup.py --runs 10 --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Must not be imported by `import wuwa_mcp_server.server`
+LAZY_MODULES = ("bs4", "smithery", "wuwa_mcp_server.parsers", "wuwa_mcp_server.services")
+
+_INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "bench", "version": "0"}},
+}
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": str(ROOT / "src"), "TRANSPORT": "stdio", "LOG_LEVEL": "WARNING"}
+
+
+def time_to_initialize() -> float:
+    """Spawn the server once and return seconds until the initialize response."""
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "wuwa_mcp_server.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=_env(),
+    )
+    try:
+        server.stdin.write(json.dumps(_INITIALIZE).encode() + b"\n")
+        server.stdin.flush()
+        line = server.stdout.readline()
+        elapsed = time.perf_counter() - started
+        if json.loads(line).get("id") != 1:
+            raise RuntimeError(f"unexpected first message on stdout: {line[:200]!r}")
+        return elapsed
+    finally:
+        server.stdin.close()
+        server.wait(timeout=30)
+
+
+def import_profile() -> dict[str, float]:
+    """Cumulative import time in ms of the server module, the MCP SDK and this package's own modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import wuwa_mcp_server.server"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    own = 0
+    for match in _IMPORT_LINE.finditer(result.stderr):
+        self_us, cumulative_us, _, module = match.groups()
+        cumulative[module] = int(cumulative_us)
+        if module.startswith("wuwa_mcp_server"):
+            own += int(self_us)
+    return {
+        "wuwa_mcp_server.server": cumulative.get("wuwa_mcp_server.server", 0) / 1e3,
+        "mcp": cumulative.get("mcp", 0) / 1e3,
+        "own_modules": own / 1e3,
+    }
+
+
+def eagerly_imported() -> list[str]:
+    """Modules in LAZY_MODULES that importing the server loads anyway."""
+    code = f"import json, sys, wuwa_mcp_server.server; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=_env(), check=True)
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    """Run the measurements and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="maximum median time to initialize")
+    parser.add_argument("--json", type=Path, default=None, help="also write the report to this file")
+    args = parser.parse_args()
+
+    time_to_initialize()  # populate bytecode caches so every measured run is comparable
+    samples = [time_to_initialize() * 1e3 for _ in range(args.runs)]
+    imports = import_profile()
+    eager = eagerly_imported()
+
+    report = {
+        "python": sys.version.split()[0],
+        "time_to_initialize_ms": {
+            "median": round(statistics.median(samples), 1),
+            "min": round(min(samples), 1),
+            "max": round(max(samples), 1),
+        },
+        "import_ms": {key: round(value, 1) for key, value in imports.items()},
+        "eagerly_imported": eager,
+        "budget_ms": args.budget_ms,
+    }
+
+    startup = report["time_to_initialize_ms"]
+    print(f"time to initialize: median {startup['median']} ms (min {startup['min']}, max {startup['max']})")
+    print(
+        f"imports: server {report['import_ms']['wuwa_mcp_server.server']} ms, "
+        f"of which mcp {report['import_ms']['mcp']} ms and this package's own modules "
+        f"{report['import_ms']['own_modules']} ms"
+    )
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    failures = []
+    if startup["median"] > args.budget_ms:
+        failures.append(f"median time to initialize {startup['median']} ms exceeds the {args.budget_ms} ms budget")
+    if eager:
+        failures.append(f"imported eagerly by wuwa_mcp_server.server: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print("within budget")
+
+
+if __name__ == "__main__":
+    main()
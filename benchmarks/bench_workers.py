@@ -0,0 +1,273 @@
+"""Measure HTTP-mode throughput for different uvicorn worker counts.
+
+The server is pointed at a synthetic stand-in for the Kuro API (served by this
+script in a separate process), so the run is offline and the upstream is never
+the bottleneck. Each configuration is driven by concurrent stateless
+``tools/call`` requests for ``get_character_info``.
+
+Usage:
+    uv run python benchmarks/bench_workers.py --workers 1 2 4 --duration 20
+    uv run python benchmarks/bench_workers.py --workers 1 4 --cache   # with the shared cache enabled
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _synthetic_corpus(characters: int) -> tuple[list[dict], dict[str, dict]]:
+    """Build catalogue records and entry details shaped like the Kuro API responses."""
+    records = []
+    details: dict[str, dict] = {}
+    for index in range(characters):
+        name = f"角色{index:03d}"
+        entry_id = str(1000 + index)
+        strategy_id = str(5000 + index)
+        records.append({"name": name, "content": {"linkId": entry_id}})
+
+        level_rows = "".join(f"<tr><td>{level}</td><td>{level * 12.5:.1f}%</td></tr>" for level in range(1, 21))
+        skill_tabs = [
+            {
+                "title": f"技能{skill}",
+                "content": f"<p>{name}的技能{skill}, 造成<strong>共鸣伤害</strong>。</p>"
+                f"<table><tr><th>等级</th><th>伤害倍率</th></tr>{level_rows}</table>",
+            }
+            for skill in range(6)
+        ]
+        chain_rows = "".join(f"<tr><td>{node}</td><td>共鸣链节点{node}效果描述</td></tr>" for node in range(1, 7))
+        details[entry_id] = {
+            "title": name,
+            "modules": [
+                {
+                    "title": "基础资料",
+                    "components": [
+                        {
+                            "title": "角色",
+                            "role": {
+                                "title": name,
+                                "subtitle": "共鸣者",
+                                "info": [{"text": "性别: 女"}, {"text": "武器: 长刃"}],
+                            },
+                        }
+                    ],
+                },
+                {
+                    "title": "角色养成",
+                    "components": [
+                        {"title": "技能介绍", "tabs": skill_tabs},
+                        {"title": "共鸣链", "content": f"<table>{chain_rows}</table>"},
+                    ],
+                },
+                {
+                    "title": "角色攻略",
+                    "components": [
+                        {
+                            "title": "攻略",
+                            "content": f'<a href="https://wiki.kurobbs.com/mc/item/{strategy_id}">攻略</a>',
+                        }
+                    ],
+                },
+            ],
+        }
+        team_rows = "".join(f"<tr><td>配队{team}</td><td>说明{team}</td></tr>" for team in range(10))
+        details[strategy_id] = {
+            "title": f"{name}攻略",
+            "modules": [
+                {
+                    "title": "配队推荐",
+                    "components": [{"title": "配队", "content": f"<p>推荐配队。</p><table>{team_rows}</table>"}],
+                }
+            ],
+        }
+    return records, details
+
+
+def serve_upstream(port: int, characters: int) -> None:
+    """Serve the synthetic Kuro API on 127.0.0.1:port until killed."""
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    records, details = _synthetic_corpus(characters)
+    page_body = json.dumps({"code": 200, "data": {"results": {"records": records}}}, ensure_ascii=False).encode()
+    detail_bodies = {
+        entry_id: json.dumps({"code": 200, "data": {"content": detail}}, ensure_ascii=False).encode()
+        for entry_id, detail in details.items()
+    }
+
+    async def get_page(request: Request) -> Response:
+        return Response(page_body, media_type="application/json")
+
+    async def get_entry_detail(request: Request) -> Response:
+        form = await request.form()
+        body = detail_bodies.get(str(form.get("id")))
+        if body is None:
+            return Response(b'{"code":404,"msg":"not found"}', media_type="application/json")
+        return Response(body, media_type="application/json")
+
+    app = Starlette(
+        routes=[
+            Route("/getPage", get_page, methods=["POST"]),
+            Route("/getEntryDetail", get_entry_detail, methods=["POST"]),
+        ]
+    )
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+async def _wait_ready(url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.post(url, json={}, headers=_HEADERS)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.5)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+
+_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+async def _drive(url: str, characters: int, concurrency: int, duration: float) -> tuple[int, int, list[float]]:
+    """Send tool calls from `concurrency` clients for `duration` seconds."""
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    rng = random.Random(0)
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        request_id = 0
+        while time.monotonic() < deadline:
+            request_id += 1
+            payload = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {
+                    "name": "get_character_info",
+                    "arguments": {"character_name": f"角色{rng.randrange(characters):03d}"},
+                },
+            }
+            started = time.perf_counter()
+            try:
+                response = await client.post(url, json=payload, headers=_HEADERS)
+                if response.status_code != 200 or "error" in response.json():
+                    errors += 1
+                    continue
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    async with httpx.AsyncClient(timeout=120.0, limits=httpx.Limits(max_connections=concurrency)) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return len(latencies), errors, latencies
+
+
+def run_configuration(workers: int, args: argparse.Namespace, upstream_url: str) -> dict:
+    """Start the server with `workers` workers, drive it and return the measured results."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT / "src"),
+        "TRANSPORT": "http",
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+        "WORKERS": str(workers),
+        "KURO_API_BASE_URL": upstream_url,
+        "MCP_STATELESS_HTTP": "true",
+        "MCP_JSON_RESPONSE": "true",
+        "LOG_LEVEL": "WARNING",
+    }
+    if args.cache:
+        env["CACHE_SQLITE_PATH"] = str(Path(os.environ.get("TMPDIR", "/tmp")) / f"wuwa-bench-{port}.sqlite3")
+    else:
+        # Expire entries immediately so every call fetches, parses and renders
+        env["CACHE_BACKEND"] = "memory"
+        env["CACHE_ENTRY_TTL"] = "0"
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "wuwa_mcp_server.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/mcp"
+    try:
+        asyncio.run(_wait_ready(url))
+        asyncio.run(_drive(url, args.characters, args.concurrency, min(2.0, args.duration)))  # warm-up
+        completed, errors, latencies = asyncio.run(_drive(url, args.characters, args.concurrency, args.duration))
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+    latencies.sort()
+    return {
+        "workers": workers,
+        "requests_per_second": completed / args.duration,
+        "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    """Run the benchmark for each worker count and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds per configuration")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent client connections")
+    parser.add_argument("--characters", type=int, default=50, help="Synthetic characters in the catalogue")
+    parser.add_argument("--cache", action="store_true", help="Keep the (shared) entry and render cache enabled")
+    parser.add_argument("--serve-upstream", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_upstream is not None:
+        serve_upstream(args.serve_upstream, args.characters)
+        return
+
+    upstream_port = _free_port()
+    upstream = subprocess.Popen(
+        [sys.executable, __file__, "--serve-upstream", str(upstream_port), "--characters", str(args.characters)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        time.sleep(2.0)
+        results = [run_configuration(workers, args, f"http://127.0.0.1:{upstream_port}") for workers in args.workers]
+    finally:
+        upstream.terminate()
+        upstream.wait(timeout=30)
+
+    print(f"cpus={os.cpu_count()} concurrency={args.concurrency} cache={'on' if args.cache else 'off'}")
+    print(f"{'workers':>8} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'errors':>8}")
+    for row in results:
+        print(
+            f"{row['workers']:>8} {row['requests_per_second']:>10.1f} {row['p50_ms']:>10.1f} "
+            f"{row['p95_ms']:>10.1f} {row['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Kuro API responses, recorded or generated, used by the offline benchmarks.
+
+The corpus is one gzipped JSON document holding the raw response bodies of
+``/getPage`` (per catalogue ID) and ``/getEntryDetail`` (per entry ID), in the
+form the API returns them. ``record_fixtures.py`` creates it, either from the
+live API or synthetically; ``Corpus.source`` tells which. The checked-in corpus
+is synthetic, so figures measured on it reflect generated HTML and JSON, not
+real upstream payloads.
+"""
+
+import gzip
+import json
+from functools import cached_property
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+
+from wuwa_mcp_server.core.config import get_settings
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "fixtures" / "kuro_corpus.json.gz"
+
+
+class Corpus:
+    """Raw Kuro API response bodies keyed by request."""
+
+    def __init__(self, document: dict):
+        self.source: str = document.get("source", "unknown")
+        self.recorded_at: str = document.get("recorded_at", "")
+        self.pages: dict[str, str] = document["pages"]
+        self.entries: dict[str, str] = document["entries"]
+
+    @classmethod
+    def load(cls, path: Path | str = DEFAULT_CORPUS) -> "Corpus":
+        """Load a corpus file written by record_fixtures.py."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def records(self, catalogue_id: str) -> list[dict]:
+        """Catalogue records of a recorded ``/getPage`` response."""
+        return json.loads(self.pages[catalogue_id])["data"]["results"]["records"]
+
+    def content(self, entry_id: str) -> dict:
+        """Decoded ``content`` of a recorded ``/getEntryDetail`` response."""
+        return json.loads(self.entries[entry_id])["data"]["content"]
+
+    @cached_property
+    def character_names(self) -> list[str]:
+        """Names of characters whose detail page was recorded."""
+        records = self.records(get_settings().api.character_catalogue_id)
+        return [record["name"] for record in records if str(record["content"]["linkId"]) in self.entries]
+
+    @cached_property
+    def artifact_names(self) -> list[str]:
+        """Names of artifact sets whose detail page was recorded."""
+        records = self.records(get_settings().api.artifacts_catalogue_id)
+        return [record["name"] for record in records if str(record["content"]["linkId"]) in self.entries]
+
+    def entry_id(self, catalogue_id: str, name: str) -> str:
+        """Entry ID of a catalogue record by name."""
+        for record in self.records(catalogue_id):
+            if record["name"] == name:
+                return str(record["content"]["linkId"])
+        raise KeyError(name)
+
+    def pages_of_kind(self, kind: str) -> list[dict]:
+        """Decoded detail pages of one kind: ``character``, ``strategy`` or ``artifact``.
+
+        Returns:
+            Page contents, sorted by raw body size.
+        """
+        api = get_settings().api
+        if kind == "artifact":
+            ids = [self.entry_id(api.artifacts_catalogue_id, name) for name in self.artifact_names]
+        else:
+            character_ids = {self.entry_id(api.character_catalogue_id, name) for name in self.character_names}
+            artifact_ids = {self.entry_id(api.artifacts_catalogue_id, name) for name in self.artifact_names}
+            if kind == "character":
+                ids = list(character_ids)
+            else:
+                ids = [entry_id for entry_id in self.entries if entry_id not in character_ids | artifact_ids]
+        ids.sort(key=lambda entry_id: len(self.entries[entry_id]))
+        return [self.content(entry_id) for entry_id in ids]
+
+    def representative_page(self, kind: str) -> dict:
+        """The median-size detail page of one kind."""
+        pages = self.pages_of_kind(kind)
+        return pages[len(pages) // 2]
+
+    def html_fragments(self) -> list[str]:
+        """Every HTML fragment (component or tab content) in the corpus, sorted by size."""
+        fragments = []
+        for entry_id in self.entries:
+            for module in self.content(entry_id).get("modules", []):
+                for component in module.get("components", []):
+                    if component.get("content"):
+                        fragments.append(component["content"])
+                    fragments.extend(tab["content"] for tab in component.get("tabs", []) if tab.get("content"))
+        fragments.sort(key=len)
+        return fragments
+
+    def transport(self) -> httpx.MockTransport:
+        """An httpx transport answering API requests from the corpus."""
+        not_found = b'{"code":404,"msg":"not found"}'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            form = {key: values[0] for key, values in parse_qs(request.content.decode()).items()}
+            if request.url.path.endswith("/getPage"):
+                body = self.pages.get(form.get("catalogueId", ""))
+            elif request.url.path.endswith("/getEntryDetail"):
+                body = self.entries.get(form.get("id", ""))
+            else:
+                body = None
+            return httpx.Response(
+                200,
+                content=body.encode("utf-8") if body is not None else not_found,
+                headers={"Content-Type": "application/json"},
+            )
+
+        return httpx.MockTransport(handler)
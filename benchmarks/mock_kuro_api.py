@@ -0,0 +1,279 @@
+"""Stand-in Kuro API server for load testing and offline development.
+
+Serves ``/getPage`` and ``/getEntryDetail`` from a benchmark corpus (see
+``record_fixtures.py``) with injectable upstream behaviour:
+
+- ``--latency``: per-request delay, ``none``, ``fixed:MS``, ``uniform:LOW:HIGH``,
+  ``normal:MEAN:STDDEV``, ``lognormal:MEDIAN:SIGMA`` or ``exponential:MEAN``
+  (milliseconds)
+- ``--error-rate``: share of requests answered with ``--error-status``
+- ``--throttle-rate``: share of requests answered with 429
+- ``--max-rps``: answer 429 once more requests than this arrive within a second
+- ``--size-scale``: repeat every HTML fragment so detail pages grow by about
+  this factor
+
+All random choices come from one seeded generator, so a run with the same seed
+and request order gets the same faults. Point the server at it with
+``KURO_API_BASE_URL=http://127.0.0.1:PORT``. ``GET /_mock/stats`` returns
+request counts by endpoint and status, and ``POST /_mock/faults`` changes the
+fault settings at runtime (query parameters named like the options above,
+e.g. ``?error_rate=1`` to take the upstream down and ``?error_rate=0`` to
+bring it back).
+
+Usage:
+    uv run python benchmarks/mock_kuro_api.py --port 8765 --latency lognormal:40:0.5 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from corpus import DEFAULT_CORPUS
+from corpus import Corpus
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.responses import Response
+from starlette.routing import Route
+
+_NOT_FOUND = b'{"code":404,"msg":"not found"}'
+# Parameter count of each latency distribution
+_LATENCY_PARAMETERS = {"none": 0, "fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+
+
+class Latency:
+    """A latency distribution parsed from ``kind[:param[:param]]`` in milliseconds."""
+
+    def __init__(self, spec: str = "none"):
+        kind, *params = spec.split(":")
+        if kind not in _LATENCY_PARAMETERS:
+            raise ValueError(f"unknown latency distribution {kind!r}, expected one of {', '.join(_LATENCY_PARAMETERS)}")
+        if len(params) != _LATENCY_PARAMETERS[kind]:
+            raise ValueError(f"{kind} latency takes {_LATENCY_PARAMETERS[kind]} parameter(s), got {spec!r}")
+        self.spec = spec
+        self.kind = kind
+        self.params = [float(param) for param in params]
+        if any(param < 0 for param in self.params) or (kind in ("lognormal", "exponential") and not self.params[0]):
+            raise ValueError(f"invalid latency parameters in {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one delay, in seconds."""
+        if self.kind == "none":
+            return 0.0
+        if self.kind == "fixed":
+            delay = self.params[0]
+        elif self.kind == "uniform":
+            delay = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            delay = rng.gauss(*self.params)
+        elif self.kind == "lognormal":
+            delay = rng.lognormvariate(math.log(self.params[0]), self.params[1])
+        else:
+            delay = rng.expovariate(1 / self.params[0])
+        return max(delay, 0.0) / 1000
+
+
+class Faults:
+    """Upstream behaviour injected into every response."""
+
+    def __init__(
+        self,
+        latency: Latency | None = None,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        throttle_rate: float = 0.0,
+        max_rps: float = 0.0,
+    ):
+        self.latency = latency or Latency()
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+
+    def update(self, values: dict[str, str]) -> None:
+        """Apply settings given as strings, e.g. from query parameters.
+
+        Raises:
+            ValueError: If a name is unknown or a value does not parse.
+        """
+        parsers = {
+            "latency": Latency,
+            "error_rate": _rate,
+            "error_status": int,
+            "throttle_rate": _rate,
+            "max_rps": float,
+        }
+        unknown = set(values) - set(parsers)
+        if unknown:
+            raise ValueError(f"unknown fault settings: {', '.join(sorted(unknown))}")
+        parsed = {name: parsers[name](value) for name, value in values.items()}
+        for name, value in parsed.items():
+            setattr(self, name, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "latency": self.latency.spec,
+            "error_rate": self.error_rate,
+            "error_status": self.error_status,
+            "throttle_rate": self.throttle_rate,
+            "max_rps": self.max_rps,
+        }
+
+
+def _rate(value: str) -> float:
+    rate = float(value)
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"rate must be between 0 and 1, got {value}")
+    return rate
+
+
+def scale_entry(body: str, factor: float, rng: random.Random) -> str:
+    """Grow a ``/getEntryDetail`` body by repeating its HTML fragments.
+
+    Each fragment is repeated ``int(factor)`` times, plus once more with
+    probability equal to the fractional part, so markup stays well formed and
+    pages grow by about ``factor`` on average.
+    """
+    if factor == 1.0:
+        return body
+
+    def repeat(html: str) -> str:
+        return html * (int(factor) + (rng.random() < factor % 1))
+
+    document = json.loads(body)
+    content = (document.get("data") or {}).get("content") or {}
+    for module in content.get("modules", []):
+        for component in module.get("components", []):
+            if component.get("content"):
+                component["content"] = repeat(component["content"])
+            for tab in component.get("tabs", []):
+                if tab.get("content"):
+                    tab["content"] = repeat(tab["content"])
+    return json.dumps(document, ensure_ascii=False)
+
+
+def create_app(corpus: Corpus, faults: Faults | None = None, size_scale: float = 1.0, seed: int = 0) -> Starlette:
+    """Build the mock API application.
+
+    Args:
+        corpus: Corpus whose responses to serve.
+        faults: Injected upstream behaviour. None serves every request at once.
+        size_scale: Factor by which detail pages are grown (at least 1).
+        seed: Seed for latency, fault and size scaling decisions.
+
+    Returns:
+        Starlette application.
+    """
+    if size_scale < 1.0:
+        raise ValueError("size_scale must be at least 1")
+    faults = faults or Faults()
+    rng = random.Random(seed)
+    # Bodies are encoded once; serving them is then only a lookup
+    pages = {catalogue_id: body.encode("utf-8") for catalogue_id, body in corpus.pages.items()}
+    entries = {
+        entry_id: scale_entry(body, size_scale, rng).encode("utf-8") for entry_id, body in corpus.entries.items()
+    }
+    counts: Counter[tuple[str, int]] = Counter()
+    window = {"second": 0, "requests": 0}
+
+    async def respond(endpoint: str, body: bytes | None) -> Response:
+        # Decisions are drawn before the delay so they follow request arrival order
+        delay = faults.latency.sample(rng)
+        roll = rng.random()
+        second = int(time.monotonic())
+        if window["second"] != second:
+            window["second"], window["requests"] = second, 0
+        window["requests"] += 1
+
+        if (faults.max_rps and window["requests"] > faults.max_rps) or roll < faults.throttle_rate:
+            status, content = 429, b'{"code":429,"msg":"too many requests"}'
+        elif roll < faults.throttle_rate + faults.error_rate:
+            status = faults.error_status
+            content = json.dumps({"code": status, "msg": "injected error"}).encode()
+        else:
+            status, content = 200, body if body is not None else _NOT_FOUND
+
+        if delay:
+            await asyncio.sleep(delay)
+        counts[endpoint, status] += 1
+        headers = {"Retry-After": "1"} if status == 429 else None
+        return Response(content, status_code=status, media_type="application/json", headers=headers)
+
+    async def get_page(request: Request) -> Response:
+        form = await request.form()
+        return await respond("getPage", pages.get(str(form.get("catalogueId"))))
+
+    async def get_entry_detail(request: Request) -> Response:
+        form = await request.form()
+        return await respond("getEntryDetail", entries.get(str(form.get("id"))))
+
+    async def stats(request: Request) -> JSONResponse:
+        by_status: Counter[int] = Counter()
+        for (_, status), count in counts.items():
+            by_status[status] += count
+        return JSONResponse(
+            {
+                "requests": sum(counts.values()),
+                "by_status": {str(status): count for status, count in sorted(by_status.items())},
+                "by_endpoint": {f"{endpoint} {status}": count for (endpoint, status), count in sorted(counts.items())},
+                "faults": faults.to_dict(),
+                "size_scale": size_scale,
+            }
+        )
+
+    async def update_faults(request: Request) -> JSONResponse:
+        try:
+            faults.update(dict(request.query_params))
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        if request.query_params.get("reset_stats") is not None:
+            counts.clear()
+        return JSONResponse(faults.to_dict())
+
+    return Starlette(
+        routes=[
+            Route("/getPage", get_page, methods=["POST"]),
+            Route("/getEntryDetail", get_entry_detail, methods=["POST"]),
+            Route("/_mock/stats", stats, methods=["GET"]),
+            Route("/_mock/faults", update_faults, methods=["POST"]),
+        ]
+    )
+
+
+def main() -> None:
+    """Parse options and serve the mock API until interrupted."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--latency", type=Latency, default=Latency(), help="latency distribution (see above)")
+    parser.add_argument("--error-rate", type=_rate, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--throttle-rate", type=_rate, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="429 above this many requests per second")
+    parser.add_argument("--size-scale", type=float, default=1.0, help="detail page growth factor (>= 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.size_scale < 1.0:
+        parser.error("--size-scale must be at least 1")
+
+    corpus = Corpus.load(args.corpus)
+    faults = Faults(args.latency, args.error_rate, args.error_status, args.throttle_rate, args.max_rps)
+    app = create_app(corpus, faults, args.size_scale, args.seed)
+    print(
+        f"Serving {len(corpus.entries)} entries ({corpus.source} corpus) on http://{args.host}:{args.port} "
+        f"with {json.dumps(faults.to_dict())}, size scale {args.size_scale}"
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""Record the Kuro API fixture corpus used by the offline benchmarks.
+
+``--live`` records raw ``/getPage`` and ``/getEntryDetail`` bodies from the
+configured API (KURO_API_BASE_URL): both catalogues, the detail pages of the
+first characters and artifact sets, and the strategy page each character links
+to. ``--synthetic`` writes a deterministic corpus with the same shape (module
+layout, skill tables, stories, strategy pages) so the suite runs without
+network access; that is the corpus checked into the repository.
+
+Usage:
+    uv run python benchmarks/record_fixtures.py --synthetic
+    uv run python benchmarks/record_fixtures.py --live --characters 20 --artifacts 10
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import re
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from corpus import DEFAULT_CORPUS
+
+from wuwa_mcp_server.core.config import get_settings
+
+_STRATEGY_LINK = re.compile(r"/mc/item/(\d+)")
+
+# Syllables for synthetic text; only the size and markup shape matter
+_TEXT = "共鸣者在战斗中造成伤害时获得效果提升攻击力暴击率伤害加成持续秒冷却时间能量回复协奏值声骸套装技能"
+_NAMES = ["今汐", "长离", "忌炎", "吟霖", "相里要", "守岸人", "椿", "珂莱塔", "洛可可", "菲比", "赞妮", "卡提希娅"]
+_ARTIFACTS = ["浮星祛暗", "沉日劫明", "隐世回光", "轻云出月", "啸谷长风", "凝夜白霜", "熔山裂谷", "彻空冥雷"]
+_SKILLS = ["常态攻击", "共鸣技能", "共鸣回路", "共鸣解放", "变奏技能", "延奏技能", "谐度破坏"]
+
+
+def _body(data: dict) -> str:
+    return json.dumps({"code": 200, "msg": "请求成功", "data": data, "success": True}, ensure_ascii=False)
+
+
+def _text(rng: random.Random, low: int, high: int) -> str:
+    return "".join(rng.choice(_TEXT) for _ in range(rng.randint(low, high)))
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    parts = []
+    for _ in range(count):
+        style = rng.random()
+        if style < 0.3:
+            parts.append(f"<p>{_text(rng, 10, 40)}<strong>{_text(rng, 2, 6)}</strong>{_text(rng, 10, 60)}</p>")
+        elif style < 0.5:
+            parts.append(f'<p><span style="color: #f5a623;">{_text(rng, 4, 10)}</span>{_text(rng, 20, 80)}</p>')
+        elif style < 0.6:
+            items = "".join(f"<li>{_text(rng, 8, 30)}</li>" for _ in range(rng.randint(2, 5)))
+            parts.append(f"<ul>{items}</ul>")
+        else:
+            parts.append(f"<p>{_text(rng, 30, 120)}</p>")
+    return "".join(parts)
+
+
+def _table(rng: random.Random, header: list[str], rows: int, cell=None) -> str:
+    head = "".join(f"<th>{title}</th>" for title in header)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{cell(rng, row, col) if cell else _text(rng, 2, 12)}</td>" for col in header) + "</tr>"
+        for row in range(rows)
+    )
+    return f'<table class="table"><tbody><tr>{head}</tr>{body}</tbody></table>'
+
+
+def _level_table(rng: random.Random) -> str:
+    levels = [f"Lv{level}" for level in range(1, rng.choice((10, 10, 15)) + 1)]
+    rows = rng.randint(3, 8)
+    return _table(
+        rng,
+        ["属性", *levels],
+        rows,
+        lambda rng, row, col: _text(rng, 3, 6) if col == "属性" else f"{rng.uniform(10, 400):.2f}%*{rng.randint(1, 4)}",
+    )
+
+
+def _character_page(rng: random.Random, name: str, strategy_id: str) -> dict:
+    skills = [
+        {"title": skill, "content": _paragraphs(rng, rng.randint(3, 9)) + _level_table(rng)}
+        for skill in _SKILLS[: rng.randint(5, len(_SKILLS))]
+    ]
+    stories = [{"title": f"角色故事·{index}", "content": _paragraphs(rng, rng.randint(4, 10))} for index in range(1, 6)]
+    voices = [
+        {"title": f"语音·{_text(rng, 2, 4)}", "content": _paragraphs(rng, rng.randint(1, 3))}
+        for _ in range(rng.randint(8, 16))
+    ]
+    return {
+        "title": name,
+        "modules": [
+            {
+                "title": "基础资料",
+                "components": [
+                    {
+                        "title": "角色",
+                        "role": {
+                            "title": name,
+                            "subtitle": _text(rng, 4, 10),
+                            "info": [{"text": f"{_text(rng, 2, 3)}: {_text(rng, 2, 8)}"} for _ in range(8)],
+                        },
+                    }
+                ],
+            },
+            {
+                "title": "角色养成",
+                "components": [
+                    {"title": "技能介绍", "tabs": skills},
+                    {"title": "共鸣链", "content": _table(rng, ["序号", "名称", "效果"], 6)},
+                    {"title": "突破材料", "content": _table(rng, ["等级", "材料", "数量"], rng.randint(5, 7))},
+                    {"title": "技能升级材料", "content": _table(rng, ["等级", "材料", "数量"], 9)},
+                ],
+            },
+            {
+                "title": "角色攻略",
+                "components": [
+                    {
+                        "title": "攻略",
+                        "content": f'<p><a href="https://wiki.kurobbs.com/mc/item/{strategy_id}">{name}攻略</a></p>',
+                    }
+                ],
+            },
+            {
+                "title": "角色档案",
+                "components": [
+                    {"title": "角色资料", "content": _table(rng, ["项目", "内容"], rng.randint(6, 10))},
+                    {"title": "角色故事", "tabs": stories},
+                    {"title": "角色语音", "tabs": voices},
+                ],
+            },
+        ],
+    }
+
+
+def _strategy_page(rng: random.Random, name: str) -> dict:
+    teams = [
+        {
+            "title": f"配队{index}",
+            "content": _paragraphs(rng, rng.randint(2, 5)) + _table(rng, ["位置", "角色", "说明"], 3),
+        }
+        for index in range(1, rng.randint(3, 5))
+    ]
+    rotation = "".join(f"<li>{_text(rng, 10, 30)}</li>" for _ in range(rng.randint(5, 12)))
+    return {
+        "title": f"{name}攻略",
+        "modules": [
+            {"title": "角色定位", "components": [{"title": "定位", "content": _paragraphs(rng, rng.randint(3, 6))}]},
+            {
+                "title": "武器推荐",
+                "components": [{"title": "武器", "content": _table(rng, ["武器", "评价", "说明"], rng.randint(4, 8))}],
+            },
+            {
+                "title": "声骸推荐",
+                "components": [
+                    {"title": "套装", "content": _table(rng, ["套装", "主词条", "副词条"], rng.randint(2, 4))},
+                    {"title": "说明", "content": _paragraphs(rng, rng.randint(2, 5))},
+                ],
+            },
+            {"title": "配队推荐", "components": [{"title": "配队", "tabs": teams}]},
+            {
+                "title": "输出手法",
+                "components": [
+                    {"title": "手法", "content": f"<ol>{rotation}</ol>" + _paragraphs(rng, rng.randint(2, 6))}
+                ],
+            },
+        ],
+    }
+
+
+def _artifact_page(rng: random.Random, name: str) -> dict:
+    return {
+        "title": name,
+        "modules": [
+            {
+                "title": "声骸数据",
+                "components": [
+                    {"title": "套装效果", "content": _table(rng, ["件数", "套装效果"], 2)},
+                    {"title": "声骸列表", "content": _table(rng, ["声骸", "COST", "获取方式"], rng.randint(6, 14))},
+                    {"title": "获取方式", "content": _paragraphs(rng, rng.randint(1, 3))},
+                ],
+            }
+        ],
+    }
+
+
+def synthetic_corpus(characters: int, artifacts: int, seed: int) -> dict:
+    """Build a deterministic corpus shaped like the Kuro API responses."""
+    rng = random.Random(seed)
+    api = get_settings().api
+    character_records, artifact_records, entries = [], [], {}
+
+    for index in range(characters):
+        name = _NAMES[index] if index < len(_NAMES) else f"共鸣者{index:03d}"
+        entry_id, strategy_id = str(1000 + index), str(5000 + index)
+        character_records.append(
+            {"id": 100 + index, "name": name, "content": {"linkId": entry_id, "contentUrl": f"/mc/item/{entry_id}"}}
+        )
+        entries[entry_id] = _body({"id": entry_id, "content": _character_page(rng, name, strategy_id)})
+        entries[strategy_id] = _body({"id": strategy_id, "content": _strategy_page(rng, name)})
+
+    for index in range(artifacts):
+        name = _ARTIFACTS[index] if index < len(_ARTIFACTS) else f"声骸套装{index:03d}"
+        entry_id = str(3000 + index)
+        artifact_records.append(
+            {"id": 300 + index, "name": name, "content": {"linkId": entry_id, "contentUrl": f"/mc/item/{entry_id}"}}
+        )
+        entries[entry_id] = _body({"id": entry_id, "content": _artifact_page(rng, name)})
+
+    return {
+        "version": 1,
+        "source": "synthetic",
+        "recorded_at": "",
+        "pages": {
+            api.character_catalogue_id: _body({"results": {"records": character_records}}),
+            api.artifacts_catalogue_id: _body({"results": {"records": artifact_records}}),
+        },
+        "entries": entries,
+    }
+
+
+async def live_corpus(characters: int, artifacts: int) -> dict:
+    """Record raw response bodies from the configured Kuro API."""
+    settings = get_settings()
+    api = settings.api
+    pages, entries = {}, {}
+
+    async with httpx.AsyncClient(headers=settings.get_http_headers(), timeout=api.timeout) as client:
+
+        async def post(endpoint: str, data: dict) -> str:
+            response = await client.post(f"{api.base_url}{endpoint}", data=data)
+            response.raise_for_status()
+            return response.text
+
+        for catalogue_id in (api.character_catalogue_id, api.artifacts_catalogue_id):
+            form = {"catalogueId": catalogue_id, "page": api.default_page, "limit": api.default_limit}
+            pages[catalogue_id] = await post("/getPage", form)
+
+        character_records = json.loads(pages[api.character_catalogue_id])["data"]["results"]["records"]
+        artifact_records = json.loads(pages[api.artifacts_catalogue_id])["data"]["results"]["records"]
+
+        for record in character_records[:characters]:
+            entry_id = str(record["content"]["linkId"])
+            entries[entry_id] = await post("/getEntryDetail", {"id": entry_id})
+            # Follow the strategy link the way CharacterService does
+            strategy = _STRATEGY_LINK.search(entries[entry_id])
+            if strategy and strategy.group(1) not in entries:
+                entries[strategy.group(1)] = await post("/getEntryDetail", {"id": strategy.group(1)})
+            print(f"recorded {record['name']} ({len(entries)} entries)")
+
+        for record in artifact_records[:artifacts]:
+            entry_id = str(record["content"]["linkId"])
+            entries[entry_id] = await post("/getEntryDetail", {"id": entry_id})
+            print(f"recorded {record['name']} ({len(entries)} entries)")
+
+    return {
+        "version": 1,
+        "source": "live",
+        "recorded_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "pages": pages,
+        "entries": entries,
+    }
+
+
+def main() -> None:
+    """Record or synthesize the corpus and write it gzipped."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--live", action="store_true", help="record from the configured Kuro API")
+    mode.add_argument("--synthetic", action="store_true", help="generate a deterministic offline corpus")
+    parser.add_argument("--characters", type=int, default=24)
+    parser.add_argument("--artifacts", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=20240523)
+    parser.add_argument("--output", type=Path, default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+
+    if args.live:
+        document = asyncio.run(live_corpus(args.characters, args.artifacts))
+    else:
+        document = synthetic_corpus(args.characters, args.artifacts, args.seed)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    raw = json.dumps(document, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    # mtime=0 keeps the file byte-identical across runs with the same input
+    with open(args.output, "wb") as f:
+        f.write(gzip.compress(raw, compresslevel=9, mtime=0))
+    print(f"{args.output}: {len(document['entries'])} entries, {len(raw)} bytes raw")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""JSON decoding of the benchmark corpus response bodies, per installed decoder."""
+
+import pytest
+
+from wuwa_mcp_server.core.config import get_settings
+from wuwa_mcp_server.infrastructure.api.json_decoding import available_decoders
+
+DECODERS = available_decoders()
+
+
+def _body(corpus, payload: str) -> bytes:
+    if payload == "getPage":
+        return corpus.pages[get_settings().api.character_catalogue_id].encode("utf-8")
+    bodies = sorted(corpus.entries.values(), key=len)
+    return (bodies[len(bodies) // 2] if payload == "getEntryDetail-median" else bodies[-1]).encode("utf-8")
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+@pytest.mark.parametrize("payload", ["getPage", "getEntryDetail-median", "getEntryDetail-max"])
+def bench_decode(benchmark, corpus, payload, decoder):
+    body = _body(corpus, payload)
+    assert DECODERS[decoder](body) == DECODERS["json"](body)
+    benchmark.extra_info["body_bytes"] = len(body)
+    benchmark(DECODERS[decoder], body)
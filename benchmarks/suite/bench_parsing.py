@@ -0,0 +1,57 @@
+"""HTML conversion and content parsing strategies."""
+
+import pytest
+
+from wuwa_mcp_server.parsers import ArtifactStrategy
+from wuwa_mcp_server.parsers import CharacterDataStrategy
+from wuwa_mcp_server.parsers import CharacterProfileStrategy
+from wuwa_mcp_server.parsers import HTMLToMarkdownConverter
+from wuwa_mcp_server.parsers import StrategyBasedContentParser
+from wuwa_mcp_server.parsers import StrategyContentStrategy
+from wuwa_mcp_server.parsers.strategies.character_strategy import CharacterDevelopmentStrategy
+
+# Fragment size by percentile of all component and tab fragments in the corpus
+FRAGMENT_PERCENTILES = {"p25": 0.25, "p50": 0.5, "p90": 0.9, "max": 1.0}
+
+STRATEGIES = {
+    CharacterDataStrategy: "character",
+    CharacterDevelopmentStrategy: "character",
+    CharacterProfileStrategy: "character",
+    StrategyContentStrategy: "strategy",
+    ArtifactStrategy: "artifact",
+}
+
+
+@pytest.fixture(scope="module")
+def converter() -> HTMLToMarkdownConverter:
+    return HTMLToMarkdownConverter()
+
+
+def _fragment(corpus, size: str) -> str:
+    fragments = corpus.html_fragments()
+    return fragments[min(len(fragments) - 1, int(len(fragments) * FRAGMENT_PERCENTILES[size]))]
+
+
+@pytest.mark.parametrize("size", FRAGMENT_PERCENTILES)
+def bench_html_convert(benchmark, corpus, converter, size):
+    html = _fragment(corpus, size)
+    benchmark.extra_info["html_bytes"] = len(html.encode("utf-8"))
+    benchmark(converter.convert, html)
+
+
+@pytest.mark.parametrize("size", FRAGMENT_PERCENTILES)
+def bench_parse_html_content(benchmark, corpus, converter, size):
+    html = _fragment(corpus, size)
+    benchmark.extra_info["html_bytes"] = len(html.encode("utf-8"))
+    benchmark(converter.parse_html_content, html)
+
+
+@pytest.mark.parametrize("strategy_class", STRATEGIES, ids=lambda cls: cls.__name__)
+def bench_strategy_parse(benchmark, corpus, converter, strategy_class):
+    page = corpus.representative_page(STRATEGIES[strategy_class])
+    benchmark(strategy_class(converter).parse, page)
+
+
+def bench_parse_main_content(benchmark, corpus, converter):
+    page = corpus.representative_page("character")
+    benchmark(StrategyBasedContentParser(converter).parse_main_content, page)
@@ -0,0 +1,46 @@
+"""Markdown and JSON rendering of already parsed pages."""
+
+import pytest
+
+from wuwa_mcp_server.parsers import StrategyBasedContentParser
+from wuwa_mcp_server.services import JSONService
+from wuwa_mcp_server.services import MarkdownService
+
+
+@pytest.fixture(scope="module")
+def parsed(corpus) -> dict[str, dict]:
+    parser = StrategyBasedContentParser()
+    return {
+        "character": parser.parse_main_content(corpus.representative_page("character")),
+        "profile": parser.parse_character_profile(corpus.representative_page("character")),
+        "strategy": parser.parse_strategy_content(corpus.representative_page("strategy")),
+        "artifact": parser.parse_artifact_content(corpus.representative_page("artifact")),
+    }
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["markdown", "compact"])
+def bench_character_markdown(benchmark, parsed, compact):
+    benchmark(MarkdownService().generate_character_markdown, parsed["character"], True, compact)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["markdown", "compact"])
+def bench_profile_markdown(benchmark, parsed, compact):
+    benchmark(MarkdownService().generate_character_markdown, parsed["profile"], False, compact)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["markdown", "compact"])
+def bench_strategy_markdown(benchmark, parsed, compact):
+    benchmark(MarkdownService().generate_strategy_markdown, parsed["strategy"], compact)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["markdown", "compact"])
+def bench_artifact_markdown(benchmark, parsed, compact):
+    benchmark(MarkdownService().generate_artifact_markdown, parsed["artifact"], compact)
+
+
+def bench_character_json(benchmark, parsed):
+    benchmark(JSONService().generate_character_json, parsed["character"], parsed["strategy"], "5000")
+
+
+def bench_artifact_json(benchmark, parsed):
+    benchmark(JSONService().generate_artifact_json, parsed["artifact"])
@@ -0,0 +1,58 @@
+"""End-to-end service calls against the benchmark corpus.
+
+Each call goes through the real HTTP client, whose transport answers from the
+corpus, so lookup, fetch, JSON decoding, parsing and rendering are all
+measured. Entry caching is disabled; the catalogues stay cached as in a
+running server.
+"""
+
+import asyncio
+
+import pytest
+
+from wuwa_mcp_server.core.config import ApplicationSettings
+from wuwa_mcp_server.core.container import DIContainer
+from wuwa_mcp_server.infrastructure.api.http_client import HTTPClient
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def container(corpus, loop):
+    settings = ApplicationSettings()
+    settings.cache.entry_ttl = 0
+    container = DIContainer(settings)
+    container._singletons["http_client"] = HTTPClient(
+        api_settings=settings.api,
+        http_settings=settings.http_client,
+        enable_circuit_breaker=True,
+        transport=corpus.transport(),
+    )
+    loop.run_until_complete(container.startup(warm_up=True))
+    yield container
+    loop.run_until_complete(container.cleanup())
+
+
+@pytest.mark.parametrize("output_format", ["markdown", "compact", "json"])
+def bench_get_character_info(benchmark, loop, container, character_name, output_format):
+    service = container.get_character_service()
+    result = benchmark(lambda: loop.run_until_complete(service.get_character_info(character_name, output_format)))
+    benchmark.extra_info["output_bytes"] = len(result.encode("utf-8"))
+
+
+def bench_get_character_profile(benchmark, loop, container, character_name):
+    service = container.get_character_service()
+    result = benchmark(lambda: loop.run_until_complete(service.get_character_profile(character_name)))
+    benchmark.extra_info["output_bytes"] = len(result.encode("utf-8"))
+
+
+@pytest.mark.parametrize("output_format", ["markdown", "json"])
+def bench_get_artifact_info(benchmark, loop, container, artifact_name, output_format):
+    service = container.get_artifact_service()
+    result = benchmark(lambda: loop.run_until_complete(service.get_artifact_info(artifact_name, output_format)))
+    benchmark.extra_info["output_bytes"] = len(result.encode("utf-8"))
@@ -0,0 +1,48 @@
+"""Shared fixtures for the offline benchmark suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# corpus.py lives one level up, next to the standalone benchmark scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from corpus import DEFAULT_CORPUS
+from corpus import Corpus
+
+from wuwa_mcp_server.core.config import get_settings
+
+
+def pytest_addoption(parser):
+    parser.addoption("--corpus", default=None, help="corpus file written by record_fixtures.py")
+
+
+def pytest_report_header(config):
+    corpus = Corpus.load(config.getoption("--corpus") or DEFAULT_CORPUS)
+    origin = " ".join(part for part in (corpus.source, corpus.recorded_at) if part)
+    header = f"corpus: {origin}, {len(corpus.entries)} entries"
+    if corpus.source == "synthetic":
+        header += " (generated pages: timings do not reflect real upstream payloads)"
+    return header
+
+
+@pytest.fixture(scope="session")
+def corpus(pytestconfig) -> Corpus:
+    return Corpus.load(pytestconfig.getoption("--corpus") or DEFAULT_CORPUS)
+
+
+@pytest.fixture(scope="session")
+def character_name(corpus: Corpus) -> str:
+    """The character with the median-size detail page."""
+    catalogue_id = get_settings().api.character_catalogue_id
+    names = sorted(corpus.character_names, key=lambda name: len(corpus.entries[corpus.entry_id(catalogue_id, name)]))
+    return names[len(names) // 2]
+
+
+@pytest.fixture(scope="session")
+def artifact_name(corpus: Corpus) -> str:
+    """The artifact set with the median-size detail page."""
+    catalogue_id = get_settings().api.artifacts_catalogue_id
+    names = sorted(corpus.artifact_names, key=lambda name: len(corpus.entries[corpus.entry_id(catalogue_id, name)]))
+    return names[len(names) // 2]
@@ -114,7 +114,7 @@ class MarkdownBuilder(LoggerMixin):
                 self.current_content.append(formatted_table)
                 self.current_content.append("")  # Add blank line
         except Exception as e:
-            self.logger.error(f"Failed to format table: {e}")
+            self.logger.error("Failed to format table: %s", e)
             raise MarkdownGenerationException(f"Table formatting failed: {e}")
 
         return self
@@ -129,7 +129,7 @@ class MarkdownBuilder(LoggerMixin):
             table_data = TableData(headers=headers, rows=rows)
             return self.add_table(table_data)
         except ValueError as e:
-            self.logger.error(f"Invalid table data: {e}")
+            self.logger.error("Invalid table data: %s", e)
             raise MarkdownGenerationException(f"Invalid table data: {e}")
 
     def add_link(self, text: str, url: str) -> "MarkdownBuilder":
@@ -242,7 +242,7 @@ class LegacyMarkdownConverter(LoggerMixin):
             return self.builder.build_as_string()
 
         except Exception as e:
-            self.logger.error(f"Failed to convert legacy data: {e}")
+            self.logger.error("Failed to convert legacy data: %s", e)
             raise MarkdownGenerationException(f"Legacy conversion failed: {e}")
 
     def _process_module(self, module_title: str, module_data: dict[str, Any]) -> None:
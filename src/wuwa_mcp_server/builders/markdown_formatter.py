@@ -149,7 +149,7 @@ class TableFormatter(BaseFormatter):
         # Format data rows
         for row in rows:
             if len(row) != len(headers):
-                self.logger.warning(f"Row has {len(row)} columns, expected {len(headers)}. Skipping row.")
+                self.logger.warning("Row has %s columns, expected %s. Skipping row.", len(row), len(headers))
                 continue
 
             row_formatted = "| " + " | ".join(self._clean_cell(cell) for cell in row) + " |"
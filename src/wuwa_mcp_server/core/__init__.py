@@ -1,5 +1,6 @@
 """Core infrastructure components."""
 
+from .admission import AdmissionController
 from .config import ApplicationSettings
 from .container import DIContainer
 from .container import get_container
@@ -7,6 +8,7 @@ from .container import reset_container
 from .exceptions import APIException
 from .exceptions import DataNotFoundException
 from .exceptions import ParsingException
+from .exceptions import ServerBusyException
 from .exceptions import ServiceException
 from .exceptions import ValidationException
 from .exceptions import WuWaException
@@ -16,6 +18,7 @@ from .interfaces import CharacterRepositoryProtocol
 from .interfaces import CharacterServiceProtocol
 from .interfaces import HTTPClientProtocol
 from .interfaces import MarkdownServiceProtocol
+from .lifecycle import InFlightTracker
 from .logging_config import LoggerMixin
 from .logging_config import setup_logging
 
@@ -30,6 +33,7 @@ __all__ = [
     "WuWaException",
     "APIException",
     "ServiceException",
+    "ServerBusyException",
     "DataNotFoundException",
     "ValidationException",
     "ParsingException",
@@ -40,6 +44,9 @@ __all__ = [
     "CharacterServiceProtocol",
     "ArtifactServiceProtocol",
     "MarkdownServiceProtocol",
+    # Lifecycle
+    "AdmissionController",
+    "InFlightTracker",
     # Logging
     "LoggerMixin",
     "setup_logging",
@@ -0,0 +1,137 @@
+"""Admission control for tool calls."""
+
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .config import AdmissionSettings
+from .exceptions import ServerBusyException
+from .logging_config import LoggerMixin
+from .metrics import ADMISSION_DECISIONS
+from .metrics import ADMISSION_WAIT
+
+
+class AdmissionController(LoggerMixin):
+    """Global concurrency limiter with a bounded wait queue.
+
+    Up to ``max_concurrency`` calls run at once; up to ``max_queue`` more wait
+    in FIFO order. When the queue is full, or a queued call waits longer than
+    ``queue_timeout``, the call is rejected at once with ServerBusyException
+    carrying a retry-after estimate, instead of piling more fetches and parse
+    threads onto an overloaded process.
+    """
+
+    # Weight of the latest call in the moving average of call durations
+    _EWMA_ALPHA = 0.2
+
+    def __init__(self, settings: AdmissionSettings | None = None):
+        """Initialize admission controller.
+
+        Args:
+            settings: Admission settings. Creates default if None.
+        """
+        self.settings = settings or AdmissionSettings()
+        self.enabled = self.settings.max_concurrency > 0
+        self._semaphore = asyncio.Semaphore(max(1, self.settings.max_concurrency))
+
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._avg_call_seconds = 1.0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a call slot for the duration of the context.
+
+        Raises:
+            ServerBusyException: If the wait queue is full or the wait timed out.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        await self._acquire()
+        started = time.monotonic()
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+            elapsed = time.monotonic() - started
+            self._avg_call_seconds += self._EWMA_ALPHA * (elapsed - self._avg_call_seconds)
+
+    def retry_after(self) -> int:
+        """Estimate seconds until a new call would be admitted.
+
+        Returns:
+            Whole seconds, at least 1.
+        """
+        backlog = self.queue_depth + 1
+        return max(1, math.ceil(backlog * self._avg_call_seconds / max(1, self.settings.max_concurrency)))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return current admission metrics.
+
+        Returns:
+            In-flight calls, queue depth, totals and wait times.
+        """
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_concurrency": self.settings.max_concurrency,
+            "max_queue": self.settings.max_queue,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+            "avg_call_seconds": self._avg_call_seconds,
+        }
+
+    async def _acquire(self) -> None:
+        """Take a slot, queueing if necessary, or raise ServerBusyException."""
+        if not self._semaphore.locked() and self.queue_depth == 0:
+            await self._semaphore.acquire()
+            self.admitted_total += 1
+            ADMISSION_DECISIONS.labels("admitted").inc()
+            ADMISSION_WAIT.observe(0.0)
+            return
+
+        if self.queue_depth >= self.settings.max_queue:
+            self._reject("queue full")
+
+        self.queue_depth += 1
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.settings.queue_timeout)
+        except TimeoutError:
+            self._reject("queue wait timed out")
+        finally:
+            self.queue_depth -= 1
+            waited = time.monotonic() - started
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+        self.admitted_total += 1
+        ADMISSION_DECISIONS.labels("admitted").inc()
+        ADMISSION_WAIT.observe(waited)
+
+    def _reject(self, reason: str) -> None:
+        """Record a rejection and raise ServerBusyException."""
+        self.rejected_total += 1
+        ADMISSION_DECISIONS.labels("rejected").inc()
+        retry_after = self.retry_after()
+        self.logger.warning(
+            "Rejecting tool call (%s): %s in flight, %s queued, retry after %ss",
+            reason,
+            self.in_flight,
+            self.queue_depth,
+            retry_after,
+        )
+        raise ServerBusyException(retry_after, self.queue_depth)
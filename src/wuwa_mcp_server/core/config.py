@@ -1,6 +1,7 @@
 """Configuration management for WuWa MCP Server."""
 
 import os
+import tempfile
 
 
 class APISettings:
@@ -24,6 +25,19 @@ class ServerSettings:
         self.transport: str = os.getenv("TRANSPORT", "stdio")
         self.host: str = os.getenv("HOST", "0.0.0.0")
         self.port: int = int(os.getenv("PORT", "8081"))
+        self.http_path: str = os.getenv("MCP_HTTP_PATH", "/mcp")
+        self.stateless_http: bool = os.getenv("MCP_STATELESS_HTTP", "false").lower() == "true"
+        self.batch_max_concurrency: int = int(os.getenv("MCP_BATCH_MAX_CONCURRENCY", "4"))
+        self.batch_max_size: int = int(os.getenv("MCP_BATCH_MAX_SIZE", "32"))
+        self.shutdown_timeout: float = float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", "30.0"))
+        self.workers: int = int(os.getenv("WORKERS", "1"))
+        self.metrics: bool = os.getenv("MCP_METRICS", "true").lower() == "true"
+        self.etag: bool = os.getenv("MCP_ETAG", "true").lower() == "true"
+        # ETags need complete JSON responses, so they default to on together
+        self.json_response: bool = os.getenv("MCP_JSON_RESPONSE", str(self.etag)).lower() == "true"
+        self.compression: bool = os.getenv("MCP_COMPRESSION", "true").lower() == "true"
+        self.compression_min_size: int = int(os.getenv("MCP_COMPRESSION_MIN_SIZE", "1024"))
+        self.compression_cache_size: int = int(os.getenv("MCP_COMPRESSION_CACHE_SIZE", "64"))
 
 
 class LogSettings:
@@ -33,6 +47,8 @@ class LogSettings:
         self.level: str = os.getenv("LOG_LEVEL", "INFO")
         self.format: str = os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         self.disable_uvicorn_logs: bool = os.getenv("DISABLE_UVICORN_LOGS", "true").lower() == "true"
+        # One JSON object per line instead of the LOG_FORMAT text layout
+        self.json: bool = os.getenv("LOG_JSON", "false").lower() == "true"
 
 
 class HTTPClientSettings:
@@ -59,6 +75,92 @@ class HTTPClientSettings:
         self.retry_delay: float = float(os.getenv("HTTP_CLIENT_RETRY_DELAY", "1.0"))
         self.circuit_breaker_threshold: int = int(os.getenv("HTTP_CLIENT_CIRCUIT_BREAKER_THRESHOLD", "5"))
         self.circuit_breaker_timeout: float = float(os.getenv("HTTP_CLIENT_CIRCUIT_BREAKER_TIMEOUT", "60.0"))
+        self.max_connections: int = int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "10"))
+        self.max_keepalive_connections: int = int(os.getenv("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", "5"))
+        # Decoded responses remembered to skip decoding byte-identical ones (0 disables)
+        self.payload_memo_size: int = int(os.getenv("HTTP_CLIENT_PAYLOAD_MEMO_SIZE", "256"))
+        # "auto" (orjson, then msgspec, when installed), "orjson", "msgspec" or "json"
+        self.json_decoder: str = os.getenv("HTTP_CLIENT_JSON_DECODER", "auto").lower()
+
+
+class CacheSettings:
+    """Cache related settings."""
+
+    def __init__(self):
+        self.catalogue_ttl: float = float(os.getenv("CACHE_CATALOGUE_TTL", "3600.0"))
+        self.warm_up: bool = os.getenv("CACHE_WARM_UP", "false").lower() == "true"
+        # "memory" (per process) or "sqlite" (shared by all workers using the same file)
+        self.backend: str = os.getenv("CACHE_BACKEND", "memory").lower()
+        self.sqlite_path: str = os.getenv(
+            "CACHE_SQLITE_PATH", os.path.join(tempfile.gettempdir(), "wuwa-mcp-cache.sqlite3")
+        )
+        self.entry_ttl: float = float(os.getenv("CACHE_ENTRY_TTL", "3600.0"))
+        self.max_entries: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+        # Snapshot of catalogues and cached entries restored at startup (empty disables)
+        self.snapshot_path: str = os.getenv("CACHE_SNAPSHOT_PATH", "")
+        # Seconds between snapshot writes; one is always written at shutdown (0 writes only then)
+        self.snapshot_interval: float = float(os.getenv("CACHE_SNAPSHOT_INTERVAL", "300.0"))
+        # Rendered outputs remembered per unchanged source entry (0 disables)
+        self.memo_max_entries: int = int(os.getenv("CACHE_MEMO_MAX_ENTRIES", "256"))
+
+
+class MirrorSettings:
+    """Offline mirror settings."""
+
+    def __init__(self):
+        # Directory of the local content store written by `wuwa-mcp-server sync`
+        self.path: str = os.getenv("MIRROR_PATH", "")
+        # Serve only from the mirror and never contact the Kuro API
+        self.offline: bool = os.getenv("MIRROR_OFFLINE", "false").lower() == "true"
+        self.sync_concurrency: int = int(os.getenv("MIRROR_SYNC_CONCURRENCY", "4"))
+
+
+class AdmissionSettings:
+    """Admission control settings for tool calls."""
+
+    def __init__(self):
+        # 0 disables admission control
+        self.max_concurrency: int = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "8"))
+        self.max_queue: int = int(os.getenv("ADMISSION_MAX_QUEUE", "32"))
+        self.queue_timeout: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "10.0"))
+
+
+class TracingSettings:
+    """In-process tracing settings."""
+
+    def __init__(self):
+        self.enabled: bool = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+        # Number of recent traces kept in memory
+        self.buffer_size: int = int(os.getenv("TRACING_BUFFER_SIZE", "100"))
+        self.max_spans_per_trace: int = int(os.getenv("TRACING_MAX_SPANS_PER_TRACE", "1000"))
+        # Append every finished trace to this file as OTLP/JSON lines (empty disables)
+        self.otlp_file: str = os.getenv("TRACING_OTLP_FILE", "")
+
+
+class ProfilingSettings:
+    """Sampled per-call profiling settings."""
+
+    def __init__(self):
+        # Percentage of tool calls run under cProfile (0 disables profiling)
+        self.sample_percent: float = float(os.getenv("PROFILING_SAMPLE_PERCENT", "0"))
+        self.output_dir: str = os.getenv(
+            "PROFILING_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "wuwa-mcp-profiles")
+        )
+        # Oldest profiles are deleted beyond this count (0 keeps all)
+        self.max_files: int = int(os.getenv("PROFILING_MAX_FILES", "200"))
+        # Expose /profiling in HTTP mode to inspect and change the sample rate at runtime
+        self.admin_route: bool = os.getenv("PROFILING_ADMIN_ROUTE", "false").lower() == "true"
+
+
+class PaginationSettings:
+    """Tool output pagination related settings."""
+
+    def __init__(self):
+        # 0 disables the corresponding budget; when both are set the stricter one wins
+        self.page_max_bytes: int = int(os.getenv("PAGINATION_PAGE_MAX_BYTES", "0"))
+        self.page_max_tokens: int = int(os.getenv("PAGINATION_PAGE_MAX_TOKENS", "0"))
+        self.cache_ttl: float = float(os.getenv("PAGINATION_CACHE_TTL", "600.0"))
+        self.cache_max_entries: int = int(os.getenv("PAGINATION_CACHE_MAX_ENTRIES", "128"))
 
 
 class ApplicationSettings:
@@ -75,6 +177,12 @@ class ApplicationSettings:
         self.server: ServerSettings = ServerSettings()
         self.logging: LogSettings = LogSettings()
         self.http_client: HTTPClientSettings = HTTPClientSettings()
+        self.pagination: PaginationSettings = PaginationSettings()
+        self.cache: CacheSettings = CacheSettings()
+        self.mirror: MirrorSettings = MirrorSettings()
+        self.admission: AdmissionSettings = AdmissionSettings()
+        self.tracing: TracingSettings = TracingSettings()
+        self.profiling: ProfilingSettings = ProfilingSettings()
 
     def get_http_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests."""
@@ -1,20 +1,56 @@
 """Dependency injection container for managing component dependencies."""
 
+import asyncio
+import contextlib
+import importlib
+from typing import TYPE_CHECKING
 from typing import Any
 
-from ..builders.markdown_builder import MarkdownBuilder
-from ..infrastructure.api.http_client import HTTPClient
-from ..infrastructure.api.kuro_api_client import KuroAPIClient
-from ..infrastructure.repositories.artifact_repository import ArtifactRepository
-from ..infrastructure.repositories.character_repository import CharacterRepository
-from ..parsers.content_parser import StrategyBasedContentParser
-from ..parsers.html_converter import HTMLToMarkdownConverter
-from ..services.artifact_service import ArtifactService
-from ..services.character_service import CharacterService
-from ..services.markdown_service import MarkdownService
+from .admission import AdmissionController
 from .config import ApplicationSettings
+from .exceptions import ConfigurationException
+from .lifecycle import InFlightTracker
 from .logging_config import LoggerMixin
 
+# Components are imported by the getters that build them. Importing the
+# container (and with it the core package) then stays cheap, which keeps
+# process start fast, and does not import the services, parsers and
+# repositories that in turn import the core package.
+if TYPE_CHECKING:
+    from ..builders.markdown_builder import MarkdownBuilder
+    from ..infrastructure.api.http_client import HTTPClient
+    from ..infrastructure.api.kuro_api_client import KuroAPIClient
+    from ..infrastructure.cache import CacheBackend
+    from ..infrastructure.cache import IdentityMemo
+    from ..infrastructure.cache import SnapshotStore
+    from ..infrastructure.mirror import MirrorAPIClient
+    from ..infrastructure.mirror import MirrorStore
+    from ..infrastructure.repositories.artifact_repository import ArtifactRepository
+    from ..infrastructure.repositories.character_repository import CharacterRepository
+    from ..parsers.content_parser import StrategyBasedContentParser
+    from ..parsers.html_converter import HTMLToMarkdownConverter
+    from ..services.artifact_service import ArtifactService
+    from ..services.character_service import CharacterService
+    from ..services.json_service import JSONService
+    from ..services.markdown_service import MarkdownService
+    from ..services.mirror_sync_service import MirrorSyncService
+    from ..services.pagination_service import PaginationService
+
+# Modules startup() loads before building the components
+_COMPONENT_MODULES = (
+    "..infrastructure.api",
+    "..infrastructure.cache",
+    "..infrastructure.mirror",
+    "..infrastructure.repositories",
+    "..parsers",
+    "..services",
+)
+
+
+def _import_components() -> None:
+    for name in _COMPONENT_MODULES:
+        importlib.import_module(name, __package__)
+
 
 class DIContainer(LoggerMixin):
     """Dependency injection container for managing object dependencies."""
@@ -28,8 +64,36 @@ class DIContainer(LoggerMixin):
         self.settings = settings or ApplicationSettings()
         self._instances: dict[str, Any] = {}
         self._singletons: dict[str, Any] = {}
+        self._started = False
+        self._warm_up_done = False
+        self._warm_up_task: asyncio.Task | None = None
+        self._snapshot_task: asyncio.Task | None = None
+        self._startup_lock = asyncio.Lock()
+        self.inflight = InFlightTracker()
         self.logger.info("Dependency injection container initialized")
 
+    @property
+    def is_started(self) -> bool:
+        """Check if startup() has completed."""
+        return self._started
+
+    @property
+    def is_warm(self) -> bool:
+        """Check if cache warm-up has finished (or was not requested)."""
+        return self._warm_up_done
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if the server should receive traffic.
+
+        Ready once startup and warm-up have completed, as long as the upstream
+        circuit breaker is not open.
+        """
+        if not (self._started and self._warm_up_done):
+            return False
+        breaker = self.get_http_client().circuit_breaker
+        return breaker is None or breaker.current_state != "open"
+
     def get_settings(self) -> ApplicationSettings:
         """Get application settings.
 
@@ -38,13 +102,15 @@ class DIContainer(LoggerMixin):
         """
         return self.settings
 
-    def get_http_client(self) -> HTTPClient:
+    def get_http_client(self) -> "HTTPClient":
         """Get HTTP client instance (singleton).
 
         Returns:
             HTTPClient instance.
         """
         if "http_client" not in self._singletons:
+            from ..infrastructure.api.http_client import HTTPClient
+
             self.logger.debug("Creating HTTP client instance")
             self._singletons["http_client"] = HTTPClient(
                 api_settings=self.settings.api,
@@ -53,111 +119,275 @@ class DIContainer(LoggerMixin):
             )
         return self._singletons["http_client"]
 
-    def get_kuro_api_client(self) -> KuroAPIClient:
+    def get_kuro_api_client(self) -> "KuroAPIClient | MirrorAPIClient":
         """Get Kuro API client instance (singleton).
 
         Returns:
-            KuroAPIClient instance.
+            KuroAPIClient instance, or MirrorAPIClient serving the local mirror in offline mode.
         """
         if "kuro_api_client" not in self._singletons:
-            self.logger.debug("Creating Kuro API client instance")
-            self._singletons["kuro_api_client"] = KuroAPIClient(
-                http_client=self.get_http_client(),
+            if self.settings.mirror.offline:
+                from ..infrastructure.mirror import MirrorAPIClient
+
+                self.logger.debug("Creating offline mirror API client instance")
+                self._singletons["kuro_api_client"] = MirrorAPIClient(store=self.get_mirror_store())
+            else:
+                from ..infrastructure.api.kuro_api_client import KuroAPIClient
+
+                self.logger.debug("Creating Kuro API client instance")
+                self._singletons["kuro_api_client"] = KuroAPIClient(
+                    http_client=self.get_http_client(),
+                    settings=self.settings.api,
+                )
+        return self._singletons["kuro_api_client"]
+
+    def get_mirror_store(self) -> "MirrorStore":
+        """Get the offline mirror content store (singleton).
+
+        Returns:
+            MirrorStore instance.
+
+        Raises:
+            ConfigurationException: If no mirror path is configured.
+        """
+        if "mirror_store" not in self._singletons:
+            from ..infrastructure.mirror import MirrorStore
+
+            if not self.settings.mirror.path:
+                raise ConfigurationException("MIRROR_PATH must be set to use the offline mirror")
+            self.logger.debug("Creating mirror store instance")
+            self._singletons["mirror_store"] = MirrorStore(self.settings.mirror.path)
+        return self._singletons["mirror_store"]
+
+    def get_mirror_sync_service(self) -> "MirrorSyncService":
+        """Get the mirror sync service instance (singleton).
+
+        Returns:
+            MirrorSyncService instance.
+        """
+        if "mirror_sync_service" not in self._singletons:
+            from ..infrastructure.api.kuro_api_client import KuroAPIClient
+            from ..services.mirror_sync_service import MirrorSyncService
+
+            self.logger.debug("Creating mirror sync service instance")
+            # Always the live API, also when the server itself runs offline
+            self._singletons["mirror_sync_service"] = MirrorSyncService(
+                api_client=KuroAPIClient(http_client=self.get_http_client(), settings=self.settings.api),
+                store=self.get_mirror_store(),
                 settings=self.settings.api,
+                concurrency=self.settings.mirror.sync_concurrency,
             )
-        return self._singletons["kuro_api_client"]
+        return self._singletons["mirror_sync_service"]
+
+    def get_cache_backend(self) -> "CacheBackend":
+        """Get the shared cache backend instance (singleton).
+
+        Returns:
+            CacheBackend selected by the cache settings.
+        """
+        if "cache_backend" not in self._singletons:
+            from ..infrastructure.cache import create_cache_backend
+
+            self.logger.debug("Creating %s cache backend instance", self.settings.cache.backend)
+            self._singletons["cache_backend"] = create_cache_backend(self.settings.cache)
+        return self._singletons["cache_backend"]
+
+    def get_render_memo(self) -> "IdentityMemo":
+        """Get the memo of rendered output per unchanged entry (singleton).
+
+        Returns:
+            IdentityMemo shared by the character and artifact services.
+        """
+        if "render_memo" not in self._singletons:
+            from ..infrastructure.cache import IdentityMemo
+
+            self._singletons["render_memo"] = IdentityMemo(self.settings.cache.memo_max_entries)
+        return self._singletons["render_memo"]
+
+    def get_snapshot_store(self) -> "SnapshotStore | None":
+        """Get the warm-start snapshot store (singleton).
+
+        Returns:
+            SnapshotStore instance, or None if no snapshot path is configured.
+        """
+        if not self.settings.cache.snapshot_path:
+            return None
+        if "snapshot_store" not in self._singletons:
+            from ..infrastructure.cache import SnapshotStore
+
+            self.logger.debug("Creating snapshot store instance")
+            api = self.settings.api
+            self._singletons["snapshot_store"] = SnapshotStore(
+                path=self.settings.cache.snapshot_path,
+                app_version=self.settings.version,
+                fingerprint=f"{api.base_url}|{api.character_catalogue_id}|{api.artifacts_catalogue_id}",
+            )
+        return self._singletons["snapshot_store"]
+
+    def get_admission_controller(self) -> AdmissionController:
+        """Get the admission controller for tool calls (singleton).
+
+        Returns:
+            AdmissionController instance.
+        """
+        if "admission_controller" not in self._singletons:
+            self.logger.debug("Creating admission controller instance")
+            self._singletons["admission_controller"] = AdmissionController(settings=self.settings.admission)
+        return self._singletons["admission_controller"]
 
-    def get_html_converter(self) -> HTMLToMarkdownConverter:
+    def get_html_converter(self) -> "HTMLToMarkdownConverter":
         """Get HTML converter instance (singleton).
 
         Returns:
             HTMLToMarkdownConverter instance.
         """
         if "html_converter" not in self._singletons:
+            from ..parsers.html_converter import HTMLToMarkdownConverter
+
             self.logger.debug("Creating HTML converter instance")
             self._singletons["html_converter"] = HTMLToMarkdownConverter()
         return self._singletons["html_converter"]
 
-    def get_content_parser(self) -> StrategyBasedContentParser:
+    def get_content_parser(self) -> "StrategyBasedContentParser":
         """Get content parser instance (singleton).
 
         Returns:
             StrategyBasedContentParser instance.
         """
         if "content_parser" not in self._singletons:
+            from ..parsers.content_parser import StrategyBasedContentParser
+
             self.logger.debug("Creating strategy-based content parser instance")
             self._singletons["content_parser"] = StrategyBasedContentParser(html_converter=self.get_html_converter())
         return self._singletons["content_parser"]
 
-    def get_markdown_builder(self) -> MarkdownBuilder:
+    def get_markdown_builder(self) -> "MarkdownBuilder":
         """Get markdown builder instance (new instance each time).
 
         Returns:
             MarkdownBuilder instance.
         """
+        from ..builders.markdown_builder import MarkdownBuilder
+
         self.logger.debug("Creating markdown builder instance")
         return MarkdownBuilder()
 
-    def get_character_repository(self) -> CharacterRepository:
+    def get_character_repository(self) -> "CharacterRepository":
         """Get character repository instance (singleton).
 
         Returns:
             CharacterRepository instance.
         """
         if "character_repository" not in self._singletons:
+            from ..infrastructure.repositories.character_repository import CharacterRepository
+
             self.logger.debug("Creating character repository instance")
-            self._singletons["character_repository"] = CharacterRepository(api_client=self.get_kuro_api_client())
+            self._singletons["character_repository"] = CharacterRepository(
+                api_client=self.get_kuro_api_client(),
+                catalogue_ttl=self.settings.cache.catalogue_ttl,
+                cache=self.get_cache_backend(),
+            )
         return self._singletons["character_repository"]
 
-    def get_artifact_repository(self) -> ArtifactRepository:
+    def get_artifact_repository(self) -> "ArtifactRepository":
         """Get artifact repository instance (singleton).
 
         Returns:
             ArtifactRepository instance.
         """
         if "artifact_repository" not in self._singletons:
+            from ..infrastructure.repositories.artifact_repository import ArtifactRepository
+
             self.logger.debug("Creating artifact repository instance")
-            self._singletons["artifact_repository"] = ArtifactRepository(api_client=self.get_kuro_api_client())
+            self._singletons["artifact_repository"] = ArtifactRepository(
+                api_client=self.get_kuro_api_client(),
+                catalogue_ttl=self.settings.cache.catalogue_ttl,
+                cache=self.get_cache_backend(),
+            )
         return self._singletons["artifact_repository"]
 
-    def get_markdown_service(self) -> MarkdownService:
+    def get_markdown_service(self) -> "MarkdownService":
         """Get markdown service instance (singleton).
 
         Returns:
             MarkdownService instance.
         """
         if "markdown_service" not in self._singletons:
+            from ..services.markdown_service import MarkdownService
+
             self.logger.debug("Creating markdown service instance")
             self._singletons["markdown_service"] = MarkdownService()
         return self._singletons["markdown_service"]
 
-    def get_character_service(self) -> CharacterService:
+    def get_json_service(self) -> "JSONService":
+        """Get JSON service instance (singleton).
+
+        Returns:
+            JSONService instance.
+        """
+        if "json_service" not in self._singletons:
+            from ..services.json_service import JSONService
+
+            self.logger.debug("Creating JSON service instance")
+            self._singletons["json_service"] = JSONService()
+        return self._singletons["json_service"]
+
+    def get_pagination_service(self) -> "PaginationService":
+        """Get pagination service instance (singleton).
+
+        Returns:
+            PaginationService instance.
+        """
+        if "pagination_service" not in self._singletons:
+            from ..services.pagination_service import PaginationService
+
+            self.logger.debug("Creating pagination service instance")
+            # Pages only need the shared backend when it is shared across processes;
+            # otherwise they keep their own LRU sized by the pagination settings
+            shared = self.settings.cache.backend != "memory"
+            self._singletons["pagination_service"] = PaginationService(
+                settings=self.settings.pagination,
+                cache=self.get_cache_backend() if shared else None,
+            )
+        return self._singletons["pagination_service"]
+
+    def get_character_service(self) -> "CharacterService":
         """Get character service instance (singleton).
 
         Returns:
             CharacterService instance.
         """
         if "character_service" not in self._singletons:
+            from ..services.character_service import CharacterService
+
             self.logger.debug("Creating character service instance")
             self._singletons["character_service"] = CharacterService(
                 character_repository=self.get_character_repository(),
                 content_parser=self.get_content_parser(),
                 markdown_service=self.get_markdown_service(),
+                json_service=self.get_json_service(),
+                cache=self.get_cache_backend(),
+                memo=self.get_render_memo(),
             )
         return self._singletons["character_service"]
 
-    def get_artifact_service(self) -> ArtifactService:
+    def get_artifact_service(self) -> "ArtifactService":
         """Get artifact service instance (singleton).
 
         Returns:
             ArtifactService instance.
         """
         if "artifact_service" not in self._singletons:
+            from ..services.artifact_service import ArtifactService
+
             self.logger.debug("Creating artifact service instance")
             self._singletons["artifact_service"] = ArtifactService(
                 artifact_repository=self.get_artifact_repository(),
                 content_parser=self.get_content_parser(),
                 markdown_service=self.get_markdown_service(),
+                json_service=self.get_json_service(),
+                cache=self.get_cache_backend(),
+                memo=self.get_render_memo(),
             )
         return self._singletons["artifact_service"]
 
@@ -169,7 +399,7 @@ class DIContainer(LoggerMixin):
             instance: Instance to register.
         """
         self._instances[name] = instance
-        self.logger.debug(f"Registered instance: {name}")
+        self.logger.debug("Registered instance: %s", name)
 
     def get_instance(self, name: str) -> Any:
         """Get a registered instance by name.
@@ -193,23 +423,205 @@ class DIContainer(LoggerMixin):
         self._singletons.clear()
         self._instances.clear()
 
+    async def startup(self, warm_up: bool | None = None, background: bool = False) -> None:
+        """Build services, open the HTTP connection pool and optionally warm caches.
+
+        Safe to call more than once; only the first call does any work.
+
+        Args:
+            warm_up: Pre-fetch the catalogues. Uses settings if None.
+            background: Run the warm-up as a background task instead of waiting
+                for it, so health probes are answered meanwhile. is_ready stays
+                False until it finishes.
+        """
+        async with self._startup_lock:
+            if self._started:
+                return
+
+            self.logger.info("Starting container resources")
+            # Load the component modules in a worker thread; the event loop keeps
+            # serving meanwhile (e.g. a stdio client's initialize request)
+            await asyncio.to_thread(_import_components)
+            await self.get_http_client().open()
+            self.get_character_service()
+            self.get_artifact_service()
+            self.get_pagination_service()
+            await self.restore_snapshot()
+
+            if warm_up if warm_up is not None else self.settings.cache.warm_up:
+                if background:
+                    self._warm_up_task = asyncio.create_task(self.warm_up())
+                else:
+                    await self.warm_up()
+            else:
+                self._warm_up_done = True
+
+            if self.get_snapshot_store() is not None and self.settings.cache.snapshot_interval > 0:
+                self._snapshot_task = asyncio.create_task(self._save_snapshots_periodically())
+
+            self._started = True
+            self.logger.info("Container startup completed")
+
+    async def warm_up(self) -> None:
+        """Pre-fetch the character and artifact catalogues.
+
+        Failures are logged rather than raised so an unreachable upstream does
+        not prevent the server from starting.
+        """
+        repositories = [self.get_character_repository(), self.get_artifact_repository()]
+        results = await asyncio.gather(*(repository.warm_up() for repository in repositories), return_exceptions=True)
+        for repository, result in zip(repositories, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.warning("Cache warm-up failed for %s: %s", repository.__class__.__name__, result)
+            else:
+                self.logger.info("Cache warm-up completed for %s", repository.__class__.__name__)
+        self._warm_up_done = True
+
+    async def restore_snapshot(self) -> bool:
+        """Adopt the catalogues and cached entries of the last snapshot.
+
+        Catalogues that are still fresh replace the first catalogue fetch, and
+        entries are decoded on first use. Failures are logged, not raised.
+
+        Returns:
+            True if a snapshot was restored.
+        """
+        store = self.get_snapshot_store()
+        if store is None:
+            return False
+        snapshot = await asyncio.to_thread(store.read)
+        if snapshot is None:
+            return False
+
+        restored = [
+            repository.catalogue_name
+            for repository in (self.get_character_repository(), self.get_artifact_repository())
+            if repository.catalogue_name in snapshot["catalogues"]
+            and repository.restore_catalogue(snapshot["catalogues"][repository.catalogue_name])
+        ]
+        entries = self.get_cache_backend().import_entries(snapshot["entries"])
+        self.logger.info(
+            "Restored snapshot from %.0fs ago: catalogues %s, %s cached entries",
+            snapshot["age"],
+            restored or "none",
+            entries,
+        )
+        return True
+
+    async def save_snapshot(self) -> None:
+        """Write the catalogues and cached entries to the snapshot file.
+
+        Failures are logged, not raised.
+        """
+        store = self.get_snapshot_store()
+        if store is None:
+            return
+        catalogues = {}
+        for repository in (self.get_character_repository(), self.get_artifact_repository()):
+            catalogue = repository.export_catalogue()
+            if catalogue is not None:
+                catalogues[repository.catalogue_name] = catalogue
+        # Taken on the event loop so the cache is not modified while it is copied
+        entries = self.get_cache_backend().export_entries()
+        try:
+            await asyncio.to_thread(store.write, catalogues, entries)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Could not write snapshot %s: %s", store.path, e)
+
+    async def _save_snapshots_periodically(self) -> None:
+        """Write a snapshot every snapshot_interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.settings.cache.snapshot_interval)
+            await self.save_snapshot()
+
+    async def health_report(self) -> dict[str, Any]:
+        """Collect upstream, pool, cache and catalogue state for health probes.
+
+        Returns:
+            JSON-serializable health report.
+        """
+        http_client = self.get_http_client()
+        breaker = http_client.circuit_breaker
+
+        catalogues = {}
+        cached_total = entries_total = 0
+        for repository in (self.get_character_repository(), self.get_artifact_repository()):
+            cached, entries = await repository.cache_coverage()
+            cached_total += cached
+            entries_total += entries
+            age = repository.catalogue_age
+            catalogues[repository.catalogue_name] = {
+                "entries": repository.catalogue_size,
+                "age_seconds": round(age, 1) if age is not None else None,
+                "cached_details": cached,
+            }
+
+        if not self._started:
+            status = "starting"
+        elif not self._warm_up_done:
+            status = "warming_up"
+        else:
+            status = "ok" if self.is_ready else "upstream_unavailable"
+
+        return {
+            "status": status,
+            "ready": status == "ok",
+            "started": self._started,
+            "warm_up_complete": self._warm_up_done,
+            "circuit_breaker": {
+                "state": breaker.current_state if breaker else "disabled",
+                "failure_count": breaker.failure_count if breaker else 0,
+            },
+            "connection_pool": http_client.pool_stats(),
+            "cache": {
+                "backend": self.settings.cache.backend,
+                "warm_percent": round(100.0 * cached_total / entries_total, 1) if entries_total else 0.0,
+            },
+            "catalogues": catalogues,
+            "tool_calls_in_flight": self.inflight.count,
+            "admission": self.get_admission_controller().snapshot(),
+        }
+
+    async def shutdown(self, drain_timeout: float | None = None) -> None:
+        """Wait for in-flight calls to finish, then release resources.
+
+        Args:
+            drain_timeout: Maximum seconds to wait for in-flight calls. Uses settings if None.
+        """
+        timeout = drain_timeout if drain_timeout is not None else self.settings.server.shutdown_timeout
+        await self.inflight.wait_idle(timeout)
+        await self.cleanup()
+
     async def cleanup(self) -> None:
         """Clean up resources (close connections, etc.)."""
         self.logger.info("Cleaning up container resources")
 
-        # HTTP clientのクリーンアップ
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._warm_up_task
+        self._warm_up_task = None
+
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._snapshot_task
+            self._snapshot_task = None
+        if self._started:
+            await self.save_snapshot()
+
+        # The Kuro API client shares this HTTP client, so closing it closes the pool for both
         if "http_client" in self._singletons:
             http_client = self._singletons["http_client"]
             if hasattr(http_client, "close"):
                 await http_client.close()
 
-        # Kuro API clientのクリーンアップ
-        if "kuro_api_client" in self._singletons:
-            api_client = self._singletons["kuro_api_client"]
-            if hasattr(api_client, "__aexit__"):
-                await api_client.__aexit__(None, None, None)
+        if "cache_backend" in self._singletons:
+            await self._singletons["cache_backend"].close()
 
         self.clear_singletons()
+        self._started = False
+        self._warm_up_done = False
         self.logger.info("Container cleanup completed")
 
 
@@ -241,7 +653,7 @@ def reset_container() -> None:
 
 
 # Factory functions for easy integration
-def create_character_service(container: DIContainer | None = None) -> CharacterService:
+def create_character_service(container: DIContainer | None = None) -> "CharacterService":
     """Create character service using dependency injection.
 
     Args:
@@ -255,7 +667,7 @@ def create_character_service(container: DIContainer | None = None) -> CharacterS
     return container.get_character_service()
 
 
-def create_artifact_service(container: DIContainer | None = None) -> ArtifactService:
+def create_artifact_service(container: DIContainer | None = None) -> "ArtifactService":
     """Create artifact service using dependency injection.
 
     Args:
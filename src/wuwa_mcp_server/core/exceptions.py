@@ -169,3 +169,19 @@ class MarkdownGenerationException(ServiceException):
     """Raised when markdown generation fails."""
 
     pass
+
+
+class ServerBusyException(ServiceException):
+    """Raised when a call is rejected by admission control."""
+
+    def __init__(
+        self,
+        retry_after: int,
+        queue_depth: int,
+        **kwargs,
+    ) -> None:
+        message = f"Server busy, retry after {retry_after} s"
+        details = {"retry_after": retry_after, "queue_depth": queue_depth}
+        super().__init__(message, code=kwargs.get("code", "server_busy"), details=details)
+        self.retry_after = retry_after
+        self.queue_depth = queue_depth
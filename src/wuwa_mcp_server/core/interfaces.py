@@ -87,11 +87,11 @@ class ServiceProtocol(Protocol):
 class CharacterServiceProtocol(ServiceProtocol):
     """Protocol for character service."""
 
-    async def get_character_info(self, character_name: str) -> str:
+    async def get_character_info(self, character_name: str, output_format: str = "markdown") -> str:
         """Get comprehensive character information."""
         ...
 
-    async def get_character_profile(self, character_name: str) -> str:
+    async def get_character_profile(self, character_name: str, output_format: str = "markdown") -> str:
         """Get character profile information."""
         ...
 
@@ -99,7 +99,7 @@ class CharacterServiceProtocol(ServiceProtocol):
 class ArtifactServiceProtocol(ServiceProtocol):
     """Protocol for artifact service."""
 
-    async def get_artifact_info(self, artifact_name: str) -> str:
+    async def get_artifact_info(self, artifact_name: str, output_format: str = "markdown") -> str:
         """Get artifact information."""
         ...
 
@@ -107,15 +107,17 @@ class ArtifactServiceProtocol(ServiceProtocol):
 class MarkdownServiceProtocol(ServiceProtocol):
     """Protocol for markdown service."""
 
-    def generate_character_markdown(self, parsed_data: dict[str, Any], include_strategy: bool = True) -> str:
+    def generate_character_markdown(
+        self, parsed_data: dict[str, Any], include_strategy: bool = True, compact: bool = False
+    ) -> str:
         """Generate markdown for character data."""
         ...
 
-    def generate_artifact_markdown(self, parsed_data: dict[str, Any]) -> str:
+    def generate_artifact_markdown(self, parsed_data: dict[str, Any], compact: bool = False) -> str:
         """Generate markdown for artifact data."""
         ...
 
-    def generate_strategy_markdown(self, parsed_data: dict[str, Any]) -> str:
+    def generate_strategy_markdown(self, parsed_data: dict[str, Any], compact: bool = False) -> str:
         """Generate markdown for strategy data."""
         ...
 
@@ -0,0 +1,54 @@
+"""Lifecycle helpers for startup, in-flight tracking and graceful shutdown."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from .logging_config import LoggerMixin
+
+
+class InFlightTracker(LoggerMixin):
+    """Track in-flight tool calls so shutdown can wait for them to finish."""
+
+    def __init__(self):
+        """Initialize the tracker with no calls in flight."""
+        self._count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def count(self) -> int:
+        """Number of calls currently in flight."""
+        return self._count
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        """Mark a call as in flight for the duration of the context."""
+        self._count += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._count -= 1
+            if self._count == 0:
+                self._idle.set()
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """Wait until no calls are in flight.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if all calls finished, False if the timeout expired first.
+        """
+        if self._count == 0:
+            return True
+
+        self.logger.info("Waiting up to %.0fs for %s in-flight call(s) to finish", timeout, self._count)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except TimeoutError:
+            self.logger.warning("Shutdown drain timed out with %s call(s) still in flight", self._count)
+            return False
@@ -1,11 +1,26 @@
-"""Centralized logging configuration for WuWa MCP Server."""
+"""Centralized logging configuration for WuWa MCP Server.
 
+Loggers only enqueue records; a listener thread formats them and writes to
+stderr, so the event loop never blocks on terminal or pipe I/O. Messages use
+%-style arguments, which are not formatted when the level is disabled.
+"""
+
+import atexit
+import copy
+import functools
+import json
 import logging
 import logging.handlers
+import queue
 import sys
+from datetime import UTC
+from datetime import datetime
 
 from .config import LogSettings
 
+# Listener draining the log queue; set by setup_logging
+_listener: logging.handlers.QueueListener | None = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Colored console formatter for better readability."""
@@ -30,6 +45,42 @@ class ColoredFormatter(logging.Formatter):
         return super().format(record)
 
 
+class JSONFormatter(logging.Formatter):
+    """Structured formatter emitting one JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as a single-line JSON object."""
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler keeping the traceback apart from the message."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve arguments and traceback so the record can cross threads.
+
+        The stock implementation folds the traceback into the message, which
+        leaves nothing for the JSON formatter's ``exception`` field.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or self.formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 def setup_logging(
     settings: LogSettings | None = None,
     logger_name: str = "wuwa_mcp",
@@ -43,6 +94,7 @@ def setup_logging(
     Returns:
         Configured logger instance.
     """
+    global _listener
     if settings is None:
         settings = LogSettings()
 
@@ -53,20 +105,30 @@ def setup_logging(
     if logger.handlers:
         return logger
 
-    # Set level
+    # Set level; disabled levels are rejected before any message formatting
     numeric_level = getattr(logging, settings.level.upper(), logging.INFO)
     logger.setLevel(numeric_level)
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler on stderr (stdout carries the stdio transport), driven by
+    # the listener thread rather than the caller
+    console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(numeric_level)
 
     # Create formatter
-    formatter = ColoredFormatter(fmt=settings.format, datefmt="%Y-%m-%d %H:%M:%S")
+    formatter = JSONFormatter() if settings.json else ColoredFormatter(fmt=settings.format, datefmt="%Y-%m-%d %H:%M:%S")
     console_handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(console_handler)
+    # Callers only enqueue; records no longer propagate to the root handlers,
+    # which write synchronously
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter())
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
 
     # Disable uvicorn access logs if requested
     if settings.disable_uvicorn_logs:
@@ -77,10 +139,18 @@ def setup_logging(
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
-    logger.info(f"Logging configured with level: {settings.level}")
+    logger.info("Logging configured with level: %s", settings.level)
     return logger
 
 
+def shutdown_logging() -> None:
+    """Stop the listener thread after writing out queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module.
 
@@ -93,13 +163,15 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"wuwa_mcp.{name}")
 
 
+@functools.cache
+def _class_logger(cls: type) -> logging.Logger:
+    return get_logger(cls.__name__.lower())
+
+
 class LoggerMixin:
     """Mixin class to add logging capabilities to any class."""
 
     @property
     def logger(self) -> logging.Logger:
-        """Get logger for this class."""
-        if not hasattr(self, "_logger"):
-            class_name = self.__class__.__name__.lower()
-            self._logger = get_logger(class_name)
-        return self._logger
+        """Get logger for this class (resolved once per class)."""
+        return _class_logger(type(self))
@@ -0,0 +1,303 @@
+"""Dependency-free metrics with Prometheus text exposition.
+
+Metrics are module-level objects, like settings and the container, so any
+layer can record into them without threading a registry through constructors.
+Histograms use fixed buckets: an observation is one bisect and three additions.
+Updates take no lock; they happen on the event loop, apart from parse timings
+recorded in worker threads, where the GIL makes a lost increment negligible.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Seconds; spans cache hits (sub-millisecond) to slow upstream calls with retries
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class for a metric family with labelled children."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values: object):
+        """Get the child for the given label values (positional, in labelnames order)."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop all children."""
+        with self._lock:
+            self._children.clear()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def collect(self) -> list[str]:
+        """Render this family in Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            children = sorted(self._children.items())
+        for key, child in children:
+            lines.extend(self._collect_child(key, child))
+        return lines
+
+    def _collect_child(self, key: tuple[str, ...], child) -> list[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"]
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+
+class _CounterChild(_Value):
+    __slots__ = ()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        self.value += amount
+
+
+class _GaugeChild(_Value):
+    __slots__ = ()
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        # One slot per bucket plus the +Inf overflow; cumulated at exposition time
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the context in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase an unlabelled counter."""
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, usually set right before exposition."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge."""
+        self._default.set(value)
+
+
+class Histogram(_Metric):
+    """Histogram with fixed upper bounds."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on an unlabelled histogram."""
+        self._default.observe(value)
+
+    def _collect_child(self, key: tuple[str, ...], child: _HistogramChild) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, float("inf")), child.counts, strict=True):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric family.
+
+        Raises:
+            ValueError: If a family with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all families in Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset every family (useful for testing and benchmarks)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.counter("wuwa_tool_calls_total", "Tool calls by tool and outcome.", ("tool", "outcome"))
+TOOL_CALL_DURATION = REGISTRY.histogram(
+    "wuwa_tool_call_duration_seconds", "Tool call duration including queueing.", ("tool",)
+)
+
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "wuwa_upstream_requests_total", "Kuro API request attempts by endpoint and HTTP status.", ("endpoint", "status")
+)
+UPSTREAM_RETRIES = REGISTRY.counter("wuwa_upstream_retries_total", "Kuro API retry attempts.", ("endpoint",))
+UPSTREAM_RESPONSE_BYTES = REGISTRY.counter(
+    "wuwa_upstream_response_bytes_total", "Kuro API response body bytes received.", ("endpoint",)
+)
+UPSTREAM_DURATION = REGISTRY.histogram(
+    "wuwa_upstream_request_duration_seconds", "Duration of a single Kuro API request attempt.", ("endpoint",)
+)
+
+CATALOGUE_FETCH_DURATION = REGISTRY.histogram(
+    "wuwa_catalogue_fetch_duration_seconds", "Time to fetch a catalogue list from the API.", ("catalogue",)
+)
+CATALOGUE_CHANGES = REGISTRY.counter(
+    "wuwa_catalogue_changes_total",
+    "Catalogue records added, removed or changed between fetches.",
+    ("catalogue", "change"),
+)
+PARSE_DURATION = REGISTRY.histogram(
+    "wuwa_parse_duration_seconds", "HTML/content parsing time per parsing strategy.", ("strategy",)
+)
+RENDER_DURATION = REGISTRY.histogram(
+    "wuwa_render_duration_seconds", "Markdown/JSON rendering time.", ("tool", "format")
+)
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "wuwa_cache_requests_total", "Cache lookups by tier and result (hit or miss).", ("tier", "result")
+)
+HTTP_NOT_MODIFIED = REGISTRY.counter(
+    "wuwa_http_not_modified_total", "Tool results answered with 304 Not Modified instead of a body."
+)
+
+ADMISSION_DECISIONS = REGISTRY.counter(
+    "wuwa_admission_decisions_total", "Admission decisions (admitted or rejected).", ("decision",)
+)
+ADMISSION_WAIT = REGISTRY.histogram("wuwa_admission_wait_seconds", "Time admitted calls spent queued.")
+ADMISSION_IN_FLIGHT = REGISTRY.gauge("wuwa_admission_in_flight", "Tool calls currently admitted.")
+ADMISSION_QUEUE_DEPTH = REGISTRY.gauge("wuwa_admission_queue_depth", "Tool calls waiting for admission.")
+UPSTREAM_IN_FLIGHT = REGISTRY.gauge("wuwa_upstream_requests_in_flight", "Kuro API requests currently in flight.")
+
+
+def record_cache_lookup(tier: str, hit: bool) -> None:
+    """Count a cache lookup.
+
+    Args:
+        tier: Cache tier, e.g. ``catalogue``, ``entry``, ``render``, ``page``, ``payload``, ``memo``
+            or ``compressed``.
+        hit: Whether the lookup was served from the cache.
+    """
+    CACHE_REQUESTS.labels(tier, "hit" if hit else "miss").inc()
@@ -0,0 +1,184 @@
+"""Sampled cProfile capture of individual tool calls.
+
+A sampled call runs under cProfile, which on Python 3.12 also sees the worker
+threads used for parsing, with span recording forced on so the profile comes
+with the call's stage timings. Only one call is profiled at a time: the
+interpreter allows a single active profiler, and calls overlapping a profiled
+one show up in its profile anyway.
+"""
+
+import asyncio
+import cProfile
+import json
+import pstats
+import random
+import re
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .config import ProfilingSettings
+from .config import get_settings
+from .logging_config import LoggerMixin
+from .tracing import Span
+from .tracing import get_tracer
+
+# Functions listed in the summary written next to each profile
+_TOP_FUNCTIONS = 25
+
+
+class CallProfile:
+    """A tool call selected for profiling."""
+
+    def __init__(self, tool_name: str, entity_name: str):
+        self.tool_name = tool_name
+        self.entity_name = entity_name
+        self.started_at = datetime.now().astimezone()
+        # Root span of the call, set by the caller so stage timings can be saved
+        self.span: Span | None = None
+        self.duration: float = 0.0
+
+
+class CallProfiler(LoggerMixin):
+    """Run a sample of tool calls under cProfile and write one profile per call."""
+
+    def __init__(self, settings: ProfilingSettings | None = None):
+        """Initialize profiler.
+
+        Args:
+            settings: Profiling settings. Creates default if None.
+        """
+        self.settings = settings or ProfilingSettings()
+        self.sample_percent = min(max(self.settings.sample_percent, 0.0), 100.0)
+        self.output_dir = Path(self.settings.output_dir)
+        self.profiles_written = 0
+        self._active = False
+        # Profile writes run in the background; references keep the tasks alive
+        self._writes: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any calls are sampled."""
+        return self.sample_percent > 0
+
+    def set_sample_percent(self, percent: float) -> None:
+        """Change the share of profiled calls at runtime.
+
+        Args:
+            percent: Percentage of tool calls to profile, clamped to 0-100.
+        """
+        self.sample_percent = min(max(percent, 0.0), 100.0)
+        self.logger.info("Profiling sample rate set to %s%%", self.sample_percent)
+
+    @asynccontextmanager
+    async def profile(self, tool_name: str, entity_name: str) -> AsyncIterator[CallProfile | None]:
+        """Profile the enclosed tool call if it is sampled.
+
+        Args:
+            tool_name: Name of the tool being called.
+            entity_name: Queried character or artifact name.
+
+        Yields:
+            The call profile, or None when the call is not sampled.
+        """
+        if not self.enabled or self._active or random.random() * 100 >= self.sample_percent:
+            yield None
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiler (e.g. an attached debugger) owns the interpreter hook
+            self.logger.debug("Skipping profile of %s: %s", tool_name, e)
+            yield None
+            return
+
+        call = CallProfile(tool_name, entity_name)
+        self._active = True
+        started = time.perf_counter()
+        try:
+            with get_tracer().force():
+                yield call
+        finally:
+            profiler.disable()
+            self._active = False
+            call.duration = time.perf_counter() - started
+            # Written off the response path so the sampled call is not slowed down further
+            task = asyncio.create_task(asyncio.to_thread(self._write, call, profiler))
+            self._writes.add(task)
+            task.add_done_callback(self._write_done)
+
+    def _write_done(self, task: asyncio.Task) -> None:
+        self._writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning("Failed to write profile to %s: %s", self.output_dir, task.exception())
+
+    def recent_profiles(self, limit: int = 20) -> list[str]:
+        """List the most recently written profile files, newest first."""
+        if not self.output_dir.is_dir():
+            return []
+        files = sorted(self.output_dir.glob("*.prof"), key=lambda path: path.stat().st_mtime, reverse=True)
+        return [path.name for path in files[:limit]]
+
+    def _write(self, call: CallProfile, profiler: cProfile.Profile) -> None:
+        """Write the pstats file and a JSON summary with stage timings."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        entity = re.sub(r"[^\w-]+", "_", call.entity_name)[:40] or "_"
+        stem = f"{call.started_at:%Y%m%dT%H%M%S%f}-{call.tool_name}-{entity}"
+        profiler.dump_stats(self.output_dir / f"{stem}.prof")
+
+        summary = {
+            "tool": call.tool_name,
+            "entity": call.entity_name,
+            "started_at": call.started_at.isoformat(timespec="milliseconds"),
+            "duration_ms": round(call.duration * 1e3, 3),
+            "attributes": dict(call.span.attributes) if call.span else {},
+            "stages": get_tracer().export_trace(call.span)["spans"] if call.span else [],
+            "top_functions": self._top_functions(profiler),
+        }
+        with open(self.output_dir / f"{stem}.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2, default=str)
+
+        self.profiles_written += 1
+        self._prune()
+        self.logger.info("Wrote profile %s (%.1f ms)", stem, call.duration * 1e3)
+
+    @staticmethod
+    def _top_functions(profiler: cProfile.Profile) -> list[dict[str, Any]]:
+        """Summarize the functions with the highest cumulative time."""
+        stats = pstats.Stats(profiler).stats
+        ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:_TOP_FUNCTIONS]
+        return [
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "tottime_ms": round(tottime * 1e3, 3),
+                "cumtime_ms": round(cumtime * 1e3, 3),
+            }
+            for (filename, line, name), (_, calls, tottime, cumtime, _) in ranked
+        ]
+
+    def _prune(self) -> None:
+        """Delete the oldest profiles beyond the configured limit."""
+        if self.settings.max_files <= 0:
+            return
+        files = sorted(self.output_dir.glob("*.prof"), key=lambda path: path.stat().st_mtime)
+        for path in files[: max(0, len(files) - self.settings.max_files)]:
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+
+
+# Global profiler instance
+_profiler: CallProfiler | None = None
+
+
+def get_call_profiler() -> CallProfiler:
+    """Get the call profiler singleton, configured from application settings."""
+    global _profiler
+    if _profiler is None:
+        _profiler = CallProfiler(get_settings().profiling)
+    return _profiler
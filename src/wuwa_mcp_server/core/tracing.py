@@ -0,0 +1,306 @@
+"""Lightweight in-process tracing.
+
+The current span lives in a context variable. asyncio.create_task and
+asyncio.to_thread both copy the caller's context, so spans opened in a task or
+worker thread become children of the span that was current when it was
+started. Finished traces go to a ring buffer and can be exported as JSON or as
+OTLP/JSON, optionally appended to a local file one trace per line.
+"""
+
+import functools
+import inspect
+import json
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from .config import TracingSettings
+from .config import get_settings
+from .logging_config import LoggerMixin
+
+_current_span: ContextVar["Span | None"] = ContextVar("wuwa_current_span", default=None)
+# Set by Tracer.force() to record spans in one context while tracing is disabled
+_forced: ContextVar[bool] = ContextVar("wuwa_tracing_forced", default=False)
+
+
+class _Trace:
+    """Spans sharing one trace ID."""
+
+    __slots__ = ("dropped_spans", "spans", "trace_id")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("attributes", "end_ns", "error", "name", "parent_id", "span_id", "start_ns", "thread", "trace")
+
+    def __init__(self, trace: _Trace, name: str, parent_id: str | None, attributes: dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.thread = threading.current_thread().name
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+
+class Tracer(LoggerMixin):
+    """Create spans and keep recently finished traces."""
+
+    def __init__(self, settings: TracingSettings | None = None):
+        """Initialize tracer.
+
+        Args:
+            settings: Tracing settings. Creates default if None.
+        """
+        self.settings = settings or TracingSettings()
+        self.enabled = self.settings.enabled
+        self._traces: deque[_Trace] = deque(maxlen=max(1, self.settings.buffer_size))
+        self._file_lock = threading.Lock()
+
+    @property
+    def recording(self) -> bool:
+        """Whether spans opened in the current context are recorded."""
+        return self.enabled or _forced.get()
+
+    @contextmanager
+    def force(self) -> Iterator[None]:
+        """Record spans within the context even when tracing is disabled.
+
+        Traces recorded this way are only kept in the buffer when tracing is
+        enabled; callers read them from the root span they open.
+        """
+        token = _forced.set(True)
+        try:
+            yield
+        finally:
+            _forced.reset(token)
+
+    @contextmanager
+    def span(self, name: str, /, **attributes: Any) -> Iterator[Span | None]:
+        """Open a span for the duration of the context.
+
+        Without a current span, a new trace is started and this span is its
+        root; the trace is stored when the root ends.
+
+        Args:
+            name: Span name.
+            attributes: Initial span attributes.
+
+        Yields:
+            The span, or None when spans are not recorded.
+        """
+        if not self.recording:
+            yield None
+            return
+
+        parent = _current_span.get()
+        trace = parent.trace if parent is not None else _Trace(f"{random.getrandbits(128):032x}")
+        span = Span(trace, name, parent.span_id if parent is not None else None, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{e.__class__.__name__}: {e}"[:200]
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            if len(trace.spans) < self.settings.max_spans_per_trace:
+                trace.spans.append(span)
+            else:
+                trace.dropped_spans += 1
+            if parent is None and self.enabled:
+                self._finish_trace(trace)
+
+    def traces(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Export recent traces as JSON-serializable dicts, newest first.
+
+        Span start times are offsets from the start of the trace, so the
+        critical path and any overlap between spans can be read directly.
+
+        Args:
+            limit: Maximum number of traces to return (all if None).
+
+        Returns:
+            List of traces.
+        """
+        traces = list(self._traces)[::-1][:limit]
+        return [self._trace_to_dict(trace) for trace in traces]
+
+    def export_otlp(self, limit: int | None = None) -> dict[str, Any]:
+        """Export recent traces as an OTLP/JSON ExportTraceServiceRequest.
+
+        Args:
+            limit: Maximum number of traces to include (all if None).
+
+        Returns:
+            OTLP/JSON payload.
+        """
+        traces = list(self._traces)[::-1][:limit]
+        return self._otlp_payload([span for trace in traces for span in trace.spans])
+
+    def export_trace(self, span: Span) -> dict[str, Any]:
+        """Export the trace a span belongs to, in the format of ``traces()``.
+
+        Args:
+            span: Any span of the trace.
+
+        Returns:
+            The trace as a JSON-serializable dict.
+        """
+        return self._trace_to_dict(span.trace)
+
+    def clear(self) -> None:
+        """Drop all buffered traces."""
+        self._traces.clear()
+
+    def _finish_trace(self, trace: _Trace) -> None:
+        """Store a finished trace and append it to the OTLP file if configured."""
+        self._traces.append(trace)
+        if not self.settings.otlp_file:
+            return
+        line = json.dumps(self._otlp_payload(trace.spans), ensure_ascii=False, separators=(",", ":"))
+        try:
+            with self._file_lock, open(self.settings.otlp_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            self.logger.warning("Failed to write trace to %s: %s", self.settings.otlp_file, e)
+
+    @staticmethod
+    def _trace_to_dict(trace: _Trace) -> dict[str, Any]:
+        spans = sorted(trace.spans, key=lambda span: span.start_ns)
+        origin = spans[0].start_ns if spans else 0
+        root = next((span for span in spans if span.parent_id is None), spans[0] if spans else None)
+        return {
+            "trace_id": trace.trace_id,
+            "root": root.name if root else None,
+            "duration_ms": round(((root.end_ns or origin) - root.start_ns) / 1e6, 3) if root else 0.0,
+            "dropped_spans": trace.dropped_spans,
+            "spans": [
+                {
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "name": span.name,
+                    "start_ms": round((span.start_ns - origin) / 1e6, 3),
+                    "duration_ms": round(((span.end_ns or span.start_ns) - span.start_ns) / 1e6, 3),
+                    "thread": span.thread,
+                    "attributes": span.attributes,
+                    "error": span.error,
+                }
+                for span in spans
+            ],
+        }
+
+    @staticmethod
+    def _otlp_payload(spans: list[Span]) -> dict[str, Any]:
+        def attribute(key: str, value: Any) -> dict[str, Any]:
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": [
+                    attribute(key, value) for key, value in {**span.attributes, "thread.name": span.thread}.items()
+                ],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [attribute("service.name", "wuwa-mcp-server")]},
+                    "scopeSpans": [{"scope": {"name": "wuwa_mcp_server"}, "spans": otlp_spans}],
+                }
+            ]
+        }
+
+
+def traced(name: str | None = None, attributes: tuple[str, ...] = ()) -> Callable:
+    """Decorate a function or coroutine function to run inside a span.
+
+    Args:
+        name: Span name. Defaults to the function's qualified name.
+        attributes: Names of arguments recorded as span attributes.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func) if attributes else None
+
+        def span_attributes(args: tuple, kwargs: dict) -> dict[str, Any]:
+            if signature is None:
+                return {}
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            return {key: bound[key] for key in attributes if key in bound}
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                tracer = get_tracer()
+                if not tracer.recording:
+                    return await func(*args, **kwargs)
+                with tracer.span(span_name, **span_attributes(args, kwargs)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.recording:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, **span_attributes(args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Global tracer instance
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer singleton, configured from application settings."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(get_settings().tracing)
+    return _tracer
@@ -7,6 +7,7 @@ from .entities import MarkdownDocument
 from .value_objects import ArtifactId
 from .value_objects import CharacterId
 from .value_objects import ContentType
+from .value_objects import OutputFormat
 
 __all__ = [
     "Artifact",
@@ -16,4 +17,5 @@ __all__ = [
     "ContentModule",
     "ContentType",
     "MarkdownDocument",
+    "OutputFormat",
 ]
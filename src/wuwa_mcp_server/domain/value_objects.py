@@ -16,6 +16,37 @@ class ContentType(Enum):
     ARTIFACT_DATA = "声骸数据"
 
 
+class OutputFormat(Enum):
+    """Enumeration of tool output formats."""
+
+    MARKDOWN = "markdown"
+    COMPACT = "compact"  # Markdown rendered with the compact profile
+    JSON = "json"
+
+    @classmethod
+    def from_value(cls, value: "str | OutputFormat | None") -> "OutputFormat":
+        """Resolve an output format from a user-supplied value.
+
+        Args:
+            value: Format name (case-insensitive), enum member or None for the default.
+
+        Returns:
+            Matching output format.
+
+        Raises:
+            ValueError: If the value is not a known format.
+        """
+        if value is None or value == "":
+            return cls.MARKDOWN
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(str(value).strip().lower())
+        except ValueError:
+            supported = ", ".join(member.value for member in cls)
+            raise ValueError(f"Unsupported output format '{value}'. Supported: {supported}") from None
+
+
 @dataclass(frozen=True)
 class CharacterId:
     """Value object for character identification."""
@@ -1,7 +1,9 @@
 """Enhanced HTTP client with retry logic and circuit breaker pattern."""
 
 import asyncio
-import json
+import hashlib
+import time
+from collections import OrderedDict
 from types import TracebackType
 from typing import Any
 
@@ -14,6 +16,12 @@ from ...core.exceptions import AuthenticationException
 from ...core.exceptions import ConnectionException
 from ...core.exceptions import RateLimitException
 from ...core.logging_config import LoggerMixin
+from ...core.metrics import UPSTREAM_DURATION
+from ...core.metrics import UPSTREAM_REQUESTS
+from ...core.metrics import UPSTREAM_RESPONSE_BYTES
+from ...core.metrics import UPSTREAM_RETRIES
+from ...core.metrics import record_cache_lookup
+from .json_decoding import select_decoder
 
 
 class CircuitBreaker:
@@ -46,6 +54,22 @@ class CircuitBreaker:
         else:  # half-open
             return True
 
+    @property
+    def current_state(self) -> str:
+        """State as seen by the next request, without changing it.
+
+        An open circuit whose timeout has elapsed reports "half-open", because
+        the next request will be let through as a trial. Probes use this so an
+        idle server is not reported unavailable after the upstream recovered.
+        """
+        if (
+            self.state == "open"
+            and self.last_failure_time is not None
+            and (asyncio.get_event_loop().time() - self.last_failure_time) > self.timeout
+        ):
+            return "half-open"
+        return self.state
+
     def record_success(self) -> None:
         """Record successful execution."""
         self.failure_count = 0
@@ -68,6 +92,7 @@ class HTTPClient(LoggerMixin):
         api_settings: APISettings,
         http_settings: HTTPClientSettings,
         enable_circuit_breaker: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize HTTP client.
 
@@ -75,10 +100,23 @@ class HTTPClient(LoggerMixin):
             api_settings: API configuration settings.
             http_settings: HTTP client configuration settings.
             enable_circuit_breaker: Whether to enable circuit breaker.
+            transport: Optional transport replacing the network, e.g. an
+                ``httpx.MockTransport`` serving recorded responses offline.
         """
         self.api_settings = api_settings
         self.http_settings = http_settings
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
+        self._persistent = False
+        self._active_contexts = 0
+        self._requests_in_flight = 0
+        # (endpoint, form data) -> (digest of the response body, decoded body)
+        self._payloads: OrderedDict[tuple[str, tuple], tuple[bytes, Any]] = OrderedDict()
+        self.json_decoder, self._decode_json = select_decoder(http_settings.json_decoder)
+        if http_settings.json_decoder not in ("auto", self.json_decoder):
+            self.logger.warning(
+                "JSON decoder %s is not installed, using %s", http_settings.json_decoder, self.json_decoder
+            )
 
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker() if enable_circuit_breaker else None
@@ -99,14 +137,44 @@ class HTTPClient(LoggerMixin):
             "wiki_type": self.http_settings.wiki_type,
         }
 
-    async def __aenter__(self) -> "HTTPClient":
-        """Async context manager entry."""
-        self._client = httpx.AsyncClient(
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled httpx client."""
+        return httpx.AsyncClient(
             headers=self._headers,
             timeout=httpx.Timeout(self.api_settings.timeout),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            limits=httpx.Limits(
+                max_connections=self.http_settings.max_connections,
+                max_keepalive_connections=self.http_settings.max_keepalive_connections,
+            ),
+            transport=self._transport,
         )
-        self.logger.info("HTTP client initialized")
+
+    async def open(self) -> None:
+        """Open the connection pool and keep it open until close() is called.
+
+        Context manager exits no longer close a client opened this way, so all
+        callers share one pool for the lifetime of the server.
+        """
+        self._persistent = True
+        if self._client is None:
+            self._client = self._create_client()
+            self.logger.info("HTTP client connection pool opened")
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        self._persistent = False
+        self._active_contexts = 0
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+            self.logger.info("HTTP client closed")
+
+    async def __aenter__(self) -> "HTTPClient":
+        """Async context manager entry."""
+        if self._client is None:
+            self._client = self._create_client()
+            self.logger.info("HTTP client initialized")
+        self._active_contexts += 1
         return self
 
     async def __aexit__(
@@ -115,8 +183,13 @@ class HTTPClient(LoggerMixin):
         exc_value: BaseException | None = None,
         traceback: TracebackType | None = None,
     ) -> None:
-        """Async context manager exit."""
-        if self._client:
+        """Async context manager exit.
+
+        The client is only closed when the last concurrent context exits and the
+        pool was not opened with open().
+        """
+        self._active_contexts = max(0, self._active_contexts - 1)
+        if self._client and not self._persistent and self._active_contexts == 0:
             await self._client.aclose()
             self._client = None
             self.logger.info("HTTP client closed")
@@ -135,7 +208,9 @@ class HTTPClient(LoggerMixin):
             max_retries: Maximum number of retries. Uses config default if None.
 
         Returns:
-            Parsed JSON response.
+            Parsed JSON response. A response whose body is byte-identical to
+            the previous one for the same request returns the object decoded
+            then, which callers must treat as read-only.
 
         Raises:
             APIException: For API-related errors.
@@ -154,26 +229,39 @@ class HTTPClient(LoggerMixin):
         last_exception = None
 
         for attempt in range(max_retries + 1):
+            if attempt:
+                UPSTREAM_RETRIES.labels(endpoint).inc()
             try:
-                self.logger.debug(f"Attempting request to {url} (attempt {attempt + 1})")
-
-                response = await self._client.post(url, data=data)
+                self.logger.debug("Attempting request to %s (attempt %s)", url, attempt + 1)
+
+                self._requests_in_flight += 1
+                started = time.perf_counter()
+                try:
+                    response = await self._client.post(url, data=data)
+                except httpx.RequestError:
+                    UPSTREAM_REQUESTS.labels(endpoint, "error").inc()
+                    raise
+                finally:
+                    self._requests_in_flight -= 1
+                    UPSTREAM_DURATION.labels(endpoint).observe(time.perf_counter() - started)
+                UPSTREAM_REQUESTS.labels(endpoint, response.status_code).inc()
+                UPSTREAM_RESPONSE_BYTES.labels(endpoint).inc(len(response.content))
 
                 # Check for successful response
                 if response.status_code == 200:
                     try:
-                        json_data = response.json()
+                        json_data = self._decode_payload(endpoint, data, response.content)
 
                         # Record success for circuit breaker
                         if self.circuit_breaker:
                             self.circuit_breaker.record_success()
 
-                        self.logger.debug(f"Successful response from {url}")
+                        self.logger.debug("Successful response from %s", url)
                         return json_data
 
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:  # Every decoder from available_decoders() raises ValueError
                         error_msg = f"Failed to decode JSON response from {url}: {e}"
-                        self.logger.error(f"{error_msg}. Response text: {response.text[:500]}...")
+                        self.logger.error("%s. Response text: %s...", error_msg, response.text[:500])
                         raise APIException(
                             error_msg,
                             status_code=response.status_code,
@@ -218,7 +306,7 @@ class HTTPClient(LoggerMixin):
             # Wait before retrying (exponential backoff)
             if attempt < max_retries:
                 delay = self.api_settings.retry_delay * (2**attempt)
-                self.logger.info(f"Retrying in {delay:.1f} seconds...")
+                self.logger.info("Retrying in %.1f seconds...", delay)
                 await asyncio.sleep(delay)
 
         # All retries exhausted, record failure and raise last exception
@@ -230,6 +318,55 @@ class HTTPClient(LoggerMixin):
         else:
             raise ConnectionException(f"All retry attempts exhausted for {url}")
 
+    def _decode_payload(self, endpoint: str, data: dict[str, Any], content: bytes) -> Any:
+        """Decode a JSON response body, reusing the last decoding if the body is unchanged.
+
+        Hashing the raw bytes costs far less than decoding them, and an
+        unchanged body also hands callers the same objects as before, so
+        caches keyed on them keep serving what was derived from them.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        memo_size = self.http_settings.payload_memo_size
+        if memo_size <= 0:
+            return self._decode_json(content)
+
+        key = (endpoint, tuple(sorted((name, str(value)) for name, value in data.items())))
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        remembered = self._payloads.get(key)
+        unchanged = remembered is not None and remembered[0] == digest
+        record_cache_lookup("payload", hit=unchanged)
+        if unchanged:
+            self._payloads.move_to_end(key)
+            return remembered[1]
+
+        decoded = self._decode_json(content)
+        self._payloads[key] = (digest, decoded)
+        self._payloads.move_to_end(key)
+        while len(self._payloads) > memo_size:
+            self._payloads.popitem(last=False)
+        return decoded
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the connection pool is open."""
+        return self._client is not None
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Report connection pool utilization.
+
+        Returns:
+            Pool size, upstream requests in flight and their ratio to the pool size.
+        """
+        max_connections = self.http_settings.max_connections
+        return {
+            "open": self.is_open,
+            "max_connections": max_connections,
+            "requests_in_flight": self._requests_in_flight,
+            "utilization": round(min(1.0, self._requests_in_flight / max_connections), 3) if max_connections else 0.0,
+        }
+
     @property
     def is_circuit_open(self) -> bool:
         """Check if circuit breaker is open."""
@@ -0,0 +1,69 @@
+"""JSON decoders for upstream response bodies."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def available_decoders() -> dict[str, JSONDecoder]:
+    """Decoders usable in this environment, fastest first.
+
+    Each takes the raw response bytes, so orjson and msgspec decode without
+    building an intermediate str, and each raises ValueError on invalid input:
+    the errors of json and orjson subclass it, msgspec's are re-raised as one.
+
+    Returns:
+        Decoder name (``orjson``, ``msgspec`` or ``json``) -> decode function.
+    """
+    decoders: dict[str, JSONDecoder] = {}
+    if ORJSON_AVAILABLE:
+        decoders["orjson"] = orjson.loads
+    if MSGSPEC_AVAILABLE:
+        decoders["msgspec"] = _msgspec_decoder()
+    decoders["json"] = json.loads
+    return decoders
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    """msgspec decoder raising ValueError, whether or not this msgspec's ``DecodeError`` subclasses it."""
+    decode = msgspec.json.Decoder().decode
+
+    def decode_json(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return decode_json
+
+
+def select_decoder(name: str = "auto") -> tuple[str, JSONDecoder]:
+    """Pick a JSON decoder.
+
+    Args:
+        name: ``auto`` for the fastest installed decoder, or a decoder name.
+            A decoder that is not installed falls back to ``auto``.
+
+    Returns:
+        Name of the chosen decoder and its decode function.
+    """
+    decoders = available_decoders()
+    if name in decoders:
+        return name, decoders[name]
+    return next(iter(decoders.items()))
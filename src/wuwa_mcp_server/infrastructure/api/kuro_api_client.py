@@ -7,6 +7,7 @@ from ...core.config import get_settings
 from ...core.exceptions import APIException
 from ...core.exceptions import DataNotFoundException
 from ...core.logging_config import LoggerMixin
+from ...core.tracing import traced
 from .http_client import HTTPClient
 
 
@@ -75,11 +76,11 @@ class KuroAPIClient(LoggerMixin):
                 raise APIException("Invalid response structure for character list", response_data=response_data)
 
             records = response_data["data"]["results"]["records"]
-            self.logger.info(f"Successfully fetched {len(records)} characters")
+            self.logger.info("Successfully fetched %s characters", len(records))
             return records
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch character list: {e}")
+            self.logger.error("Failed to fetch character list: %s", e)
             if isinstance(e, APIException):
                 raise
             else:
@@ -110,16 +111,17 @@ class KuroAPIClient(LoggerMixin):
                 raise APIException("Invalid response structure for artifacts list", response_data=response_data)
 
             records = response_data["data"]["results"]["records"]
-            self.logger.info(f"Successfully fetched {len(records)} artifacts")
+            self.logger.info("Successfully fetched %s artifacts", len(records))
             return records
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch artifacts list: {e}")
+            self.logger.error("Failed to fetch artifacts list: %s", e)
             if isinstance(e, APIException):
                 raise
             else:
                 raise APIException(f"Artifacts list fetch failed: {e}")
 
+    @traced(attributes=("entry_id",))
     async def fetch_entry_detail(self, entry_id: str) -> dict[str, Any]:
         """Fetch detailed entry information by ID.
 
@@ -136,7 +138,7 @@ class KuroAPIClient(LoggerMixin):
         if not entry_id:
             raise ValueError("Entry ID cannot be empty")
 
-        self.logger.info(f"Fetching entry detail for ID: {entry_id}")
+        self.logger.debug("Fetching entry detail for ID: %s", entry_id)
 
         form_data = {"id": entry_id}
 
@@ -154,13 +156,13 @@ class KuroAPIClient(LoggerMixin):
                 )
 
             content = response_data["data"]["content"]
-            self.logger.info(f"Successfully fetched entry detail for ID: {entry_id}")
+            self.logger.debug("Successfully fetched entry detail for ID: %s", entry_id)
             return content
 
         except DataNotFoundException:
             raise
         except Exception as e:
-            self.logger.error(f"Failed to fetch entry detail for {entry_id}: {e}")
+            self.logger.error("Failed to fetch entry detail for %s: %s", entry_id, e)
             if isinstance(e, APIException):
                 raise
             else:
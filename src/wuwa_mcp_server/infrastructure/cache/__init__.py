@@ -0,0 +1,25 @@
+"""Cache backends shared by repositories and services."""
+
+from .base_cache import CacheBackend
+from .base_cache import DeferredValue
+from .base_cache import build_cache_key
+from .base_cache import canonical_json
+from .base_cache import content_hash
+from .cache_factory import create_cache_backend
+from .identity_memo import IdentityMemo
+from .memory_cache import MemoryCacheBackend
+from .snapshot import SnapshotStore
+from .sqlite_cache import SQLiteCacheBackend
+
+__all__ = [
+    "CacheBackend",
+    "DeferredValue",
+    "IdentityMemo",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "SnapshotStore",
+    "build_cache_key",
+    "canonical_json",
+    "content_hash",
+    "create_cache_backend",
+]
@@ -0,0 +1,127 @@
+"""Base cache backend interface."""
+
+import hashlib
+import json
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterable
+from typing import Any
+
+from ...core.logging_config import LoggerMixin
+
+
+def build_cache_key(*parts: Any) -> str:
+    """Build a cache key from its parts.
+
+    Args:
+        parts: Key components, e.g. tier, tool name, format and entity name.
+
+    Returns:
+        Colon-separated key with entity names normalized to lower case.
+    """
+    return ":".join(str(part).strip().lower() for part in parts)
+
+
+def canonical_json(value: Any) -> bytes:
+    """Encode a value as JSON with sorted keys and no whitespace, so equal values encode equally."""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(value: Any) -> str:
+    """SHA-256 of the canonical JSON encoding of a value."""
+    return hashlib.sha256(canonical_json(value)).hexdigest()
+
+
+class DeferredValue:
+    """Cached value kept in its JSON encoding until it is first read."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: bytes | memoryview):
+        """Initialize deferred value.
+
+        Args:
+            raw: UTF-8 JSON encoding of the value.
+        """
+        self.raw = raw
+
+    def load(self) -> Any:
+        """Decode the value."""
+        return json.loads(bytes(self.raw))
+
+
+class CacheBackend(LoggerMixin, ABC):
+    """Async key-value cache with per-entry TTL.
+
+    Values must be JSON-serializable so that backends shared between processes
+    can store them. Cached values must be treated as read-only by callers.
+    """
+
+    def __init__(self, default_ttl: float = 3600.0, max_entries: int = 1024):
+        """Initialize cache backend.
+
+        Args:
+            default_ttl: Seconds an entry lives when set() is called without a TTL.
+            max_entries: Maximum number of entries kept before evicting the oldest.
+        """
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value for ttl seconds (default_ttl if None)."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        pass
+
+    async def count_present(self, keys: list[str]) -> int:
+        """Count how many of the given keys hold a live entry.
+
+        Backends override this to check presence without touching values or
+        recency; the default falls back to get().
+        """
+        count = 0
+        for key in keys:
+            if await self.get(key) is not None:
+                count += 1
+        return count
+
+    def export_entries(self) -> list[tuple[str, float, Any]]:
+        """Live entries to carry over to the next process in a snapshot.
+
+        Backends that persist entries themselves return nothing, which is the
+        default.
+
+        Returns:
+            (key, remaining TTL in seconds, value) tuples, least recently used first.
+        """
+        return []
+
+    def import_entries(self, entries: Iterable[tuple[str, float, Any]]) -> int:
+        """Adopt entries exported by a previous process.
+
+        Args:
+            entries: (key, remaining TTL in seconds, value) tuples, least recently
+                used first. Values may be DeferredValue instances.
+
+        Returns:
+            Number of entries adopted.
+        """
+        return 0
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
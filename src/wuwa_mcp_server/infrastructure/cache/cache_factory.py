@@ -0,0 +1,22 @@
+"""Factory selecting the configured cache backend."""
+
+from ...core.config import CacheSettings
+from .base_cache import CacheBackend
+from .memory_cache import MemoryCacheBackend
+from .sqlite_cache import SQLiteCacheBackend
+
+
+# Factory function for dependency injection
+def create_cache_backend(settings: CacheSettings | None = None) -> CacheBackend:
+    """Create the cache backend selected in settings.
+
+    Args:
+        settings: Cache settings. Creates default if None.
+
+    Returns:
+        SQLiteCacheBackend for ``sqlite``, MemoryCacheBackend otherwise.
+    """
+    settings = settings or CacheSettings()
+    if settings.backend == "sqlite":
+        return SQLiteCacheBackend(settings.sqlite_path, settings.entry_ttl, settings.max_entries)
+    return MemoryCacheBackend(settings.entry_ttl, settings.max_entries)
@@ -0,0 +1,60 @@
+"""Memo of values derived from objects that are still the same objects."""
+
+from collections import OrderedDict
+from typing import Any
+
+
+class IdentityMemo:
+    """LRU of derived values keyed by the identity of their source objects.
+
+    Cached entry details and byte-identical upstream responses are handed out
+    as the very objects decoded earlier, so identity tells that a source is
+    unchanged without comparing or hashing it. Sources are held until their
+    memo entry is evicted, which keeps their IDs from being reused meanwhile.
+    A source that is rebuilt, e.g. by a changed response or a cache backend
+    that decodes on every read, simply misses.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize memo.
+
+        Args:
+            max_entries: Maximum number of values kept before evicting the
+                least recently used (0 disables the memo).
+        """
+        self.max_entries = max_entries
+        # (variant, id of the first source) -> (sources, value)
+        self._entries: OrderedDict[tuple[str, int], tuple[tuple[Any, ...], Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def knows(self, variant: str, source: Any) -> bool:
+        """Check whether a value was derived from this object as its first source."""
+        entry = self._entries.get((variant, id(source)))
+        return entry is not None and entry[0][0] is source
+
+    def get(self, variant: str, *sources: Any) -> Any | None:
+        """Get the value derived from exactly these objects, or None."""
+        key = (variant, id(sources[0]))
+        entry = self._entries.get(key)
+        if entry is None or len(entry[0]) != len(sources):
+            return None
+        if not all(remembered is source for remembered, source in zip(entry[0], sources, strict=True)):
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, variant: str, value: Any, *sources: Any) -> None:
+        """Remember a value derived from these objects, replacing one derived from older ones."""
+        if self.max_entries <= 0:
+            return
+        key = (variant, id(sources[0]))
+        self._entries[key] = (sources, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every value."""
+        self._entries.clear()
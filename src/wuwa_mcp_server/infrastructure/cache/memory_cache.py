@@ -0,0 +1,85 @@
+"""In-process LRU cache backend."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from .base_cache import CacheBackend
+from .base_cache import DeferredValue
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU cache with per-entry TTL, local to the current process."""
+
+    def __init__(self, default_ttl: float = 3600.0, max_entries: int = 1024):
+        """Initialize memory cache.
+
+        Args:
+            default_ttl: Seconds an entry lives when set() is called without a TTL.
+            max_entries: Maximum number of entries kept before evicting the least recently used.
+        """
+        super().__init__(default_ttl, max_entries)
+        # key -> (expires_at, value)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        if isinstance(value, DeferredValue):
+            value = value.load()
+            self._entries[key] = (expires_at, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, evicting expired and least recently used entries."""
+        now = time.monotonic()
+        self._entries[key] = (now + (self.default_ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def count_present(self, keys: list[str]) -> int:
+        """Count live entries among the given keys without changing their recency."""
+        now = time.monotonic()
+        return sum(1 for key in keys if (entry := self._entries.get(key)) is not None and entry[0] > now)
+
+    def export_entries(self) -> list[tuple[str, float, Any]]:
+        """Live entries with their remaining TTL, least recently used first."""
+        now = time.monotonic()
+        return [
+            (key, expires_at - now, value) for key, (expires_at, value) in self._entries.items() if expires_at > now
+        ]
+
+    def import_entries(self, entries: Iterable[tuple[str, float, Any]]) -> int:
+        """Adopt snapshot entries without replacing any set since startup."""
+        now = time.monotonic()
+        adopted = 0
+        # Moved to the front newest first, so they keep their order behind anything set in this process
+        for key, ttl, value in reversed(list(entries)):
+            if ttl > 0 and key not in self._entries:
+                self._entries[key] = (now + ttl, value)
+                self._entries.move_to_end(key, last=False)
+                adopted += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return adopted
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
@@ -0,0 +1,153 @@
+"""Snapshot file carrying catalogues and cached entries over to the next process."""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from ...core.logging_config import LoggerMixin
+from .base_cache import DeferredValue
+
+_MAGIC = b"WUWASNAP"
+# Bump when the layout or the meaning of any stored field changes
+FORMAT_VERSION = 2
+# Magic, format version, header length
+_PREAMBLE = struct.Struct("<8sHI")
+
+
+class SnapshotStore(LoggerMixin):
+    """Versioned snapshot of catalogues, name indices and cached entries.
+
+    Layout: a fixed preamble, a JSON header holding the catalogues and an
+    index of the entries, then the entries' JSON encodings back to back. A
+    reader decodes the header only and maps the file, so loading costs about
+    the same whatever the number of entries; each entry is decoded the first
+    time it is read from the cache.
+
+    A snapshot written by another application version or for another upstream
+    (base URL or catalogue IDs) is ignored, since cached rendered output
+    depends on both.
+    """
+
+    def __init__(self, path: str, app_version: str, fingerprint: str):
+        """Initialize snapshot store.
+
+        Args:
+            path: Snapshot file path.
+            app_version: Application version written to and required of snapshots.
+            fingerprint: Upstream identity written to and required of snapshots.
+        """
+        self.path = Path(path)
+        self.app_version = app_version
+        self.fingerprint = fingerprint
+
+    def write(self, catalogues: dict[str, dict[str, Any]], entries: list[tuple[str, float, Any]]) -> int:
+        """Write a snapshot, replacing the previous one atomically.
+
+        Args:
+            catalogues: Catalogue name -> data from BaseRepository.export_catalogue().
+            entries: (key, remaining TTL in seconds, value) tuples from CacheBackend.export_entries().
+
+        Returns:
+            Size of the snapshot in bytes.
+        """
+        now = time.time()
+        index, blobs, offset = [], [], 0
+        for key, ttl, value in entries:
+            # Entries never read since the last restore are copied without decoding them
+            blob = bytes(value.raw) if isinstance(value, DeferredValue) else _encode(value)
+            index.append([key, now + ttl, offset, len(blob)])
+            blobs.append(blob)
+            offset += len(blob)
+
+        header = _encode(
+            {
+                "app_version": self.app_version,
+                "fingerprint": self.fingerprint,
+                "written_at": now,
+                "catalogues": catalogues,
+                "entries": index,
+            }
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temporary, "wb") as f:
+                f.write(_PREAMBLE.pack(_MAGIC, FORMAT_VERSION, len(header)))
+                f.write(header)
+                f.writelines(blobs)
+            os.replace(temporary, self.path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+            raise
+        size = _PREAMBLE.size + len(header) + offset
+        self.logger.info("Wrote snapshot with %s entries (%s bytes) to %s", len(index), size, self.path)
+        return size
+
+    def read(self) -> dict[str, Any] | None:
+        """Read the snapshot.
+
+        Returns:
+            Dict with ``catalogues`` (ages advanced to now) and ``entries``
+            ((key, remaining TTL, DeferredValue) tuples, expired ones dropped),
+            or None if there is no usable snapshot.
+        """
+        try:
+            buffer = _map(self.path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning("Could not open snapshot %s: %s", self.path, e)
+            return None
+
+        try:
+            magic, version, header_length = _PREAMBLE.unpack_from(buffer)
+            if magic != _MAGIC or version != FORMAT_VERSION:
+                self.logger.info("Ignoring snapshot %s with format version %s", self.path, version)
+                return None
+            header = json.loads(bytes(buffer[_PREAMBLE.size : _PREAMBLE.size + header_length]))
+            if header.get("app_version") != self.app_version or header.get("fingerprint") != self.fingerprint:
+                self.logger.info("Ignoring snapshot %s written by version %s", self.path, header.get("app_version"))
+                return None
+
+            now = time.time()
+            elapsed = max(now - header["written_at"], 0.0)
+            catalogues = header["catalogues"]
+            for catalogue in catalogues.values():
+                if catalogue.get("age") is not None:
+                    catalogue["age"] += elapsed
+
+            start = _PREAMBLE.size + header_length
+            if any(start + offset + length > len(buffer) for _, _, offset, length in header["entries"]):
+                raise ValueError("snapshot is truncated")
+            view = memoryview(buffer)
+            entries = [
+                (key, expires_at - now, DeferredValue(view[start + offset : start + offset + length]))
+                for key, expires_at, offset, length in header["entries"]
+                if expires_at > now
+            ]
+        except (struct.error, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.warning("Ignoring unreadable snapshot %s: %s", self.path, e)
+            return None
+        return {"catalogues": catalogues, "entries": entries, "age": elapsed}
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _map(path: Path) -> mmap.mmap | bytes:
+    """Map the file read-only, or read it where a mapping would block replacing it."""
+    # Windows cannot replace a file while it is mapped, which the next write needs to do
+    if sys.platform == "win32":
+        return path.read_bytes()
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return b""
@@ -0,0 +1,129 @@
+"""SQLite cache backend shared between worker processes."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from .base_cache import CacheBackend
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache stored in a SQLite file so several processes can share it.
+
+    The database runs in WAL mode, so readers in one worker never block on a
+    writer in another. Queries run in a worker thread with one connection per
+    thread so the event loop is not blocked on file locks.
+    """
+
+    # Trim expired and overflow rows once every this many writes
+    _EVICT_EVERY = 64
+
+    def __init__(self, path: str, default_ttl: float = 3600.0, max_entries: int = 1024):
+        """Initialize SQLite cache.
+
+        Args:
+            path: Database file path. Workers sharing a cache must use the same path.
+            default_ttl: Seconds an entry lives when set() is called without a TTL.
+            max_entries: Approximate maximum number of rows kept before evicting the oldest.
+        """
+        super().__init__(default_ttl, max_entries)
+        self.path = path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._writes = 0
+        self._connect().execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    async def get(self, key: str) -> Any | None:
+        """Get a cached value, or None if missing or expired."""
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, periodically evicting expired and oldest rows."""
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        await asyncio.to_thread(self._set_sync, key, json.dumps(value, ensure_ascii=False), expires_at)
+
+    async def count_present(self, keys: list[str]) -> int:
+        """Count live rows among the given keys with one query per chunk."""
+        return await asyncio.to_thread(self._count_present_sync, keys)
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        await asyncio.to_thread(self._execute, "DELETE FROM cache WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        """Remove all cached values."""
+        await asyncio.to_thread(self._execute, "DELETE FROM cache", ())
+
+    async def close(self) -> None:
+        """Close the connections opened by every thread."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def _get_sync(self, key: str) -> Any | None:
+        row = (
+            self._connect()
+            .execute("SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time()))
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def _count_present_sync(self, keys: list[str]) -> int:
+        connection = self._connect()
+        now = time.time()
+        count = 0
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            count += connection.execute(
+                f"SELECT COUNT(*) FROM cache WHERE key IN ({placeholders}) AND expires_at > ?", (*chunk, now)
+            ).fetchone()[0]
+        return count
+
+    def _set_sync(self, key: str, value: str, expires_at: float) -> None:
+        connection = self._connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+            (key, value, expires_at, time.time()),
+        )
+        self._writes += 1
+        if self._writes % self._EVICT_EVERY == 0:
+            self._evict_sync(connection)
+
+    def _evict_sync(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        connection.execute(
+            "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def _execute(self, sql: str, parameters: tuple) -> None:
+        self._connect().execute(sql, parameters)
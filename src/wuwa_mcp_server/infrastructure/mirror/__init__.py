@@ -0,0 +1,6 @@
+"""Offline mirror of the wiki catalogues."""
+
+from .content_store import MirrorStore
+from .mirror_api_client import MirrorAPIClient
+
+__all__ = ["MirrorAPIClient", "MirrorStore"]
@@ -0,0 +1,118 @@
+"""Local content store holding a full copy of the wiki catalogues."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ...core.logging_config import LoggerMixin
+from ..cache import canonical_json
+
+# Bump when the manifest layout changes; older manifests are then treated as absent
+MANIFEST_VERSION = 1
+
+
+class MirrorStore(LoggerMixin):
+    """Content-addressed store of entry details plus a manifest.
+
+    Each entry detail is stored once under the SHA-256 of its canonical JSON
+    encoding in ``entries/``. ``manifest.json`` holds both catalogues and maps
+    every entry ID to its content hash, the hash of the catalogue record it
+    was fetched for (None for strategy pages) and the strategy page it links
+    to. Entry files are written before the manifest and the manifest is
+    replaced atomically, so an interrupted sync leaves the previous mirror
+    intact.
+    """
+
+    def __init__(self, path: str):
+        """Initialize content store.
+
+        Args:
+            path: Store directory; created on the first write.
+        """
+        self.path = Path(path)
+        self.entries_path = self.path / "entries"
+        self.manifest_path = self.path / "manifest.json"
+
+    def load_manifest(self) -> dict[str, Any] | None:
+        """Read the manifest.
+
+        Returns:
+            Manifest, or None if the store has not been synced or was written
+            in another manifest version.
+        """
+        try:
+            manifest = json.loads(self.manifest_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            self.logger.warning(
+                "Ignoring mirror manifest %s with version %s", self.manifest_path, manifest.get("version")
+            )
+            return None
+        return manifest
+
+    def manifest_mtime(self) -> int | None:
+        """Modification time of the manifest in nanoseconds, or None if it does not exist."""
+        try:
+            return self.manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def write_manifest(self, manifest: dict[str, Any]) -> None:
+        """Replace the manifest atomically."""
+        self._write_atomic(self.manifest_path, canonical_json({**manifest, "version": MANIFEST_VERSION}))
+
+    def has_entry(self, digest: str) -> bool:
+        """Check whether the content with this hash is stored."""
+        return self._entry_path(digest).exists()
+
+    def read_entry(self, digest: str) -> dict[str, Any]:
+        """Read the entry detail stored under a content hash.
+
+        Raises:
+            FileNotFoundError: If no such content is stored.
+        """
+        return json.loads(self._entry_path(digest).read_bytes())
+
+    def write_entry(self, content: dict[str, Any]) -> str:
+        """Store an entry detail unless identical content is already stored.
+
+        Returns:
+            Content hash of the entry.
+        """
+        raw = canonical_json(content)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._entry_path(digest)
+        if not path.exists():
+            self._write_atomic(path, raw)
+        return digest
+
+    def prune(self, keep: set[str]) -> int:
+        """Delete stored entries whose hash is not in keep.
+
+        Returns:
+            Number of files deleted.
+        """
+        if not self.entries_path.exists():
+            return 0
+        removed = 0
+        for path in self.entries_path.glob("*.json"):
+            if path.stem not in keep:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.entries_path / f"{digest}.json"
+
+    def _write_atomic(self, path: Path, raw: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            temporary.write_bytes(raw)
+            os.replace(temporary, path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+            raise
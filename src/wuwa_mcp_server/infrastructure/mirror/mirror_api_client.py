@@ -0,0 +1,98 @@
+"""API client serving the Kuro API data from the local mirror."""
+
+import asyncio
+from typing import Any
+
+from ...core.exceptions import APIException
+from ...core.exceptions import DataNotFoundException
+from ...core.logging_config import LoggerMixin
+from .content_store import MirrorStore
+
+
+class MirrorAPIClient(LoggerMixin):
+    """Drop-in replacement for KuroAPIClient that never contacts the network.
+
+    Catalogues and entry details come from a MirrorStore filled by
+    ``wuwa-mcp-server sync``. The manifest is read on first use and read again
+    once a sync has replaced it, which a server that keeps running notices
+    by the manifest's modification time.
+    """
+
+    def __init__(self, store: MirrorStore):
+        """Initialize mirror API client.
+
+        Args:
+            store: Content store to serve from.
+        """
+        self.store = store
+        self._manifest: dict[str, Any] | None = None
+        self._manifest_mtime: int | None = None
+        self._manifest_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "MirrorAPIClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Async context manager exit."""
+        pass
+
+    async def fetch_character_list(self) -> list[dict[str, Any]]:
+        """Get the mirrored character catalogue.
+
+        Raises:
+            APIException: If the mirror has not been synced.
+        """
+        return (await self._get_manifest())["catalogues"]["characters"]
+
+    async def fetch_artifacts_list(self) -> list[dict[str, Any]]:
+        """Get the mirrored artifact catalogue.
+
+        Raises:
+            APIException: If the mirror has not been synced.
+        """
+        return (await self._get_manifest())["catalogues"]["artifacts"]
+
+    async def fetch_entry_detail(self, entry_id: str) -> dict[str, Any]:
+        """Get a mirrored entry detail by ID.
+
+        Args:
+            entry_id: The entry ID to read.
+
+        Returns:
+            Entry detail data.
+
+        Raises:
+            DataNotFoundException: If the entry is not in the mirror.
+            APIException: If the mirror has not been synced.
+        """
+        if not entry_id:
+            raise ValueError("Entry ID cannot be empty")
+
+        entry = (await self._get_manifest())["entries"].get(str(entry_id))
+        if entry is None:
+            raise DataNotFoundException("entry", entry_id)
+        try:
+            return await asyncio.to_thread(self.store.read_entry, entry["hash"])
+        except FileNotFoundError as e:
+            self.logger.error("Mirror entry %s is listed in the manifest but its content is missing", entry_id)
+            raise DataNotFoundException("entry", entry_id) from e
+
+    async def _get_manifest(self) -> dict[str, Any]:
+        mtime = self.store.manifest_mtime()
+        if self._manifest is None or mtime != self._manifest_mtime:
+            async with self._manifest_lock:
+                if self._manifest is None or mtime != self._manifest_mtime:
+                    manifest = await asyncio.to_thread(self.store.load_manifest)
+                    if manifest is None:
+                        raise APIException(
+                            f"Offline mirror at {self.store.path} has not been synced; run `wuwa-mcp-server sync`"
+                        )
+                    self.logger.info(
+                        "Serving offline mirror synced at %s with %s entries",
+                        manifest.get("synced_at"),
+                        len(manifest["entries"]),
+                    )
+                    self._manifest = manifest
+                    self._manifest_mtime = mtime
+        return self._manifest
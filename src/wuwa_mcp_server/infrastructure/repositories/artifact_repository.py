@@ -3,14 +3,20 @@
 from typing import Any
 
 from ...core.interfaces import ArtifactRepositoryProtocol
+from ...core.tracing import traced
 from ...domain.entities import Artifact
 from ...domain.value_objects import ArtifactId
+from ..cache import CacheBackend
 from .base_repository import BaseRepository
 
 
 class ArtifactRepository(BaseRepository, ArtifactRepositoryProtocol):
     """Repository for artifact data access."""
 
+    catalogue_name = "artifacts"
+    render_tools = ("artifact_info",)
+
+    @traced(attributes=("name",))
     async def find_by_name(self, name: str) -> dict[str, Any] | None:
         """Find artifact by name.
 
@@ -33,7 +39,7 @@ class ArtifactRepository(BaseRepository, ArtifactRepositoryProtocol):
             return detail_data
 
         except Exception as e:
-            self.logger.error(f"Failed to find artifact by name '{name}': {e}")
+            self.logger.error("Failed to find artifact by name '%s': %s", name, e)
             return None
 
     async def get_artifact_list(self) -> list[dict[str, Any]]:
@@ -45,6 +51,10 @@ class ArtifactRepository(BaseRepository, ArtifactRepositoryProtocol):
         Raises:
             APIException: If request fails.
         """
+        return await self._get_cached_catalogue(self._fetch_artifact_list)
+
+    async def _fetch_artifact_list(self) -> list[dict[str, Any]]:
+        """Fetch the artifact list from the API."""
         self.logger.info("Fetching artifact list from API")
         async with self.api_client:
             return await self.api_client.fetch_artifacts_list()
@@ -64,7 +74,11 @@ class ArtifactRepository(BaseRepository, ArtifactRepositoryProtocol):
         if not entry_id:
             raise ValueError("Entry ID cannot be empty")
 
-        self.logger.info(f"Fetching artifact detail for entry_id: {entry_id}")
+        return await self._get_cached_entry(entry_id, lambda: self._fetch_artifact_detail(entry_id))
+
+    async def _fetch_artifact_detail(self, entry_id: str) -> dict[str, Any] | None:
+        """Fetch artifact detail from the API."""
+        self.logger.debug("Fetching artifact detail for entry_id: %s", entry_id)
         async with self.api_client:
             return await self.api_client.fetch_entry_detail(entry_id)
 
@@ -118,7 +132,7 @@ class ArtifactRepository(BaseRepository, ArtifactRepositoryProtocol):
             return self.create_artifact_entity(name, entry_id, detail_data)
 
         except Exception as e:
-            self.logger.error(f"Failed to find artifact entity '{name}': {e}")
+            self.logger.error("Failed to find artifact entity '%s': %s", name, e)
             return None
 
     async def search_artifacts_by_echo_type(self, echo_type: str) -> list[dict[str, Any]]:
@@ -142,13 +156,17 @@ class ArtifactRepository(BaseRepository, ArtifactRepositoryProtocol):
 
 
 # Factory function
-def create_artifact_repository(api_client) -> ArtifactRepository:
+def create_artifact_repository(
+    api_client, catalogue_ttl: float = 0.0, cache: CacheBackend | None = None
+) -> ArtifactRepository:
     """Create artifact repository.
 
     Args:
         api_client: API client for data fetching.
+        catalogue_ttl: Seconds to cache the artifact list (0 disables caching).
+        cache: Optional cache backend for entry details.
 
     Returns:
         ArtifactRepository instance.
     """
-    return ArtifactRepository(api_client)
+    return ArtifactRepository(api_client, catalogue_ttl, cache)
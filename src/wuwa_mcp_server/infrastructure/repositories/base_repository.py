@@ -1,24 +1,72 @@
 """Base repository implementation."""
 
+import asyncio
+import time
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 
 from ...core.exceptions import DataNotFoundException
 from ...core.interfaces import BaseRepository as IBaseRepository
 from ...core.logging_config import LoggerMixin
+from ...core.metrics import CATALOGUE_CHANGES
+from ...core.metrics import CATALOGUE_FETCH_DURATION
+from ...core.metrics import record_cache_lookup
+from ...domain.value_objects import OutputFormat
+from ..cache import CacheBackend
+from ..cache import build_cache_key
+from ..cache import content_hash
+
+
+def record_key(item: dict[str, Any]) -> str:
+    """Stable identity of a catalogue record: its ID, else its entry ID, else its name."""
+    return str(item.get("id") or (item.get("content") or {}).get("linkId") or item.get("name", ""))
+
+
+@dataclass(frozen=True)
+class CatalogueDiff:
+    """Records added, removed and changed between two fetches of a catalogue."""
+
+    added: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[dict[str, Any]] = field(default_factory=list)
+    # (previous record, new record) pairs with the same key but different content
+    changed: list[tuple[dict[str, Any], dict[str, Any]]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
 
 
 class BaseRepository(IBaseRepository, LoggerMixin, ABC):
     """Base repository with common functionality."""
 
-    def __init__(self, api_client):
+    # Name of the catalogue in metrics and health reports
+    catalogue_name = "catalogue"
+    # Services' rendered-output tools keyed by this catalogue's names, invalidated when a record changes
+    render_tools: tuple[str, ...] = ()
+
+    def __init__(self, api_client, catalogue_ttl: float = 0.0, cache: CacheBackend | None = None):
         """Initialize repository with API client.
 
         Args:
             api_client: API client for data fetching.
+            catalogue_ttl: Seconds to keep the catalogue list in memory (0 disables caching).
+            cache: Cache backend for entry details. Details are not cached if None.
         """
         self.api_client = api_client
+        self.catalogue_ttl = catalogue_ttl
+        self.cache = cache
+        self._catalogue: list[dict[str, Any]] | None = None
+        self._catalogue_fetched_at: float | None = None
+        # Record key -> record and content hash, and lower-cased name -> record key,
+        # all updated per changed record when a new catalogue arrives
+        self._records: dict[str, dict[str, Any]] = {}
+        self._record_hashes: dict[str, str] = {}
+        self._name_index: dict[str, str] = {}
+        self._catalogue_lock = asyncio.Lock()
 
     @abstractmethod
     async def find_by_name(self, name: str) -> dict[str, Any] | None:
@@ -29,6 +77,224 @@ class BaseRepository(IBaseRepository, LoggerMixin, ABC):
         """Get all items. Must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement get_all method")
 
+    @property
+    def catalogue_age(self) -> float | None:
+        """Seconds since the cached catalogue was fetched, or None if not cached."""
+        if self._catalogue_fetched_at is None:
+            return None
+        return time.monotonic() - self._catalogue_fetched_at
+
+    @property
+    def catalogue_size(self) -> int:
+        """Number of entries in the cached catalogue (0 if not cached)."""
+        return len(self._catalogue) if self._catalogue is not None else 0
+
+    async def cache_coverage(self) -> tuple[int, int]:
+        """Count catalogue entries whose detail is in the entry cache.
+
+        Only the catalogue already held in memory is inspected; nothing is fetched.
+
+        Returns:
+            Tuple of (cached entries, catalogue entries).
+        """
+        if not self._catalogue:
+            return 0, 0
+        entry_ids = [item.get("content", {}).get("linkId") for item in self._catalogue]
+        keys = [build_cache_key("entry", entry_id) for entry_id in entry_ids if entry_id]
+        if self.cache is None:
+            return 0, len(keys)
+        return await self.cache.count_present(keys), len(keys)
+
+    async def warm_up(self) -> None:
+        """Pre-fetch the catalogue so the first lookup is served from memory."""
+        await self.get_all()
+
+    def invalidate_catalogue(self) -> None:
+        """Mark the cached catalogue stale so the next lookup refetches it.
+
+        The stale copy is kept so the refetched catalogue is diffed against it.
+        """
+        self._catalogue_fetched_at = None
+
+    def export_catalogue(self) -> dict[str, Any] | None:
+        """Cached catalogue and name index for a snapshot, or None if nothing is cached.
+
+        Returns:
+            Dict with the catalogue items, their name index and the catalogue age in seconds.
+        """
+        if self._catalogue is None:
+            return None
+        return {
+            "items": self._catalogue,
+            "name_index": self._name_index,
+            "hashes": self._record_hashes,
+            "age": self.catalogue_age,
+        }
+
+    def restore_catalogue(self, snapshot: dict[str, Any]) -> bool:
+        """Adopt a catalogue saved by export_catalogue() if it is still fresh.
+
+        Args:
+            snapshot: Saved catalogue; ``age`` must include the time since it was saved.
+
+        Returns:
+            True if the catalogue was restored.
+        """
+        age = snapshot.get("age")
+        if self.catalogue_ttl <= 0 or age is None or age >= self.catalogue_ttl:
+            return False
+        items = snapshot["items"]
+        self._catalogue = items
+        self._catalogue_fetched_at = time.monotonic() - age
+        self._records = {}
+        for item in items:
+            self._records.setdefault(record_key(item), item)
+        self._record_hashes = snapshot["hashes"]
+        self._name_index = snapshot["name_index"]
+        return True
+
+    async def _get_cached_catalogue(self, fetch: Callable[[], Awaitable[list[dict[str, Any]]]]) -> list[dict[str, Any]]:
+        """Return the catalogue list, fetching it only when missing or expired.
+
+        Concurrent callers share a single in-flight fetch.
+
+        Args:
+            fetch: Coroutine factory fetching the catalogue from the API.
+
+        Returns:
+            Catalogue list.
+        """
+        if self.catalogue_ttl <= 0:
+            return await self._fetch_catalogue(fetch)
+
+        if self._is_catalogue_fresh():
+            record_cache_lookup("catalogue", hit=True)
+            return self._catalogue
+
+        async with self._catalogue_lock:
+            if self._is_catalogue_fresh():
+                record_cache_lookup("catalogue", hit=True)
+                return self._catalogue
+            record_cache_lookup("catalogue", hit=False)
+            catalogue = await self._fetch_catalogue(fetch)
+            diff = self._apply_catalogue(catalogue)
+            await self._invalidate_changed(diff)
+            self.logger.debug("Cached catalogue with %s entries", len(catalogue))
+            return catalogue
+
+    def _apply_catalogue(self, catalogue: list[dict[str, Any]]) -> CatalogueDiff:
+        """Make a newly fetched catalogue current, updating the index per changed record.
+
+        Args:
+            catalogue: Catalogue items as fetched.
+
+        Returns:
+            Differences from the previous catalogue (all records are added on the first fetch).
+        """
+        if catalogue is self._catalogue:
+            # The HTTP client hands back the list decoded last time when the response bytes are unchanged
+            self._catalogue_fetched_at = time.monotonic()
+            return CatalogueDiff()
+
+        records: dict[str, dict[str, Any]] = {}
+        hashes: dict[str, str] = {}
+        for item in catalogue:
+            key = record_key(item)
+            if key not in records:
+                records[key] = item
+                hashes[key] = content_hash(item)
+
+        previous = self._records
+        diff = CatalogueDiff(
+            # In catalogue order, so the first of duplicate names gets the index key
+            added=[item for key, item in records.items() if key not in previous],
+            removed=[item for key, item in previous.items() if key not in records],
+            changed=[
+                (previous[key], item)
+                for key, item in records.items()
+                if key in previous and self._record_hashes[key] != hashes[key]
+            ],
+        )
+
+        for item in diff.removed + [old for old, _ in diff.changed]:
+            name = item.get("name", "").lower()
+            if self._name_index.get(name) == record_key(item):
+                del self._name_index[name]
+        for item in diff.added + [new for _, new in diff.changed]:
+            self._name_index.setdefault(item.get("name", "").lower(), record_key(item))
+
+        self._catalogue = catalogue
+        self._catalogue_fetched_at = time.monotonic()
+        self._records = records
+        self._record_hashes = hashes
+        if previous:
+            for change, count in (("added", diff.added), ("removed", diff.removed), ("changed", diff.changed)):
+                CATALOGUE_CHANGES.labels(self.catalogue_name, change).inc(len(count))
+            if diff:
+                self.logger.info(
+                    "Catalogue %s changed: %s added, %s removed, %s changed",
+                    self.catalogue_name,
+                    len(diff.added),
+                    len(diff.removed),
+                    len(diff.changed),
+                )
+        return diff
+
+    async def _invalidate_changed(self, diff: CatalogueDiff) -> None:
+        """Drop cached details and rendered output of removed and changed records.
+
+        Cached data of unchanged records stays valid.
+        """
+        if self.cache is None:
+            return
+        keys = set()
+        for item in diff.removed + [record for pair in diff.changed for record in pair]:
+            entry_id = (item.get("content") or {}).get("linkId")
+            if entry_id:
+                keys.add(build_cache_key("entry", entry_id))
+            for tool in self.render_tools:
+                for output_format in OutputFormat:
+                    keys.add(build_cache_key("render", tool, output_format.value, item.get("name", "")))
+        for key in keys:
+            await self.cache.delete(key)
+
+    async def _fetch_catalogue(self, fetch: Callable[[], Awaitable[list[dict[str, Any]]]]) -> list[dict[str, Any]]:
+        """Fetch the catalogue list, recording how long it took."""
+        with CATALOGUE_FETCH_DURATION.labels(self.catalogue_name).time():
+            return await fetch()
+
+    async def _get_cached_entry(
+        self, entry_id: str, fetch: Callable[[], Awaitable[dict[str, Any] | None]]
+    ) -> dict[str, Any] | None:
+        """Return an entry detail from the cache, fetching it on a miss.
+
+        Args:
+            entry_id: Entry ID.
+            fetch: Coroutine factory fetching the detail from the API.
+
+        Returns:
+            Entry detail data.
+        """
+        if self.cache is None:
+            return await fetch()
+
+        key = build_cache_key("entry", entry_id)
+        detail = await self.cache.get(key)
+        record_cache_lookup("entry", hit=detail is not None)
+        if detail is not None:
+            self.logger.debug("Entry cache hit for entry_id: %s", entry_id)
+            return detail
+
+        detail = await fetch()
+        if detail:
+            await self.cache.set(key, detail)
+        return detail
+
+    def _is_catalogue_fresh(self) -> bool:
+        """Check whether the cached catalogue exists and has not expired."""
+        age = self.catalogue_age
+        return self._catalogue is not None and age is not None and age < self.catalogue_ttl
+
     def _find_item_by_name(
         self,
         items: list[dict[str, Any]],
@@ -51,15 +317,22 @@ class BaseRepository(IBaseRepository, LoggerMixin, ABC):
         # Case-insensitive search
         name_lower = name.lower()
 
+        if items is self._catalogue:
+            key = self._name_index.get(name_lower)
+            if key is not None:
+                self.logger.debug("Found %s: %s", resource_type, self._records[key].get("name", ""))
+                return self._records[key]
+
+        # Index misses fall back to a scan, which also finds later duplicates of a removed name
         for item in items:
             item_name = item.get("name", "")
             if item_name.lower() == name_lower:
-                self.logger.debug(f"Found {resource_type}: {item_name}")
+                self.logger.debug("Found %s: %s", resource_type, item_name)
                 return item
 
         # Log available names for debugging
         available_names = [item.get("name", "N/A") for item in items[:10]]  # First 10 for logs
-        self.logger.warning(f"{resource_type} '{name}' not found. Available (first 10): {available_names}")
+        self.logger.warning("%s '%s' not found. Available (first 10): %s", resource_type, name, available_names)
 
         raise DataNotFoundException(resource_type, name)
 
@@ -81,7 +354,7 @@ class BaseRepository(IBaseRepository, LoggerMixin, ABC):
 
         if not entry_id:
             item_name = item.get("name", "Unknown")
-            self.logger.error(f"No entry ID found for {resource_type}: {item_name}")
+            self.logger.error("No entry ID found for %s: %s", resource_type, item_name)
             raise DataNotFoundException(f"{resource_type}_entry_id", item_name)
 
         return entry_id
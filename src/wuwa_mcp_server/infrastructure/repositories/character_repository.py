@@ -3,14 +3,20 @@
 from typing import Any
 
 from ...core.interfaces import CharacterRepositoryProtocol
+from ...core.tracing import traced
 from ...domain.entities import Character
 from ...domain.value_objects import CharacterId
+from ..cache import CacheBackend
 from .base_repository import BaseRepository
 
 
 class CharacterRepository(BaseRepository, CharacterRepositoryProtocol):
     """Repository for character data access."""
 
+    catalogue_name = "characters"
+    render_tools = ("character_info", "character_profile")
+
+    @traced(attributes=("name",))
     async def find_by_name(self, name: str) -> dict[str, Any] | None:
         """Find character by name.
 
@@ -33,7 +39,7 @@ class CharacterRepository(BaseRepository, CharacterRepositoryProtocol):
             return detail_data
 
         except Exception as e:
-            self.logger.error(f"Failed to find character by name '{name}': {e}")
+            self.logger.error("Failed to find character by name '%s': %s", name, e)
             return None
 
     async def get_character_list(self) -> list[dict[str, Any]]:
@@ -45,6 +51,10 @@ class CharacterRepository(BaseRepository, CharacterRepositoryProtocol):
         Raises:
             APIException: If request fails.
         """
+        return await self._get_cached_catalogue(self._fetch_character_list)
+
+    async def _fetch_character_list(self) -> list[dict[str, Any]]:
+        """Fetch the character list from the API."""
         self.logger.info("Fetching character list from API")
         async with self.api_client as client:
             return await client.fetch_character_list()
@@ -64,14 +74,17 @@ class CharacterRepository(BaseRepository, CharacterRepositoryProtocol):
         if not entry_id:
             raise ValueError("Entry ID cannot be empty")
 
-        self.logger.info(f"Fetching character detail for entry_id: {entry_id}")
+        return await self._get_cached_entry(entry_id, lambda: self._fetch_character_detail(entry_id))
+
+    async def _fetch_character_detail(self, entry_id: str) -> dict[str, Any] | None:
+        """Fetch character detail from the API."""
+        self.logger.debug("Fetching character detail for entry_id: %s", entry_id)
         async with self.api_client as client:
             return await client.fetch_entry_detail(entry_id)
 
     async def get_all(self) -> list[dict[str, Any]]:
         """Get all characters (alias for get_character_list)."""
-        async with self.api_client as client:
-            return await client.fetch_character_list()
+        return await self.get_character_list()
 
     def create_character_entity(self, name: str, entry_id: str, detail_data: dict[str, Any] | None = None) -> Character:
         """Create Character entity from data.
@@ -120,18 +133,22 @@ class CharacterRepository(BaseRepository, CharacterRepositoryProtocol):
             return self.create_character_entity(name, entry_id, detail_data)
 
         except Exception as e:
-            self.logger.error(f"Failed to find character entity '{name}': {e}")
+            self.logger.error("Failed to find character entity '%s': %s", name, e)
             return None
 
 
 # Factory function
-def create_character_repository(api_client) -> CharacterRepository:
+def create_character_repository(
+    api_client, catalogue_ttl: float = 0.0, cache: CacheBackend | None = None
+) -> CharacterRepository:
     """Create character repository.
 
     Args:
         api_client: API client for data fetching.
+        catalogue_ttl: Seconds to cache the character list (0 disables caching).
+        cache: Optional cache backend for entry details.
 
     Returns:
         CharacterRepository instance.
     """
-    return CharacterRepository(api_client)
+    return CharacterRepository(api_client, catalogue_ttl, cache)
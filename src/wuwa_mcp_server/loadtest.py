@@ -0,0 +1,416 @@
+"""Load generator for the streamable-HTTP transport.
+
+Drives a running server with a weighted mix of tool calls whose entities follow
+a Zipf-like popularity distribution, then reports throughput, latency
+percentiles, errors by kind and upstream call amplification (Kuro API requests
+per tool call, from the server's /metrics or the mock API's /_mock/stats).
+
+Two load models are available. By default ``--concurrency`` virtual users each
+send their next call as soon as the previous one returns (closed loop). With
+``--rate``, calls are started on a Poisson schedule regardless of how fast the
+server answers (open loop), and latency is measured from the scheduled start,
+so queueing in the server is not hidden.
+
+Usage:
+    python -m wuwa_mcp_server.loadtest --url http://127.0.0.1:8000/mcp --duration 60 --concurrency 32
+    python -m wuwa_mcp_server.loadtest --rate 50 --mix get_character_info=6,get_artifact_info=1 --json report.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import sys
+import time
+from collections import Counter
+from collections import defaultdict
+from typing import Any
+
+import httpx
+
+from . import __version__
+from .core.config import get_settings
+from .core.container import DIContainer
+
+TOOLS = ("get_character_info", "get_character_profile", "get_artifact_info")
+DEFAULT_MIX = "get_character_info=6,get_character_profile=2,get_artifact_info=2"
+
+_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+_METRIC_LINE = re.compile(r"^(?P<name>[a-zA-Z_:][\w:]*)(?:\{[^}]*\})?\s+(?P<value>\S+)$")
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse a ``tool=weight,...`` call mix.
+
+    Raises:
+        ValueError: If a tool is unknown or no weight is positive.
+    """
+    mix = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        tool, _, weight = item.partition("=")
+        if tool not in TOOLS:
+            raise ValueError(f"unknown tool {tool!r}, expected one of {', '.join(TOOLS)}")
+        mix[tool] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("the call mix needs at least one positive weight")
+    return mix
+
+
+def zipf_weights(count: int, exponent: float) -> list[float]:
+    """Weight of the entity at each popularity rank: ``1 / rank ** exponent``."""
+    return [1 / rank**exponent for rank in range(1, count + 1)]
+
+
+class Workload:
+    """Draws tool calls: the tool from the mix, the entity by Zipf popularity."""
+
+    def __init__(
+        self,
+        mix: dict[str, float],
+        characters: list[str],
+        artifacts: list[str],
+        exponent: float,
+        output_format: str,
+        seed: int,
+    ):
+        self.rng = random.Random(seed)
+        self.output_format = output_format
+        self.tools = [tool for tool, weight in mix.items() if weight > 0]
+        self.tool_weights = [mix[tool] for tool in self.tools]
+        # Popularity rank is independent of catalogue order
+        self.characters = self.rng.sample(characters, len(characters))
+        self.artifacts = self.rng.sample(artifacts, len(artifacts))
+        self.character_weights = list(itertools.accumulate(zipf_weights(len(characters), exponent)))
+        self.artifact_weights = list(itertools.accumulate(zipf_weights(len(artifacts), exponent)))
+
+    def next_call(self) -> tuple[str, dict[str, Any]]:
+        """Return the tool name and arguments of the next call."""
+        tool = self.rng.choices(self.tools, self.tool_weights)[0]
+        if tool == "get_artifact_info":
+            name = self.rng.choices(self.artifacts, cum_weights=self.artifact_weights)[0]
+            return tool, {"artifact_name": name, "output_format": self.output_format}
+        name = self.rng.choices(self.characters, cum_weights=self.character_weights)[0]
+        return tool, {"character_name": name, "output_format": self.output_format}
+
+
+class MCPSession:
+    """A minimal streamable-HTTP MCP client session."""
+
+    def __init__(self, client: httpx.AsyncClient, url: str):
+        self.client = client
+        self.url = url
+        self.headers = dict(_HEADERS)
+        self._ids = itertools.count(1)
+
+    async def initialize(self) -> None:
+        """Run the initialize handshake; the session ID is kept if the server issues one."""
+        response = await self.client.post(
+            self.url,
+            headers=self.headers,
+            json={
+                "jsonrpc": "2.0",
+                "id": next(self._ids),
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "wuwa-loadtest", "version": __version__},
+                },
+            },
+        )
+        response.raise_for_status()
+        if session_id := response.headers.get("mcp-session-id"):
+            self.headers["mcp-session-id"] = session_id
+        await self.client.post(
+            self.url, headers=self.headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"}
+        )
+
+    async def call_tool(self, tool: str, arguments: dict[str, Any]) -> str | None:
+        """Call a tool.
+
+        Returns:
+            None on success, otherwise the kind of error.
+        """
+        request_id = next(self._ids)
+        payload = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": tool, "arguments": arguments},
+        }
+        try:
+            response = await self.client.post(self.url, headers=self.headers, json=payload)
+        except httpx.TimeoutException:
+            return "timeout"
+        except httpx.HTTPError:
+            return "connection"
+        if response.status_code != 200:
+            return f"http_{response.status_code}"
+
+        message = self._find_response(response, request_id)
+        if message is None:
+            return "no_response"
+        if "error" in message:
+            return "rpc_error"
+        result = message.get("result", {})
+        if result.get("isError"):
+            return "tool_error"
+        text = "".join(item.get("text", "") for item in result.get("content", []))
+        if text.startswith("{") and '"error_type": "ServerBusyException"' in text:
+            return "busy"
+        return None
+
+    @staticmethod
+    def _find_response(response: httpx.Response, request_id: int) -> dict[str, Any] | None:
+        """Extract the JSON-RPC response from a JSON or server-sent events body."""
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            messages = [
+                json.loads(line[5:]) for line in response.text.splitlines() if line.startswith("data:") and line[5:]
+            ]
+        else:
+            body = response.json()
+            messages = body if isinstance(body, list) else [body]
+        return next((message for message in messages if message.get("id") == request_id), None)
+
+
+class Recorder:
+    """Collects per-call outcomes within the measurement window."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, Counter[str]] = defaultdict(Counter)
+        self.recording = False
+
+    def record(self, tool: str, latency: float, error: str | None) -> None:
+        if not self.recording:
+            return
+        if error is None:
+            self.latencies[tool].append(latency)
+        else:
+            self.errors[tool][error] += 1
+
+
+async def scrape_counters(client: httpx.AsyncClient, metrics_url: str, upstream_stats_url: str) -> dict[str, float]:
+    """Read the counters used for amplification.
+
+    Returns:
+        ``upstream_requests`` and, from /metrics, the retry and response byte
+        totals; empty if no source is configured or reachable.
+    """
+    try:
+        if upstream_stats_url:
+            response = await client.get(upstream_stats_url)
+            response.raise_for_status()
+            return {"upstream_requests": float(response.json()["requests"])}
+        if metrics_url:
+            response = await client.get(metrics_url)
+            response.raise_for_status()
+            totals: Counter[str] = Counter()
+            for line in response.text.splitlines():
+                match = _METRIC_LINE.match(line)
+                if match:
+                    totals[match["name"]] += float(match["value"])
+            return {
+                "upstream_requests": totals["wuwa_upstream_requests_total"],
+                "upstream_retries": totals["wuwa_upstream_retries_total"],
+                "upstream_bytes": totals["wuwa_upstream_response_bytes_total"],
+            }
+    except (httpx.HTTPError, ValueError, KeyError) as e:
+        print(f"warning: could not read upstream counters: {e}", file=sys.stderr)
+    return {}
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))]
+
+
+def summarize(latencies: list[float], errors: Counter[str], duration: float) -> dict[str, Any]:
+    """Summarize the outcomes of one tool (or all tools)."""
+    values = sorted(latencies)
+    calls = len(values) + sum(errors.values())
+    return {
+        "calls": calls,
+        "throughput_per_second": round(len(values) / duration, 2),
+        "error_rate": round(sum(errors.values()) / calls, 4) if calls else 0.0,
+        "errors": dict(errors),
+        "latency_ms": {
+            "mean": round(sum(values) / len(values) * 1e3, 2) if values else 0.0,
+            "p50": round(percentile(values, 0.50) * 1e3, 2),
+            "p95": round(percentile(values, 0.95) * 1e3, 2),
+            "p99": round(percentile(values, 0.99) * 1e3, 2),
+            "max": round(values[-1] * 1e3, 2) if values else 0.0,
+        },
+    }
+
+
+async def load_entity_names(characters: list[str], artifacts: list[str]) -> tuple[list[str], list[str]]:
+    """Fill in missing entity names from the configured Kuro API catalogues."""
+    if characters and artifacts:
+        return characters, artifacts
+    container = DIContainer()
+    api_client = container.get_kuro_api_client()
+    try:
+        async with api_client:
+            if not characters:
+                characters = [record["name"] for record in await api_client.fetch_character_list()]
+            if not artifacts:
+                artifacts = [record["name"] for record in await api_client.fetch_artifacts_list()]
+    finally:
+        await container.cleanup()
+    return characters, artifacts
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test described by the parsed arguments.
+
+    Returns:
+        The report as a JSON-serializable dict.
+    """
+    characters, artifacts = await load_entity_names(args.characters, args.artifacts)
+    mix = parse_mix(args.mix)
+    if not characters and any(tool != "get_artifact_info" for tool in mix if mix[tool] > 0):
+        raise SystemExit("no character names: pass --characters or point KURO_API_BASE_URL at a reachable API")
+    if not artifacts and mix.get("get_artifact_info", 0) > 0:
+        raise SystemExit("no artifact names: pass --artifacts or point KURO_API_BASE_URL at a reachable API")
+
+    workload = Workload(mix, characters, artifacts, args.zipf, args.output_format, args.seed)
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    metrics_url = args.metrics_url if args.metrics_url is not None else args.url.rsplit("/", 1)[0] + "/metrics"
+
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        sessions = [MCPSession(client, args.url) for _ in range(args.concurrency)]
+        await asyncio.gather(*(session.initialize() for session in sessions))
+
+        async def timed_call(session: MCPSession, scheduled: float) -> None:
+            tool, arguments = workload.next_call()
+            error = await session.call_tool(tool, arguments)
+            recorder.record(tool, time.perf_counter() - scheduled, error)
+
+        async def virtual_user(session: MCPSession, deadline: float) -> None:
+            while time.perf_counter() < deadline:
+                await timed_call(session, time.perf_counter())
+
+        async def open_loop(deadline: float) -> None:
+            arrivals = random.Random(args.seed + 1)
+            pending: set[asyncio.Task] = set()
+            next_start = time.perf_counter()
+            for session in itertools.cycle(sessions):
+                next_start += arrivals.expovariate(args.rate)
+                if next_start >= deadline:
+                    break
+                await asyncio.sleep(max(0.0, next_start - time.perf_counter()))
+                task = asyncio.create_task(timed_call(session, next_start))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+
+        async def drive(seconds: float) -> None:
+            deadline = time.perf_counter() + seconds
+            if args.rate:
+                await open_loop(deadline)
+            else:
+                await asyncio.gather(*(virtual_user(session, deadline) for session in sessions))
+
+        if args.warmup > 0:
+            await drive(args.warmup)
+
+        before = await scrape_counters(client, metrics_url, args.upstream_stats)
+        recorder.recording = True
+        started = time.perf_counter()
+        await drive(args.duration)
+        elapsed = time.perf_counter() - started
+        recorder.recording = False
+        after = await scrape_counters(client, metrics_url, args.upstream_stats)
+
+    all_latencies = [latency for latencies in recorder.latencies.values() for latency in latencies]
+    all_errors: Counter[str] = sum(recorder.errors.values(), Counter())
+    report: dict[str, Any] = {
+        "url": args.url,
+        "load_model": f"open loop at {args.rate}/s" if args.rate else f"closed loop, {args.concurrency} users",
+        "duration_seconds": round(elapsed, 2),
+        "entities": {"characters": len(characters), "artifacts": len(artifacts), "zipf_exponent": args.zipf},
+        "total": summarize(all_latencies, all_errors, elapsed),
+        "tools": {
+            tool: summarize(recorder.latencies[tool], recorder.errors[tool], elapsed)
+            for tool in TOOLS
+            if tool in recorder.latencies or tool in recorder.errors
+        },
+    }
+    calls = report["total"]["calls"]
+    if before and after and calls:
+        upstream = {key: round(after[key] - before[key], 2) for key in after if key in before}
+        upstream["requests_per_call"] = round(upstream["upstream_requests"] / calls, 3)
+        report["upstream"] = upstream
+    return report
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print the report as a table."""
+    total = report["total"]
+    print(f"{report['url']}: {report['load_model']}, {report['duration_seconds']} s")
+    print(
+        f"{'tool':<24} {'calls':>7} {'ok/s':>8} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for tool, summary in [*report["tools"].items(), ("total", total)]:
+        latency = summary["latency_ms"]
+        print(
+            f"{tool:<24} {summary['calls']:>7} {summary['throughput_per_second']:>8.1f} "
+            f"{summary['error_rate']:>7.2%} {latency['p50']:>9.1f} {latency['p95']:>9.1f} "
+            f"{latency['p99']:>9.1f} {latency['max']:>9.1f}"
+        )
+    if total["errors"]:
+        print("errors: " + ", ".join(f"{kind}={count}" for kind, count in sorted(total["errors"].items())))
+    if "upstream" in report:
+        upstream = report["upstream"]
+        print(
+            f"upstream: {upstream['upstream_requests']:.0f} requests, "
+            f"{upstream['requests_per_call']:.3f} per tool call"
+            + (f", {upstream['upstream_retries']:.0f} retries" if "upstream_retries" in upstream else "")
+        )
+    else:
+        print("upstream: amplification unavailable (no /metrics or --upstream-stats)")
+
+
+def main() -> None:
+    """Command-line entry point."""
+    server = get_settings().server
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=f"http://{server.host}:{server.port}{server.http_path}", help="MCP endpoint")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="unmeasured seconds before the measurement")
+    parser.add_argument("--concurrency", type=int, default=16, help="virtual users (closed loop) or sessions")
+    parser.add_argument("--rate", type=float, default=0.0, help="open loop: calls started per second")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="tool weights, e.g. get_character_info=6,...")
+    parser.add_argument("--zipf", type=float, default=1.1, help="popularity exponent (0 = uniform)")
+    parser.add_argument("--output-format", default="markdown", choices=["markdown", "compact", "json"])
+    parser.add_argument("--characters", nargs="*", default=[], help="character names (default: API catalogue)")
+    parser.add_argument("--artifacts", nargs="*", default=[], help="artifact set names (default: API catalogue)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-call timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--metrics-url", default=None, help="server /metrics URL ('' to disable)")
+    parser.add_argument("--upstream-stats", default="", help="mock Kuro API /_mock/stats URL, counts all workers")
+    parser.add_argument("--json", default=None, help="also write the report to this file")
+    args = parser.parse_args()
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.concurrency < 1 or args.duration <= 0 or args.rate < 0:
+        parser.error("--concurrency and --duration must be positive and --rate non-negative")
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
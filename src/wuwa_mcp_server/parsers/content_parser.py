@@ -4,6 +4,8 @@ from typing import Any
 
 from ..core.exceptions import ParsingException
 from ..core.logging_config import LoggerMixin
+from ..core.metrics import PARSE_DURATION
+from ..core.tracing import traced
 from ..domain.value_objects import ContentType
 from .html_converter import HTMLToMarkdownConverter
 from .strategies import ArtifactStrategy
@@ -34,7 +36,7 @@ class StrategyBasedContentParser(LoggerMixin):
             ArtifactStrategy(self.html_converter),
             StrategyContentStrategy(self.html_converter),
         ]
-        self.logger.info(f"Registered {len(self.strategies)} parsing strategies")
+        self.logger.info("Registered %s parsing strategies", len(self.strategies))
 
     def register_strategy(self, strategy: BaseParsingStrategy) -> None:
         """Register a new parsing strategy.
@@ -43,8 +45,9 @@ class StrategyBasedContentParser(LoggerMixin):
             strategy: Strategy to register.
         """
         self.strategies.append(strategy)
-        self.logger.info(f"Registered strategy: {strategy.__class__.__name__}")
+        self.logger.debug("Registered strategy: %s", strategy.__class__.__name__)
 
+    @traced()
     def parse_main_content(self, content_data: dict[str, Any]) -> dict[str, Any]:
         """Parse main content with automatic strategy selection.
 
@@ -58,13 +61,13 @@ class StrategyBasedContentParser(LoggerMixin):
             ParsingException: If parsing fails.
         """
         try:
-            self.logger.info("Parsing main content")
+            self.logger.debug("Parsing main content")
 
             # Determine which strategies to use based on content
             modules_data = content_data.get("modules", [])
             module_types = [module.get("title", "") for module in modules_data]
 
-            self.logger.debug(f"Found module types: {module_types}")
+            self.logger.debug("Found module types: %s", module_types)
 
             # Use multi-strategy approach for main content
             strategies_to_use = self._select_strategies_for_main_content(module_types)
@@ -72,9 +75,10 @@ class StrategyBasedContentParser(LoggerMixin):
             return self._parse_with_strategies(content_data, strategies_to_use)
 
         except Exception as e:
-            self.logger.error(f"Failed to parse main content: {e}")
+            self.logger.error("Failed to parse main content: %s", e)
             raise ParsingException(f"Main content parsing failed: {e}")
 
+    @traced()
     def parse_character_profile(self, content_data: dict[str, Any]) -> dict[str, Any]:
         """Parse character profile content.
 
@@ -88,19 +92,20 @@ class StrategyBasedContentParser(LoggerMixin):
             ParsingException: If parsing fails.
         """
         try:
-            self.logger.info("Parsing character profile")
+            self.logger.debug("Parsing character profile")
 
             # Use only profile strategy
             profile_strategy = self._find_strategy(CharacterProfileStrategy)
             if not profile_strategy:
                 raise ParsingException("Character profile strategy not found")
 
-            return profile_strategy.parse(content_data)
+            return self._run_strategy(profile_strategy, content_data)
 
         except Exception as e:
-            self.logger.error(f"Failed to parse character profile: {e}")
+            self.logger.error("Failed to parse character profile: %s", e)
             raise ParsingException(f"Character profile parsing failed: {e}")
 
+    @traced()
     def parse_strategy_content(self, content_data: dict[str, Any]) -> dict[str, Any]:
         """Parse strategy content without module filtering.
 
@@ -114,19 +119,20 @@ class StrategyBasedContentParser(LoggerMixin):
             ParsingException: If parsing fails.
         """
         try:
-            self.logger.info("Parsing strategy content")
+            self.logger.debug("Parsing strategy content")
 
             # Use strategy content parser
             strategy_parser = self._find_strategy(StrategyContentStrategy)
             if not strategy_parser:
                 raise ParsingException("Strategy content parser not found")
 
-            return strategy_parser.parse(content_data)
+            return self._run_strategy(strategy_parser, content_data)
 
         except Exception as e:
-            self.logger.error(f"Failed to parse strategy content: {e}")
+            self.logger.error("Failed to parse strategy content: %s", e)
             raise ParsingException(f"Strategy content parsing failed: {e}")
 
+    @traced()
     def parse_artifact_content(self, content_data: dict[str, Any]) -> dict[str, Any]:
         """Parse artifact content.
 
@@ -140,17 +146,17 @@ class StrategyBasedContentParser(LoggerMixin):
             ParsingException: If parsing fails.
         """
         try:
-            self.logger.info("Parsing artifact content")
+            self.logger.debug("Parsing artifact content")
 
             # Use artifact strategy
             artifact_strategy = self._find_strategy(ArtifactStrategy)
             if not artifact_strategy:
                 raise ParsingException("Artifact strategy not found")
 
-            return artifact_strategy.parse(content_data)
+            return self._run_strategy(artifact_strategy, content_data)
 
         except Exception as e:
-            self.logger.error(f"Failed to parse artifact content: {e}")
+            self.logger.error("Failed to parse artifact content: %s", e)
             raise ParsingException(f"Artifact content parsing failed: {e}")
 
     def _select_strategies_for_main_content(self, module_types: list[str]) -> list[BaseParsingStrategy]:
@@ -185,7 +191,7 @@ class StrategyBasedContentParser(LoggerMixin):
             if general_strategy:
                 selected_strategies.append(general_strategy)
 
-        self.logger.debug(f"Selected {len(selected_strategies)} strategies for main content")
+        self.logger.debug("Selected %s strategies for main content", len(selected_strategies))
         return selected_strategies
 
     def _find_strategy(self, strategy_class: type) -> BaseParsingStrategy | None:
@@ -202,6 +208,19 @@ class StrategyBasedContentParser(LoggerMixin):
                 return strategy
         return None
 
+    def _run_strategy(self, strategy: BaseParsingStrategy, content_data: dict[str, Any]) -> dict[str, Any]:
+        """Run one strategy, recording its parse time.
+
+        Args:
+            strategy: Strategy to run.
+            content_data: Raw content data.
+
+        Returns:
+            Parsed content.
+        """
+        with PARSE_DURATION.labels(strategy.__class__.__name__).time():
+            return strategy.parse(content_data)
+
     def _parse_with_strategies(
         self, content_data: dict[str, Any], strategies: list[BaseParsingStrategy]
     ) -> dict[str, Any]:
@@ -223,7 +242,7 @@ class StrategyBasedContentParser(LoggerMixin):
 
         for strategy in strategies:
             try:
-                result = strategy.parse(content_data)
+                result = self._run_strategy(strategy, content_data)
 
                 # Merge modules from this strategy
                 strategy_modules = result.get("modules", {})
@@ -246,7 +265,7 @@ class StrategyBasedContentParser(LoggerMixin):
                         merged_result["modules"][module_name]["components"] = existing_components
 
             except Exception as e:
-                self.logger.warning(f"Strategy {strategy.__class__.__name__} failed: {e}")
+                self.logger.warning("Strategy %s failed: %s", strategy.__class__.__name__, e)
                 continue
 
         return merged_result
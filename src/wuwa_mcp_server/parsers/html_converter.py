@@ -9,6 +9,7 @@ from bs4 import NavigableString
 from ..core.exceptions import HTMLParsingException
 from ..core.interfaces import BaseHTMLConverter
 from ..core.logging_config import LoggerMixin
+from ..core.tracing import traced
 
 
 class HTMLToMarkdownConverter(BaseHTMLConverter, LoggerMixin):
@@ -39,7 +40,7 @@ class HTMLToMarkdownConverter(BaseHTMLConverter, LoggerMixin):
             return markdown.strip()
 
         except Exception as e:
-            self.logger.error(f"HTML parsing failed: {e}")
+            self.logger.error("HTML parsing failed: %s", e)
             raise HTMLParsingException(
                 f"Failed to convert HTML to markdown: {e}",
                 html_content=html_content[:500],  # Only log first 500 chars
@@ -73,9 +74,10 @@ class HTMLToMarkdownConverter(BaseHTMLConverter, LoggerMixin):
             return tables
 
         except Exception as e:
-            self.logger.error(f"Table extraction failed: {e}")
+            self.logger.error("Table extraction failed: %s", e)
             raise HTMLParsingException(f"Failed to extract tables from HTML: {e}", html_content=html_content[:500])
 
+    @traced()
     def parse_html_content(self, html_content: str) -> dict[str, Any]:
         """Parse HTML content and return both markdown and table data.
 
@@ -97,7 +99,7 @@ class HTMLToMarkdownConverter(BaseHTMLConverter, LoggerMixin):
         except HTMLParsingException:
             raise
         except Exception as e:
-            self.logger.error(f"HTML content parsing failed: {e}")
+            self.logger.error("HTML content parsing failed: %s", e)
             return {"markdown_content": f"<error>Failed to parse HTML: {e!s}</error>", "tables": []}
 
     def _convert_tag_to_markdown(self, tag: Any) -> str:
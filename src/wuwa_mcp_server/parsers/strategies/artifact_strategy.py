@@ -123,7 +123,7 @@ class ArtifactStrategy(BaseParsingStrategy):
             return {"title": component_title, "data": component_data} if component_data else None
 
         except Exception as e:
-            self.logger.error(f"Failed to parse artifact component '{component_title}': {e}")
+            self.logger.error("Failed to parse artifact component '%s': %s", component_title, e)
             return None
 
     def extract_set_effects(self, component_data: dict[str, Any]) -> list[dict[str, str]]:
@@ -164,7 +164,7 @@ class ArtifactStrategy(BaseParsingStrategy):
                                 set_effects.append({"piece_info": piece_info, "effect_description": effect_desc})
 
         except Exception as e:
-            self.logger.warning(f"Failed to extract set effects: {e}")
+            self.logger.warning("Failed to extract set effects: %s", e)
 
         return set_effects
 
@@ -205,7 +205,7 @@ class ArtifactStrategy(BaseParsingStrategy):
                                             echo_types.append(cell.strip())
 
         except Exception as e:
-            self.logger.warning(f"Failed to extract echo types: {e}")
+            self.logger.warning("Failed to extract echo types: %s", e)
 
         # Remove duplicates and return
         return list(set(echo_types))
@@ -116,7 +116,7 @@ class CharacterDataStrategy(BaseParsingStrategy):
             return {"title": title, "data": component_data}
 
         except Exception as e:
-            self.logger.error(f"Failed to parse character data component: {e}")
+            self.logger.error("Failed to parse character data component: %s", e)
             return None
 
 
@@ -224,7 +224,7 @@ class CharacterProfileStrategy(BaseParsingStrategy):
             return {"title": component_title, "data": component_data} if component_data else None
 
         except Exception as e:
-            self.logger.error(f"Failed to parse general component: {e}")
+            self.logger.error("Failed to parse general component: %s", e)
             return None
 
 
@@ -349,5 +349,5 @@ class CharacterDevelopmentStrategy(BaseParsingStrategy):
             return {"title": component_title, "data": component_data} if component_data else None
 
         except Exception as e:
-            self.logger.error(f"Failed to parse development component '{component_title}': {e}")
+            self.logger.error("Failed to parse development component '%s': %s", component_title, e)
             return None
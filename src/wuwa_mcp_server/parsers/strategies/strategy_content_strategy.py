@@ -126,5 +126,5 @@ class StrategyContentStrategy(BaseParsingStrategy):
                 return None
 
         except Exception as e:
-            self.logger.error(f"Failed to parse strategy component '{component_title}': {e}")
+            self.logger.error("Failed to parse strategy component '%s': %s", component_title, e)
             return None
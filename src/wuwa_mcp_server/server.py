@@ -1,101 +1,310 @@
+import argparse
 import asyncio
+import contextlib
+import json
+import logging
 import os
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.responses import Response
 
-try:
-    from smithery.decorators import smithery
-
-    SMITHERY_AVAILABLE = True
-except ImportError:
-    SMITHERY_AVAILABLE = False
-
+from . import __version__
 from .core import DIContainer
 from .core import get_container
+from .core import setup_logging
+from .core.config import get_settings
 from .core.exceptions import DataNotFoundException
+from .core.exceptions import ServerBusyException
 from .core.exceptions import ServiceException
+from .core.exceptions import ValidationException
+from .core.exceptions import WuWaException
+from .core.logging_config import get_logger
+from .core.metrics import ADMISSION_IN_FLIGHT
+from .core.metrics import ADMISSION_QUEUE_DEPTH
+from .core.metrics import REGISTRY
+from .core.metrics import TOOL_CALL_DURATION
+from .core.metrics import TOOL_CALLS
+from .core.metrics import UPSTREAM_IN_FLIGHT
+from .core.profiling import get_call_profiler
+from .core.tracing import get_tracer
+from .domain.value_objects import OutputFormat
+from .web import CompressionMiddleware
+from .web import ETagMiddleware
+from .web import JSONRPCBatchMiddleware
+from .web import StatelessTeardownFilter
 
 # Global container for dependency injection
 container: DIContainer | None = None
 
 
-def get_services():
-    """Get service instances from the DI container."""
+def get_app_container() -> DIContainer:
+    """Get the DI container used by the server."""
     global container
     if container is None:
-        container = get_container()
+        # Built from the shared settings so command-line overrides apply
+        container = get_container(get_settings())
+    return container
 
-    character_service = container.get_character_service()
-    artifact_service = container.get_artifact_service()
+
+def get_services():
+    """Get service instances from the DI container."""
+    app_container = get_app_container()
+    character_service = app_container.get_character_service()
+    artifact_service = app_container.get_artifact_service()
     return character_service, artifact_service
 
 
+def get_pagination_service():
+    """Get the pagination service from the DI container."""
+    return get_app_container().get_pagination_service()
+
+
+async def paginate_tool_output(
+    tool_name: str,
+    entity_name: str,
+    output_format: str,
+    cursor: str,
+    max_page_tokens: int,
+    render,
+) -> str:
+    """Serve a page of tool output.
+
+    A cursor is answered from the cached pages without calling ``render``. JSON
+    output is returned whole since splitting it would break the document. Other
+    calls go through admission control; a rejected call gets a structured busy
+    error with a retry-after hint instead of queueing indefinitely.
+
+    Args:
+        tool_name: Name of the tool being called.
+        entity_name: Queried character or artifact name.
+        output_format: Requested output format.
+        cursor: Cursor from a previous page, or empty for the first page.
+        max_page_tokens: Per-call approximate token budget (0 uses server settings).
+        render: Coroutine factory producing the full document.
+
+    Returns:
+        Requested page of the rendered document, or a JSON busy error.
+    """
+    # Sampled calls run under cProfile; the root span supplies their stage timings
+    async with get_call_profiler().profile(tool_name, entity_name) as call_profile:
+        # Root span of the call's trace; spans opened by tasks and worker threads attach to it
+        with get_tracer().span(
+            f"tool.{tool_name}", entity=entity_name, format=output_format, cursor=bool(cursor)
+        ) as span:
+            if call_profile is not None:
+                call_profile.span = span
+            started = time.perf_counter()
+            outcome = "error"
+            pagination_service = get_pagination_service()
+            try:
+                if cursor:
+                    page = await pagination_service.get_page(cursor)
+                    outcome = "ok"
+                    return page
+
+                app_container = get_app_container()
+                # Track the call (queued or running) so shutdown drains it before the pool is closed
+                async with app_container.inflight.track(), app_container.get_admission_controller().admit():
+                    if str(output_format).strip().lower() == OutputFormat.JSON.value:
+                        output = await render()
+                    else:
+                        output = await pagination_service.paginate(
+                            f"{tool_name}:{entity_name}:{output_format}", render, max_page_tokens
+                        )
+                outcome = "ok"
+                return output
+            except ServerBusyException as e:
+                outcome = "busy"
+                return json.dumps(e.to_dict(), ensure_ascii=False)
+            finally:
+                TOOL_CALLS.labels(tool_name, outcome).inc()
+                TOOL_CALL_DURATION.labels(tool_name).observe(time.perf_counter() - started)
+                if span is not None:
+                    span.set_attribute("outcome", outcome)
+
+
+async def startup_resources(background_warm_up: bool = False):
+    """Build services, open the connection pool and warm caches.
+
+    Args:
+        background_warm_up: Warm caches in the background (HTTP mode), so health
+            probes are answered while /readyz still reports not ready.
+    """
+    await get_app_container().startup(background=background_warm_up)
+
+
 async def cleanup_resources():
-    """Clean up resources when server shuts down."""
+    """Drain in-flight calls and release resources when the server shuts down."""
     global container
     if container:
-        await container.cleanup()
+        await container.shutdown()
+
+
+@asynccontextmanager
+async def mcp_lifespan(server: FastMCP) -> AsyncIterator[DIContainer]:
+    """FastMCP lifespan hook.
+
+    FastMCP enters this once per stdio run but once per session over HTTP, so it
+    only starts resources (idempotently). Over HTTP the ASGI lifespan owns
+    startup and shutdown. In stdio mode, where clients spawn a process per
+    session, resources start in the background so the initialize response is
+    not held up; a tool call arriving first builds what it needs itself. The
+    end of this context is then the end of the process.
+    """
+    if get_settings().server.transport.lower() == "http":
+        await startup_resources()
+        yield get_app_container()
+        return
+
+    startup = asyncio.create_task(startup_resources())
+    startup.add_done_callback(_log_startup_failure)
+    try:
+        yield get_app_container()
+    finally:
+        startup.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await startup
+        await cleanup_resources()
+
+
+def _log_startup_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        get_logger("server").warning("Background startup failed: %s", task.exception())
+
+
+def with_resource_lifespan(app):
+    """Wrap a Starlette app's lifespan with resource startup and shutdown.
+
+    The connection pool and services are ready before the first request is
+    accepted; cache warm-up continues in the background. On shutdown,
+    in-flight tool calls are drained before the wrapped lifespan (the MCP
+    session manager) stops and the connection pool is closed.
+
+    Args:
+        app: Starlette application created by FastMCP.
+
+    Returns:
+        The same application, with its lifespan wrapped.
+    """
+    wrapped_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_instance) -> AsyncIterator[None]:
+        await startup_resources(background_warm_up=True)
+        try:
+            async with wrapped_lifespan(app_instance):
+                yield
+                await get_app_container().inflight.wait_idle(get_settings().server.shutdown_timeout)
+        finally:
+            await cleanup_resources()
+
+    app.router.lifespan_context = lifespan
+    return app
 
 
 def _create_base_server():
     """Create the base MCP server with all tools."""
-    mcp = FastMCP("wuwa-mcp-server")
+    mcp = FastMCP("wuwa-mcp-server", lifespan=mcp_lifespan)
+    # FastMCP has no version argument; report our own version in serverInfo instead of the SDK's
+    mcp._mcp_server.version = __version__
 
     @mcp.tool()
-    async def get_artifact_info(artifact_name: str) -> str:
+    async def get_artifact_info(
+        artifact_name: str, output_format: str = "markdown", cursor: str = "", max_page_tokens: int = 0
+    ) -> str:
         """获取库街区上的声骸详细信息并以 Markdown 格式返回。
 
         Args:
             artifact_name: 要查询的声骸套装的中文名称。
+            output_format: 输出格式: "markdown" (默认)、"compact" (精简 Markdown) 或 "json" (紧凑的模块/组件/表格结构)。
+            cursor: 上一页返回的 next_cursor, 用于获取后续分页 (无需重新查询)。
+            max_page_tokens: 每页的近似 token 上限, 0 表示使用服务器默认设置。
 
         Returns:
-            包含声骸信息的 Markdown 字符串，
+            包含声骸信息的 Markdown 或 JSON 字符串,
             或者在找不到声骸或获取数据失败时返回错误消息。
         """
         try:
             _, artifact_service = get_services()
-            return await artifact_service.get_artifact_info(artifact_name)
-        except (DataNotFoundException, ServiceException) as e:
+            return await paginate_tool_output(
+                "get_artifact_info",
+                artifact_name,
+                output_format,
+                cursor,
+                max_page_tokens,
+                lambda: artifact_service.get_artifact_info(artifact_name, output_format),
+            )
+        except (DataNotFoundException, ServiceException, ValidationException) as e:
             # These exceptions already have user-friendly messages
             return str(e)
         except Exception:
             return f"错误：处理 '{artifact_name}' 时发生意外错误。请检查服务器日志。"
 
     @mcp.tool()
-    async def get_character_info(character_name: str) -> str:
+    async def get_character_info(
+        character_name: str, output_format: str = "markdown", cursor: str = "", max_page_tokens: int = 0
+    ) -> str:
         """获取库街区上的角色详细信息包括角色技能，养成攻略等，并以 Markdown 格式返回。
 
         Args:
             character_name: 要查询的角色的中文名称。
+            output_format: 输出格式: "markdown" (默认)、"compact" (精简 Markdown) 或 "json" (紧凑的模块/组件/表格结构)。
+            cursor: 上一页返回的 next_cursor, 用于获取后续分页 (无需重新查询)。
+            max_page_tokens: 每页的近似 token 上限, 0 表示使用服务器默认设置。
 
         Returns:
-            包含角色信息的 Markdown 字符串，
+            包含角色信息的 Markdown 或 JSON 字符串,
             或者在找不到角色或获取数据失败时返回错误消息。
         """
         try:
             character_service, _ = get_services()
-            return await character_service.get_character_info(character_name)
-        except (DataNotFoundException, ServiceException) as e:
+            return await paginate_tool_output(
+                "get_character_info",
+                character_name,
+                output_format,
+                cursor,
+                max_page_tokens,
+                lambda: character_service.get_character_info(character_name, output_format),
+            )
+        except (DataNotFoundException, ServiceException, ValidationException) as e:
             # These exceptions already have user-friendly messages
             return str(e)
         except Exception:
             return f"错误：处理 '{character_name}' 时发生意外错误。请检查服务器日志。"
 
     @mcp.tool()
-    async def get_character_profile(character_name: str) -> str:
+    async def get_character_profile(
+        character_name: str, output_format: str = "markdown", cursor: str = "", max_page_tokens: int = 0
+    ) -> str:
         """获取库街区上的角色档案信息并以 Markdown 格式返回。
 
         Args:
             character_name: 要查询的角色的中文名称。
+            output_format: 输出格式: "markdown" (默认)、"compact" (精简 Markdown) 或 "json" (紧凑的模块/组件/表格结构)。
+            cursor: 上一页返回的 next_cursor, 用于获取后续分页 (无需重新查询)。
+            max_page_tokens: 每页的近似 token 上限, 0 表示使用服务器默认设置。
 
         Returns:
-            包含角色档案信息的 Markdown 字符串，
+            包含角色档案信息的 Markdown 或 JSON 字符串,
             或者在找不到角色或获取数据失败时返回错误消息。
         """
         try:
             character_service, _ = get_services()
-            return await character_service.get_character_profile(character_name)
-        except (DataNotFoundException, ServiceException) as e:
+            return await paginate_tool_output(
+                "get_character_profile",
+                character_name,
+                output_format,
+                cursor,
+                max_page_tokens,
+                lambda: character_service.get_character_profile(character_name, output_format),
+            )
+        except (DataNotFoundException, ServiceException, ValidationException) as e:
             # These exceptions already have user-friendly messages
             return str(e)
         except Exception:
@@ -104,144 +313,276 @@ def _create_base_server():
     return mcp
 
 
-# Create the Smithery-decorated server if available
-if SMITHERY_AVAILABLE:
+def create_server(config=None):
+    """Create and configure the MCP server, with Smithery deployment features if installed.
 
-    @smithery.server()
-    def create_server():
-        """Create and configure the MCP server for Smithery deployment."""
-        return _create_base_server()
-else:
-    # Fallback for local testing without Smithery
-    def create_server():
-        """Create and configure the MCP server for local testing."""
+    This is the entry point Smithery loads. Smithery is imported here rather
+    than at module import, so stdio mode, which uses the base server, does
+    not load it.
+    """
+    try:
+        from smithery.decorators import smithery
+    except ImportError:
         return _create_base_server()
+    return smithery.server()(_create_base_server)(config)
 
 
-def main():
-    """Main entry point. Start the appropriate transport mode based on environment variables."""
-    # Create the server instance for local testing
-    mcp = create_server()
+def add_health_routes(mcp: FastMCP) -> None:
+    """Register the /healthz and /readyz probe routes.
 
-    transport_mode = os.getenv("TRANSPORT", "stdio").lower()
+    /healthz answers 200 whenever the process is serving (liveness). /readyz
+    answers 503 until warm-up has completed, and while the upstream circuit
+    breaker is open, so load balancers keep traffic off cold or cut-off pods.
+    Both return the full health report.
 
+    Args:
+        mcp: Server to register the routes on.
+    """
+
+    @mcp.custom_route("/healthz", methods=["GET"])
+    async def healthz(request: Request) -> JSONResponse:
+        return JSONResponse(await get_app_container().health_report())
+
+    @mcp.custom_route("/readyz", methods=["GET"])
+    async def readyz(request: Request) -> JSONResponse:
+        report = await get_app_container().health_report()
+        return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+def add_metrics_route(mcp: FastMCP) -> None:
+    """Register the Prometheus /metrics route.
+
+    Counters and histograms are updated where the work happens; gauges for
+    admission and upstream concurrency are sampled at scrape time.
+
+    Args:
+        mcp: Server to register the route on.
+    """
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics(request: Request) -> Response:
+        app_container = get_app_container()
+        admission = app_container.get_admission_controller()
+        ADMISSION_IN_FLIGHT.set(admission.in_flight)
+        ADMISSION_QUEUE_DEPTH.set(admission.queue_depth)
+        UPSTREAM_IN_FLIGHT.set(app_container.get_http_client().pool_stats()["requests_in_flight"])
+        return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def add_traces_route(mcp: FastMCP) -> None:
+    """Register the /traces route exporting recently finished traces.
+
+    Returns JSON by default, or OTLP/JSON with ``?format=otlp``; ``?limit=N``
+    restricts the export to the N most recent traces.
+
+    Args:
+        mcp: Server to register the route on.
+    """
+
+    @mcp.custom_route("/traces", methods=["GET"])
+    async def traces(request: Request) -> JSONResponse:
+        tracer = get_tracer()
+        limit_text = request.query_params.get("limit", "")
+        limit = int(limit_text) if limit_text.isdigit() else None
+        if request.query_params.get("format") == "otlp":
+            return JSONResponse(tracer.export_otlp(limit))
+        return JSONResponse({"enabled": tracer.enabled, "traces": tracer.traces(limit)})
+
+
+def add_profiling_route(mcp: FastMCP) -> None:
+    """Register the /profiling admin route.
+
+    GET reports the sample rate and the most recent profiles; POST with
+    ``?sample_percent=N`` changes the share of profiled calls at runtime.
+
+    Args:
+        mcp: Server to register the route on.
+    """
+
+    @mcp.custom_route("/profiling", methods=["GET", "POST"])
+    async def profiling(request: Request) -> JSONResponse:
+        profiler = get_call_profiler()
+        if request.method == "POST":
+            try:
+                profiler.set_sample_percent(float(request.query_params["sample_percent"]))
+            except (KeyError, ValueError):
+                return JSONResponse({"error": "sample_percent query parameter (0-100) is required"}, status_code=400)
+        return JSONResponse(
+            {
+                "sample_percent": profiler.sample_percent,
+                "output_dir": str(profiler.output_dir),
+                "profiles_written": profiler.profiles_written,
+                "recent": profiler.recent_profiles(),
+            }
+        )
+
+
+def create_http_app():
+    """Create the streamable-HTTP ASGI application.
+
+    Used directly in single-worker mode and as the uvicorn app factory in each
+    worker process when several workers are configured.
+
+    Returns:
+        Starlette application serving the MCP endpoint.
+    """
+    # Worker processes start here rather than in main()
+    setup_logging(get_settings().logging)
+    server_settings = get_settings().server
+    mcp = create_server()
+
+    # Serve FastMCP's native streamable-HTTP app so HTTP clients get real
+    # sessions, tools/list, notifications and streaming through the same
+    # tool handlers (and pooled services) as stdio
+    mcp.settings.host = server_settings.host
+    mcp.settings.port = server_settings.port
+    mcp.settings.streamable_http_path = server_settings.http_path
+    mcp.settings.stateless_http = server_settings.stateless_http
+    mcp.settings.json_response = server_settings.json_response
+    if server_settings.stateless_http:
+        logging.getLogger("mcp.server.streamable_http").addFilter(StatelessTeardownFilter())
+    add_health_routes(mcp)
+    if server_settings.metrics:
+        add_metrics_route(mcp)
+    if get_settings().tracing.enabled:
+        add_traces_route(mcp)
+    if get_settings().profiling.admin_route:
+        add_profiling_route(mcp)
+    app = mcp.streamable_http_app()
+    app.add_middleware(
+        JSONRPCBatchMiddleware,
+        path=server_settings.http_path,
+        max_concurrency=server_settings.batch_max_concurrency,
+        max_batch_size=server_settings.batch_max_size,
+    )
+    if server_settings.etag:
+        if not server_settings.json_response:
+            get_logger("server").warning(
+                "MCP_ETAG is enabled but MCP_JSON_RESPONSE=false: ETags and 304 replies only apply to "
+                "JSON responses, so SSE tool results will not be tagged"
+            )
+        # Outside the batch middleware: batch sub-requests inherit If-None-Match
+        app.add_middleware(ETagMiddleware, path=server_settings.http_path)
+    if server_settings.compression:
+        # Added last so it is outermost and also compresses batch responses
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=server_settings.compression_min_size,
+            cache_max_entries=server_settings.compression_cache_size,
+        )
+    return with_resource_lifespan(app)
+
+
+def _configure_workers(workers: int) -> None:
+    """Adjust the environment inherited by worker processes for multi-worker mode.
+
+    Sessions live in the memory of the worker that created them, and requests
+    are spread across workers, so several workers require stateless HTTP. They
+    also default to the SQLite cache so entries are fetched and parsed once for
+    all workers rather than once per worker.
+
+    Args:
+        workers: Number of uvicorn worker processes.
+    """
+    if workers <= 1:
+        return
+
+    if os.getenv("MCP_STATELESS_HTTP", "").lower() != "true":
+        print(f"Running {workers} workers: enabling stateless HTTP (sessions cannot span workers)")
+        os.environ["MCP_STATELESS_HTTP"] = "true"
+    if "CACHE_BACKEND" not in os.environ:
+        print(f"Running {workers} workers: using the shared SQLite cache")
+        os.environ["CACHE_BACKEND"] = "sqlite"
+
+
+async def sync_mirror(full: bool = False) -> dict[str, int]:
+    """Download the catalogues and entries into the offline mirror.
+
+    Args:
+        full: Fetch every entry again instead of only changed ones.
+
+    Returns:
+        Sync report from MirrorSyncService.sync().
+    """
+    sync_container = DIContainer(get_settings())
+    await sync_container.get_http_client().open()
     try:
-        if transport_mode == "http":
-            print("Starting HTTP transport mode...")
-
-            # Port and host configuration
-            port = int(os.environ.get("PORT", 8081))
-            host = os.environ.get("HOST", "0.0.0.0")
-            print(f"Server will start on {host}:{port}")
-
-            # Use uvicorn directly to control host and port for HTTP mode
-            import traceback
-
-            import uvicorn
-
-            # Get the FastMCP app configured for SSE transport
-            # We'll create a simple wrapper to start the server manually
-            from starlette.applications import Starlette
-            from starlette.responses import JSONResponse
-
-            # Create a custom ASGI application with proper MCP endpoints
-            app = Starlette()
-
-            # Add MCP endpoint
-            @app.route("/mcp/v1", methods=["POST"])
-            async def mcp_endpoint(request):
-                try:
-                    # Get JSON body
-                    body = await request.json()
-
-                    # Handle MCP initialization
-                    if body.get("method") == "initialize":
-                        return JSONResponse(
-                            {
-                                "jsonrpc": "2.0",
-                                "id": body.get("id"),
-                                "result": {
-                                    "protocolVersion": "2025-06-18",
-                                    "capabilities": {
-                                        "experimental": {},
-                                        "prompts": {"listChanged": False},
-                                        "resources": {"subscribe": False, "listChanged": False},
-                                        "tools": {"listChanged": False},
-                                    },
-                                    "serverInfo": {"name": "wuwa-mcp-server", "version": "1.13.1"},
-                                },
-                            }
-                        )
+        return await sync_container.get_mirror_sync_service().sync(full=full)
+    finally:
+        await sync_container.cleanup()
 
-                    # Handle tool calls
-                    elif body.get("method") == "tools/call":
-                        tool_name = body.get("params", {}).get("name")
-                        arguments = body.get("params", {}).get("arguments", {})
-
-                        # Get services
-                        character_service, artifact_service = get_services()
-
-                        result = ""
-                        if tool_name == "get_character_info":
-                            result = await character_service.get_character_info(arguments.get("character_name"))
-                        elif tool_name == "get_artifact_info":
-                            result = await artifact_service.get_artifact_info(arguments.get("artifact_name"))
-                        elif tool_name == "get_character_profile":
-                            result = await character_service.get_character_profile(arguments.get("character_name"))
-                        else:
-                            return JSONResponse(
-                                {
-                                    "jsonrpc": "2.0",
-                                    "id": body.get("id"),
-                                    "error": {"code": -32601, "message": "Method not found"},
-                                }
-                            )
-
-                        return JSONResponse({"jsonrpc": "2.0", "id": body.get("id"), "result": result})
 
-                    else:
-                        return JSONResponse(
-                            {
-                                "jsonrpc": "2.0",
-                                "id": body.get("id"),
-                                "error": {"code": -32601, "message": "Method not found"},
-                            }
-                        )
+def _run_sync(full: bool) -> None:
+    """Run the sync command and exit non-zero if any entry failed to download."""
+    try:
+        report = asyncio.run(sync_mirror(full=full))
+    except WuWaException as e:
+        print(f"Sync failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(report))
+    if report["failed"]:
+        sys.exit(1)
+
 
-                except Exception as e:
-                    print(f"Error in MCP endpoint: {e}")
-                    traceback.print_exc()
-                    return JSONResponse(
-                        {
-                            "jsonrpc": "2.0",
-                            "id": body.get("id", 1),
-                            "error": {"code": -32603, "message": "Internal error", "data": str(e)},
-                        }
-                    )
-
-            # Start uvicorn server
-            uvicorn.run(app, host=host, port=port, log_level="info")
+def main():
+    """Main entry point. Start the appropriate transport mode based on environment variables."""
+    parser = argparse.ArgumentParser(description="WuWa MCP Server")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("serve", "sync"),
+        default="serve",
+        help="serve (default) runs the server; sync downloads the wiki into the offline mirror",
+    )
+    parser.add_argument("--mirror-path", default=None, help="Offline mirror directory (default: MIRROR_PATH env)")
+    parser.add_argument("--full", action="store_true", help="With sync: fetch every entry, not only changed ones")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of uvicorn worker processes in HTTP mode (default: WORKERS env or 1)",
+    )
+    args = parser.parse_args()
+
+    setup_logging(get_settings().logging)
+    if args.mirror_path:
+        get_settings().mirror.path = args.mirror_path
+        # Worker processes read their settings from the environment they inherit
+        os.environ["MIRROR_PATH"] = args.mirror_path
+    if args.command == "sync":
+        _run_sync(args.full)
+        return
+
+    transport_mode = get_settings().server.transport.lower()
+
+    if transport_mode == "http":
+        print("Starting HTTP transport mode...")
+
+        # Port, host and endpoint configuration
+        server_settings = get_settings().server
+        workers = args.workers or server_settings.workers
+        print(f"Server will start on {server_settings.host}:{server_settings.port}{server_settings.http_path}")
+
+        import uvicorn
+
+        # On SIGTERM uvicorn stops accepting connections and waits for open ones
+        # (including streaming responses) before running the lifespan shutdown
+        run_options = {
+            "host": server_settings.host,
+            "port": server_settings.port,
+            "log_level": "info",
+            "timeout_graceful_shutdown": int(server_settings.shutdown_timeout),
+        }
+        if workers > 1:
+            _configure_workers(workers)
+            # Worker processes import the app factory themselves
+            uvicorn.run("wuwa_mcp_server.server:create_http_app", factory=True, workers=workers, **run_options)
         else:
-            print("Starting STDIO transport mode...")
-            # STDIO mode (for backward compatibility with existing setups)
-            mcp.run()
-    finally:
-        # Clean up resources on shutdown
-        try:
-            # Create a new event loop for cleanup if none exists
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            if loop.is_running():
-                loop.create_task(cleanup_resources())
-            else:
-                loop.run_until_complete(cleanup_resources())
-                loop.close()
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
+            uvicorn.run(create_http_app(), **run_options)
+    else:
+        # stdout carries the MCP protocol in this mode
+        print("Starting STDIO transport mode...", file=sys.stderr)
+        _create_base_server().run()
 
 
 if __name__ == "__main__":
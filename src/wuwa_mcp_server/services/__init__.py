@@ -2,6 +2,16 @@
 
 from .artifact_service import ArtifactService
 from .character_service import CharacterService
+from .json_service import JSONService
 from .markdown_service import MarkdownService
+from .mirror_sync_service import MirrorSyncService
+from .pagination_service import PaginationService
 
-__all__ = ["ArtifactService", "CharacterService", "MarkdownService"]
+__all__ = [
+    "ArtifactService",
+    "CharacterService",
+    "JSONService",
+    "MarkdownService",
+    "MirrorSyncService",
+    "PaginationService",
+]
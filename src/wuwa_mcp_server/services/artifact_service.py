@@ -7,11 +7,18 @@ from ..core.exceptions import DataNotFoundException
 from ..core.exceptions import ServiceException
 from ..core.interfaces import ArtifactServiceProtocol
 from ..core.logging_config import LoggerMixin
+from ..core.metrics import RENDER_DURATION
+from ..domain.value_objects import OutputFormat
+from ..infrastructure.cache import CacheBackend
+from ..infrastructure.cache import IdentityMemo
+from ..infrastructure.cache import build_cache_key
 from ..infrastructure.repositories import ArtifactRepository
 from ..parsers.content_parser import StrategyBasedContentParser
+from .json_service import JSONService
+from .render_cache import RenderCacheMixin
 
 
-class ArtifactService(ArtifactServiceProtocol, LoggerMixin):
+class ArtifactService(ArtifactServiceProtocol, RenderCacheMixin, LoggerMixin):
     """Service for artifact-related business operations."""
 
     def __init__(
@@ -19,6 +26,9 @@ class ArtifactService(ArtifactServiceProtocol, LoggerMixin):
         artifact_repository: ArtifactRepository,
         content_parser: StrategyBasedContentParser,
         markdown_service: "MarkdownService",  # Forward reference
+        json_service: JSONService | None = None,
+        cache: CacheBackend | None = None,
+        memo: IdentityMemo | None = None,
     ):
         """Initialize artifact service.
 
@@ -26,52 +36,85 @@ class ArtifactService(ArtifactServiceProtocol, LoggerMixin):
             artifact_repository: Repository for artifact data access.
             content_parser: Content parser for processing raw data.
             markdown_service: Service for markdown generation.
+            json_service: Service for JSON serialization. Creates one if None.
+            cache: Cache backend for rendered output. Output is not cached if None.
+            memo: Memo of rendered output per unchanged raw entry, letting a
+                refetch that returns the same entry skip parsing and rendering.
         """
         self.artifact_repository = artifact_repository
         self.content_parser = content_parser
         self.markdown_service = markdown_service
+        self.json_service = json_service or JSONService()
+        self.cache = cache
+        self.memo = memo
 
-    async def get_artifact_info(self, artifact_name: str) -> str:
+    async def get_artifact_info(
+        self, artifact_name: str, output_format: str | OutputFormat = OutputFormat.MARKDOWN
+    ) -> str:
         """Get comprehensive artifact information.
 
         Args:
             artifact_name: Name of the artifact set to query.
+            output_format: Output format, ``markdown``, ``compact`` or ``json``.
 
         Returns:
-            Markdown formatted artifact information.
+            Markdown or JSON formatted artifact information.
 
         Raises:
+            ValidationException: If the output format is not supported.
             ServiceException: If artifact retrieval fails.
         """
+        output_format = self._resolve_output_format(output_format)
+        cache_key = build_cache_key("render", "artifact_info", output_format.value, artifact_name)
+        cached = await self._load_rendered(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            self.logger.info(f"Getting artifact info for: {artifact_name}")
+            self.logger.debug("Getting artifact info for: %s", artifact_name)
 
             # Get artifact raw data
             artifact_raw_data = await self._get_artifact_data(artifact_name)
 
+            memo_variant = f"artifact_info:{output_format.value}"
+            memoized = self._recall_rendered(memo_variant, artifact_raw_data)
+            if memoized is not None:
+                return await self._store_rendered(cache_key, memoized)
+
             # Parse artifact content
             artifact_parsed_data = await asyncio.to_thread(
                 self.content_parser.parse_artifact_content, artifact_raw_data
             )
 
+            if output_format is OutputFormat.JSON:
+                with RENDER_DURATION.labels("artifact_info", output_format.value).time():
+                    artifact_json = self.json_service.generate_artifact_json(artifact_parsed_data)
+                self.logger.debug("Successfully generated artifact JSON for: %s", artifact_name)
+                self._remember_rendered(memo_variant, artifact_json, artifact_raw_data)
+                return await self._store_rendered(cache_key, artifact_json)
+
             # Generate markdown
-            artifact_markdown = self.markdown_service.generate_artifact_markdown(artifact_parsed_data)
+            with RENDER_DURATION.labels("artifact_info", output_format.value).time():
+                artifact_markdown = self.markdown_service.generate_artifact_markdown(
+                    artifact_parsed_data, compact=output_format is OutputFormat.COMPACT
+                )
 
             if not artifact_markdown.strip():
-                self.logger.warning(f"Generated empty artifact info for: {artifact_name}")
+                self.logger.warning("Generated empty artifact info for: %s", artifact_name)
                 return f"成功获取 '{artifact_name}' 的声骸数据，但解析后的内容无法生成有效的 Markdown。"
 
-            self.logger.info(f"Successfully generated artifact info for: {artifact_name}")
-            return artifact_markdown
+            self.logger.debug("Successfully generated artifact info for: %s", artifact_name)
+            self._remember_rendered(memo_variant, artifact_markdown, artifact_raw_data)
+            return await self._store_rendered(cache_key, artifact_markdown)
 
         except DataNotFoundException:
             error_msg = f"Artifact set '{artifact_name}' not found"
             self.logger.error(error_msg)
-            return f"错误：未找到名为 '{artifact_name}' 的声骸套装。"
+            return self._format_error(f"错误：未找到名为 '{artifact_name}' 的声骸套装。", output_format)
 
         except Exception as e:
-            self.logger.error(f"Failed to get artifact info for {artifact_name}: {e}")
-            raise ServiceException(f"Artifact info retrieval failed: {e}")
+            self.logger.error("Failed to get artifact info for %s: %s", artifact_name, e)
+            raise ServiceException(f"Artifact info retrieval failed: {e}") from e
 
     async def _get_artifact_data(self, artifact_name: str) -> dict[str, Any]:
         """Get artifact raw data from repository.
@@ -97,8 +140,8 @@ class ArtifactService(ArtifactServiceProtocol, LoggerMixin):
         except DataNotFoundException:
             raise
         except Exception as e:
-            self.logger.error(f"Failed to get artifact data for {artifact_name}: {e}")
-            raise ServiceException(f"Artifact data retrieval failed: {e}")
+            self.logger.error("Failed to get artifact data for %s: %s", artifact_name, e)
+            raise ServiceException(f"Artifact data retrieval failed: {e}") from e
 
 
 # Factory function for dependency injection
@@ -106,6 +149,9 @@ def create_artifact_service(
     artifact_repository: ArtifactRepository,
     content_parser: StrategyBasedContentParser,
     markdown_service: "MarkdownService",
+    json_service: JSONService | None = None,
+    cache: CacheBackend | None = None,
+    memo: IdentityMemo | None = None,
 ) -> ArtifactService:
     """Create artifact service.
 
@@ -113,8 +159,11 @@ def create_artifact_service(
         artifact_repository: Artifact repository.
         content_parser: Content parser.
         markdown_service: Markdown service.
+        json_service: Optional JSON service.
+        cache: Optional cache backend for rendered output.
+        memo: Optional memo of rendered output per unchanged raw entry.
 
     Returns:
         ArtifactService instance.
     """
-    return ArtifactService(artifact_repository, content_parser, markdown_service)
+    return ArtifactService(artifact_repository, content_parser, markdown_service, json_service, cache, memo)
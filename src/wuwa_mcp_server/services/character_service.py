@@ -8,11 +8,41 @@ from ..core.exceptions import DataNotFoundException
 from ..core.exceptions import ServiceException
 from ..core.interfaces import CharacterServiceProtocol
 from ..core.logging_config import LoggerMixin
+from ..core.metrics import RENDER_DURATION
+from ..core.tracing import traced
+from ..domain.value_objects import OutputFormat
+from ..infrastructure.cache import CacheBackend
+from ..infrastructure.cache import IdentityMemo
+from ..infrastructure.cache import build_cache_key
 from ..infrastructure.repositories import CharacterRepository
 from ..parsers.content_parser import StrategyBasedContentParser
+from .json_service import JSONService
+from .render_cache import RenderCacheMixin
 
+# Modules of a character page that link to its strategy page
+_STRATEGY_MODULE_TITLES = ("角色攻略", "角色养成推荐")
+_STRATEGY_LINK = re.compile(r"https://wiki\.kurobbs\.com/mc/item/(\d+)")
 
-class CharacterService(CharacterServiceProtocol, LoggerMixin):
+
+def find_strategy_item_id(character_raw_data: dict[str, Any]) -> str | None:
+    """Find the ID of the strategy page a character page links to.
+
+    Args:
+        character_raw_data: Raw character entry detail.
+
+    Returns:
+        Strategy item ID, or None if the page has no strategy link.
+    """
+    for module in character_raw_data.get("modules", []):
+        if module.get("title", "") in _STRATEGY_MODULE_TITLES:
+            for component in module.get("components", []):
+                match = _STRATEGY_LINK.search(component.get("content", "") or "")
+                if match:
+                    return match.group(1)
+    return None
+
+
+class CharacterService(CharacterServiceProtocol, RenderCacheMixin, LoggerMixin):
     """Service for character-related business operations."""
 
     def __init__(
@@ -20,6 +50,9 @@ class CharacterService(CharacterServiceProtocol, LoggerMixin):
         character_repository: CharacterRepository,
         content_parser: StrategyBasedContentParser,
         markdown_service: "MarkdownService",  # Forward reference
+        json_service: JSONService | None = None,
+        cache: CacheBackend | None = None,
+        memo: IdentityMemo | None = None,
     ):
         """Initialize character service.
 
@@ -27,25 +60,42 @@ class CharacterService(CharacterServiceProtocol, LoggerMixin):
             character_repository: Repository for character data access.
             content_parser: Content parser for processing raw data.
             markdown_service: Service for markdown generation.
+            json_service: Service for JSON serialization. Creates one if None.
+            cache: Cache backend for rendered output. Output is not cached if None.
+            memo: Memo of rendered output per unchanged raw entry, letting a
+                refetch that returns the same entry skip parsing and rendering.
         """
         self.character_repository = character_repository
         self.content_parser = content_parser
         self.markdown_service = markdown_service
+        self.json_service = json_service or JSONService()
+        self.cache = cache
+        self.memo = memo
 
-    async def get_character_info(self, character_name: str) -> str:
+    async def get_character_info(
+        self, character_name: str, output_format: str | OutputFormat = OutputFormat.MARKDOWN
+    ) -> str:
         """Get comprehensive character information including strategy.
 
         Args:
             character_name: Name of the character to query.
+            output_format: Output format, ``markdown``, ``compact`` or ``json``.
 
         Returns:
-            Markdown formatted character information.
+            Markdown or JSON formatted character information.
 
         Raises:
+            ValidationException: If the output format is not supported.
             ServiceException: If character retrieval fails.
         """
+        output_format = self._resolve_output_format(output_format)
+        cache_key = build_cache_key("render", "character_info", output_format.value, character_name)
+        cached = await self._load_rendered(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            self.logger.info(f"Getting character info for: {character_name}")
+            self.logger.debug("Getting character info for: %s", character_name)
 
             # Get character raw data
             character_raw_data = await self._get_character_data(character_name)
@@ -53,101 +103,174 @@ class CharacterService(CharacterServiceProtocol, LoggerMixin):
             # Extract strategy item ID for parallel processing
             strategy_item_id = self._extract_strategy_item_id(character_raw_data)
 
-            # Parallel processing: parse profile and fetch strategy
-            profile_task = asyncio.create_task(
-                asyncio.to_thread(self.content_parser.parse_main_content, character_raw_data)
-            )
-
             strategy_task = None
             if strategy_item_id:
                 strategy_task = asyncio.create_task(self._fetch_strategy_content(strategy_item_id))
 
-            # Wait for profile parsing
-            character_profile_data = await profile_task
+            # Output rendered from this very entry only needs the strategy page to be unchanged too
+            memo_variant = f"character_info:{output_format.value}"
+            if self.memo is not None and self.memo.knows(memo_variant, character_raw_data):
+                strategy_raw_data = await strategy_task if strategy_task else None
+                memoized = self._recall_rendered(memo_variant, character_raw_data, strategy_raw_data)
+                if memoized is not None:
+                    return await self._store_rendered(cache_key, memoized)
 
-            # Generate markdown for profile
-            character_markdown = self.markdown_service.generate_character_markdown(
-                character_profile_data, include_strategy=False
+            # Parallel processing: parse profile and fetch strategy
+            profile_task = asyncio.create_task(
+                asyncio.to_thread(self.content_parser.parse_main_content, character_raw_data)
             )
 
-            # Process strategy if available
-            strategy_markdown = ""
-            if strategy_task:
-                try:
-                    strategy_raw_data = await strategy_task
-                    if strategy_raw_data:
-                        strategy_parsed = await asyncio.to_thread(
-                            self.content_parser.parse_strategy_content, strategy_raw_data
-                        )
-                        strategy_markdown = self.markdown_service.generate_strategy_markdown(strategy_parsed)
-                except Exception as e:
-                    self.logger.warning(f"Failed to process strategy content: {e}")
-
-            # Combine results
-            combined_markdown = character_markdown
-            if strategy_markdown:
-                combined_markdown += "\n\n" + strategy_markdown
-
-            # Add strategy link if available
-            if strategy_item_id:
-                link_markdown = self._generate_strategy_link_markdown(strategy_item_id)
-                combined_markdown += "\n\n" + link_markdown
+            # Wait for profile parsing
+            character_profile_data = await profile_task
 
-            self.logger.info(f"Successfully generated character info for: {character_name}")
-            return combined_markdown
+            strategy_parsed = await self._parse_strategy_task(strategy_task)
+            sources = (character_raw_data, strategy_task.result() if strategy_task else None)
+            # Output missing a linked strategy page that failed to load is returned but not kept
+            complete = not strategy_item_id or strategy_parsed is not None
+            if not complete:
+                self.logger.warning("Not caching character info for %s without its strategy page", character_name)
+
+            if output_format is OutputFormat.JSON:
+                with RENDER_DURATION.labels("character_info", output_format.value).time():
+                    character_json = self.json_service.generate_character_json(
+                        character_profile_data, strategy_parsed, strategy_item_id
+                    )
+                self.logger.debug("Successfully generated character JSON for: %s", character_name)
+                if not complete:
+                    return character_json
+                self._remember_rendered(memo_variant, character_json, *sources)
+                return await self._store_rendered(cache_key, character_json)
+
+            with RENDER_DURATION.labels("character_info", output_format.value).time():
+                # Generate markdown for profile
+                compact = output_format is OutputFormat.COMPACT
+                character_markdown = self.markdown_service.generate_character_markdown(
+                    character_profile_data, include_strategy=False, compact=compact
+                )
+
+                # Process strategy if available
+                strategy_markdown = ""
+                if strategy_parsed:
+                    strategy_markdown = self.markdown_service.generate_strategy_markdown(
+                        strategy_parsed, compact=compact
+                    )
+
+                # Combine results
+                combined_markdown = character_markdown
+                if strategy_markdown:
+                    combined_markdown += "\n\n" + strategy_markdown
+
+                # Add strategy link if available
+                if strategy_item_id:
+                    link_markdown = self._generate_strategy_link_markdown(strategy_item_id)
+                    combined_markdown += "\n\n" + link_markdown
+
+                if compact:
+                    combined_markdown = self.markdown_service.compact_whitespace(combined_markdown)
+
+            self.logger.debug("Successfully generated character info for: %s", character_name)
+            if not complete:
+                return combined_markdown
+            self._remember_rendered(memo_variant, combined_markdown, *sources)
+            return await self._store_rendered(cache_key, combined_markdown)
 
         except DataNotFoundException:
             error_msg = f"Character '{character_name}' not found"
             self.logger.error(error_msg)
-            return f"错误：未找到名为 '{character_name}' 的角色。"
+            return self._format_error(f"错误：未找到名为 '{character_name}' 的角色。", output_format)
 
         except Exception as e:
-            self.logger.error(f"Failed to get character info for {character_name}: {e}")
-            raise ServiceException(f"Character info retrieval failed: {e}")
+            self.logger.error("Failed to get character info for %s: %s", character_name, e)
+            raise ServiceException(f"Character info retrieval failed: {e}") from e
 
-    async def get_character_profile(self, character_name: str) -> str:
+    async def get_character_profile(
+        self, character_name: str, output_format: str | OutputFormat = OutputFormat.MARKDOWN
+    ) -> str:
         """Get character profile information only.
 
         Args:
             character_name: Name of the character to query.
+            output_format: Output format, ``markdown``, ``compact`` or ``json``.
 
         Returns:
-            Markdown formatted character profile.
+            Markdown or JSON formatted character profile.
 
         Raises:
+            ValidationException: If the output format is not supported.
             ServiceException: If character profile retrieval fails.
         """
+        output_format = self._resolve_output_format(output_format)
+        cache_key = build_cache_key("render", "character_profile", output_format.value, character_name)
+        cached = await self._load_rendered(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            self.logger.info(f"Getting character profile for: {character_name}")
+            self.logger.debug("Getting character profile for: %s", character_name)
 
             # Get character raw data
             character_raw_data = await self._get_character_data(character_name)
 
+            memo_variant = f"character_profile:{output_format.value}"
+            memoized = self._recall_rendered(memo_variant, character_raw_data)
+            if memoized is not None:
+                return await self._store_rendered(cache_key, memoized)
+
             # Parse profile content
             character_profile_data = await asyncio.to_thread(
                 self.content_parser.parse_character_profile, character_raw_data
             )
 
+            if output_format is OutputFormat.JSON:
+                with RENDER_DURATION.labels("character_profile", output_format.value).time():
+                    profile_json = self.json_service.generate_character_json(character_profile_data)
+                self.logger.debug("Successfully generated character profile JSON for: %s", character_name)
+                self._remember_rendered(memo_variant, profile_json, character_raw_data)
+                return await self._store_rendered(cache_key, profile_json)
+
             # Generate markdown
-            profile_markdown = self.markdown_service.generate_character_markdown(
-                character_profile_data, include_strategy=False
-            )
+            with RENDER_DURATION.labels("character_profile", output_format.value).time():
+                profile_markdown = self.markdown_service.generate_character_markdown(
+                    character_profile_data, include_strategy=False, compact=output_format is OutputFormat.COMPACT
+                )
 
             if not profile_markdown.strip():
-                self.logger.warning(f"Generated empty profile for: {character_name}")
+                self.logger.warning("Generated empty profile for: %s", character_name)
                 return f"成功获取 '{character_name}' 的档案数据，但解析后的内容无法生成有效的 Markdown。"
 
-            self.logger.info(f"Successfully generated character profile for: {character_name}")
-            return profile_markdown
+            self.logger.debug("Successfully generated character profile for: %s", character_name)
+            self._remember_rendered(memo_variant, profile_markdown, character_raw_data)
+            return await self._store_rendered(cache_key, profile_markdown)
 
         except DataNotFoundException:
             error_msg = f"Character '{character_name}' not found"
             self.logger.error(error_msg)
-            return f"错误：未找到名为 '{character_name}' 的角色。"
+            return self._format_error(f"错误：未找到名为 '{character_name}' 的角色。", output_format)
+
+        except Exception as e:
+            self.logger.error("Failed to get character profile for %s: %s", character_name, e)
+            raise ServiceException(f"Character profile retrieval failed: {e}") from e
+
+    async def _parse_strategy_task(self, strategy_task: "asyncio.Task | None") -> dict[str, Any] | None:
+        """Await a pending strategy fetch and parse its content.
+
+        Args:
+            strategy_task: Task fetching the raw strategy content, if any.
+
+        Returns:
+            Parsed strategy data, or None if unavailable.
+        """
+        if not strategy_task:
+            return None
 
+        try:
+            strategy_raw_data = await strategy_task
+            if strategy_raw_data:
+                return await asyncio.to_thread(self.content_parser.parse_strategy_content, strategy_raw_data)
         except Exception as e:
-            self.logger.error(f"Failed to get character profile for {character_name}: {e}")
-            raise ServiceException(f"Character profile retrieval failed: {e}")
+            self.logger.warning("Failed to process strategy content: %s", e)
+
+        return None
 
     async def _get_character_data(self, character_name: str) -> dict[str, Any]:
         """Get character raw data from repository.
@@ -173,8 +296,8 @@ class CharacterService(CharacterServiceProtocol, LoggerMixin):
         except DataNotFoundException:
             raise
         except Exception as e:
-            self.logger.error(f"Failed to get character data for {character_name}: {e}")
-            raise ServiceException(f"Character data retrieval failed: {e}")
+            self.logger.error("Failed to get character data for %s: %s", character_name, e)
+            raise ServiceException(f"Character data retrieval failed: {e}") from e
 
     def _extract_strategy_item_id(self, character_raw_data: dict[str, Any]) -> str | None:
         """Extract strategy item ID from character data.
@@ -186,43 +309,18 @@ class CharacterService(CharacterServiceProtocol, LoggerMixin):
             Strategy item ID if found, None otherwise.
         """
         try:
-            modules = character_raw_data.get("modules", [])
-
-            for module in modules:
-                module_title = module.get("title", "")
-                if module_title in ["角色攻略", "角色养成推荐"]:
-                    components = module.get("components", [])
-                    for component in components:
-                        content = component.get("content", "")
-                        if content:
-                            item_id = self._extract_item_id_from_html(content)
-                            if item_id:
-                                self.logger.debug(f"Extracted strategy item ID: {item_id}")
-                                return item_id
-
-            self.logger.debug("No strategy item ID found")
-            return None
+            item_id = find_strategy_item_id(character_raw_data)
+            if item_id:
+                self.logger.debug("Extracted strategy item ID: %s", item_id)
+            else:
+                self.logger.debug("No strategy item ID found")
+            return item_id
 
         except Exception as e:
-            self.logger.warning(f"Failed to extract strategy item ID: {e}")
+            self.logger.warning("Failed to extract strategy item ID: %s", e)
             return None
 
-    def _extract_item_id_from_html(self, html_content: str) -> str | None:
-        """Extract item ID from HTML content using regex.
-
-        Args:
-            html_content: HTML content to search.
-
-        Returns:
-            Extracted item ID or None.
-        """
-        if not html_content:
-            return None
-
-        pattern = r"https://wiki\.kurobbs\.com/mc/item/(\d+)"
-        match = re.search(pattern, html_content)
-        return match.group(1) if match else None
-
+    @traced(attributes=("strategy_item_id",))
     async def _fetch_strategy_content(self, strategy_item_id: str) -> dict[str, Any] | None:
         """Fetch strategy content from API.
 
@@ -233,20 +331,20 @@ class CharacterService(CharacterServiceProtocol, LoggerMixin):
             Strategy content data or None if failed.
         """
         try:
-            self.logger.info(f"Fetching strategy content for ID: {strategy_item_id}")
+            self.logger.debug("Fetching strategy content for ID: %s", strategy_item_id)
 
-            # Use the same API client as the repository
-            strategy_data = await self.character_repository.api_client.fetch_entry_detail(strategy_item_id)
+            # Go through the repository so the request runs inside the shared client context
+            strategy_data = await self.character_repository.get_character_detail(strategy_item_id)
 
             if strategy_data:
                 self.logger.debug("Strategy content fetched successfully")
             else:
-                self.logger.warning(f"No strategy content found for ID: {strategy_item_id}")
+                self.logger.warning("No strategy content found for ID: %s", strategy_item_id)
 
             return strategy_data
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch strategy content: {e}")
+            self.logger.error("Failed to fetch strategy content: %s", e)
             return None
 
     def _generate_strategy_link_markdown(self, strategy_item_id: str) -> str:
@@ -270,6 +368,9 @@ def create_character_service(
     character_repository: CharacterRepository,
     content_parser: StrategyBasedContentParser,
     markdown_service: "MarkdownService",
+    json_service: JSONService | None = None,
+    cache: CacheBackend | None = None,
+    memo: IdentityMemo | None = None,
 ) -> CharacterService:
     """Create character service.
 
@@ -277,8 +378,11 @@ def create_character_service(
         character_repository: Character repository.
         content_parser: Content parser.
         markdown_service: Markdown service.
+        json_service: Optional JSON service.
+        cache: Optional cache backend for rendered output.
+        memo: Optional memo of rendered output per unchanged raw entry.
 
     Returns:
         CharacterService instance.
     """
-    return CharacterService(character_repository, content_parser, markdown_service)
+    return CharacterService(character_repository, content_parser, markdown_service, json_service, cache, memo)
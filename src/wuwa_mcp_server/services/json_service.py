@@ -0,0 +1,103 @@
+"""JSON service for serializing parsed data without markdown rendering."""
+
+import json
+from typing import Any
+
+from ..core.logging_config import LoggerMixin
+from ..core.tracing import traced
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class JSONService(LoggerMixin):
+    """Service for serializing parsed module/component/table trees as compact JSON."""
+
+    def __init__(self, use_orjson: bool | None = None):
+        """Initialize JSON service.
+
+        Args:
+            use_orjson: Force the orjson encoder on/off. Auto-detects if None.
+        """
+        self.use_orjson = ORJSON_AVAILABLE if use_orjson is None else (use_orjson and ORJSON_AVAILABLE)
+
+    @traced()
+    def generate_character_json(
+        self,
+        parsed_data: dict[str, Any],
+        strategy_data: dict[str, Any] | None = None,
+        strategy_item_id: str | None = None,
+    ) -> str:
+        """Serialize character data, optionally with its strategy page.
+
+        Args:
+            parsed_data: Parsed character data.
+            strategy_data: Parsed strategy data, if fetched.
+            strategy_item_id: Strategy item ID, if the character links one.
+
+        Returns:
+            Compact JSON string.
+        """
+        payload: dict[str, Any] = {
+            "title": parsed_data.get("title", ""),
+            "modules": parsed_data.get("modules", {}),
+        }
+
+        if strategy_item_id:
+            payload["strategy"] = {
+                "item_id": strategy_item_id,
+                "url": f"https://wiki.kurobbs.com/mc/item/{strategy_item_id}",
+                "modules": (strategy_data or {}).get("modules", {}),
+            }
+
+        return self.dumps(payload)
+
+    @traced()
+    def generate_artifact_json(self, parsed_data: dict[str, Any]) -> str:
+        """Serialize artifact data.
+
+        Args:
+            parsed_data: Parsed artifact data.
+
+        Returns:
+            Compact JSON string.
+        """
+        return self.dumps({"title": parsed_data.get("title", ""), "modules": parsed_data.get("modules", {})})
+
+    def generate_error_json(self, message: str) -> str:
+        """Serialize an error message.
+
+        Args:
+            message: User-facing error message.
+
+        Returns:
+            Compact JSON string.
+        """
+        return self.dumps({"error": message})
+
+    def dumps(self, payload: Any) -> str:
+        """Encode a payload as compact JSON.
+
+        Args:
+            payload: JSON-serializable data.
+
+        Returns:
+            JSON string without insignificant whitespace.
+        """
+        if self.use_orjson:
+            return orjson.dumps(payload).decode("utf-8")
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+# Factory function for dependency injection
+def create_json_service() -> JSONService:
+    """Create JSON service.
+
+    Returns:
+        JSONService instance.
+    """
+    return JSONService()
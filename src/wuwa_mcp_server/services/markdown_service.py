@@ -1,9 +1,16 @@
 """Markdown service for converting parsed data to markdown format."""
 
+import hashlib
+import re
 from typing import Any
 
 from ..core.interfaces import MarkdownServiceProtocol
 from ..core.logging_config import LoggerMixin
+from ..core.tracing import traced
+
+_TABLE_LINE_PATTERN = re.compile(r"^\| .* \|$", re.MULTILINE)
+_TRAILING_SPACE_PATTERN = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
 
 
 class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
@@ -13,18 +20,22 @@ class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
         """Initialize markdown service."""
         pass
 
-    def generate_character_markdown(self, parsed_data: dict[str, Any], include_strategy: bool = True) -> str:
+    @traced()
+    def generate_character_markdown(
+        self, parsed_data: dict[str, Any], include_strategy: bool = True, compact: bool = False
+    ) -> str:
         """Generate markdown for character data.
 
         Args:
             parsed_data: Parsed character data.
             include_strategy: Whether to include strategy link.
+            compact: Use the compact rendering profile.
 
         Returns:
             Markdown formatted character information.
         """
         try:
-            self.logger.info("Generating character markdown")
+            self.logger.debug("Generating character markdown")
 
             markdown_lines = []
 
@@ -34,9 +45,10 @@ class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
             markdown_lines.append("")
 
             # モジュールデータを処理
+            seen_bodies: dict[str, str] | None = {} if compact else None
             modules = parsed_data.get("modules", {})
             for module_title, module_data in modules.items():
-                markdown_lines.extend(self._process_module(module_title, module_data))
+                markdown_lines.extend(self._process_module(module_title, module_data, seen_bodies=seen_bodies))
 
             # キャラクター戦略リンクを追加
             if include_strategy:
@@ -45,24 +57,28 @@ class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
                     markdown_lines.extend(self._generate_strategy_link_section(strategy_item_id))
 
             result = "\n".join(markdown_lines)
-            self.logger.debug(f"Generated character markdown: {len(result)} characters")
+            if compact:
+                result = self.compact_whitespace(result)
+            self.logger.debug("Generated character markdown: %s characters", len(result))
             return result
 
         except Exception as e:
-            self.logger.error(f"Failed to generate character markdown: {e}")
+            self.logger.error("Failed to generate character markdown: %s", e)
             return f"エラー: マークダウンの生成に失敗しました: {e}"
 
-    def generate_artifact_markdown(self, parsed_data: dict[str, Any]) -> str:
+    @traced()
+    def generate_artifact_markdown(self, parsed_data: dict[str, Any], compact: bool = False) -> str:
         """Generate markdown for artifact data.
 
         Args:
             parsed_data: Parsed artifact data.
+            compact: Use the compact rendering profile.
 
         Returns:
             Markdown formatted artifact information.
         """
         try:
-            self.logger.info("Generating artifact markdown")
+            self.logger.debug("Generating artifact markdown")
 
             markdown_lines = []
 
@@ -72,29 +88,34 @@ class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
             markdown_lines.append("")
 
             # モジュールデータを処理
+            seen_bodies: dict[str, str] | None = {} if compact else None
             modules = parsed_data.get("modules", {})
             for module_title, module_data in modules.items():
-                markdown_lines.extend(self._process_module(module_title, module_data))
+                markdown_lines.extend(self._process_module(module_title, module_data, seen_bodies=seen_bodies))
 
             result = "\n".join(markdown_lines)
-            self.logger.debug(f"Generated artifact markdown: {len(result)} characters")
+            if compact:
+                result = self.compact_whitespace(result)
+            self.logger.debug("Generated artifact markdown: %s characters", len(result))
             return result
 
         except Exception as e:
-            self.logger.error(f"Failed to generate artifact markdown: {e}")
+            self.logger.error("Failed to generate artifact markdown: %s", e)
             return f"エラー: 声骸マークダウンの生成に失敗しました: {e}"
 
-    def generate_strategy_markdown(self, parsed_data: dict[str, Any]) -> str:
+    @traced()
+    def generate_strategy_markdown(self, parsed_data: dict[str, Any], compact: bool = False) -> str:
         """Generate markdown for strategy data.
 
         Args:
             parsed_data: Parsed strategy data.
+            compact: Use the compact rendering profile.
 
         Returns:
             Markdown formatted strategy information.
         """
         try:
-            self.logger.info("Generating strategy markdown")
+            self.logger.debug("Generating strategy markdown")
 
             markdown_lines = []
 
@@ -103,30 +124,46 @@ class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
             markdown_lines.append("")
 
             # モジュールデータを処理
+            seen_bodies: dict[str, str] | None = {} if compact else None
             modules = parsed_data.get("modules", {})
             for module_title, module_data in modules.items():
                 # 戦略データの場合はH3レベルから開始
-                markdown_lines.extend(self._process_module(module_title, module_data, base_level=3))
+                markdown_lines.extend(
+                    self._process_module(module_title, module_data, base_level=3, seen_bodies=seen_bodies)
+                )
 
             result = "\n".join(markdown_lines)
-            self.logger.debug(f"Generated strategy markdown: {len(result)} characters")
+            if compact:
+                result = self.compact_whitespace(result)
+            self.logger.debug("Generated strategy markdown: %s characters", len(result))
             return result
 
         except Exception as e:
-            self.logger.error(f"Failed to generate strategy markdown: {e}")
+            self.logger.error("Failed to generate strategy markdown: %s", e)
             return f"エラー: 戦略マークダウンの生成に失敗しました: {e}"
 
-    def _process_module(self, module_title: str, module_data: dict[str, Any], base_level: int = 2) -> list[str]:
+    def _process_module(
+        self,
+        module_title: str,
+        module_data: dict[str, Any],
+        base_level: int = 2,
+        seen_bodies: dict[str, str] | None = None,
+    ) -> list[str]:
         """Process a single module into markdown lines.
 
         Args:
             module_title: Title of the module.
             module_data: Module data.
             base_level: Base header level for this module.
+            seen_bodies: Component body hashes already rendered in this document.
+                Enables the compact profile when not None.
 
         Returns:
             List of markdown lines.
         """
+        if seen_bodies is not None:
+            return self._process_module_compact(module_title, module_data, base_level, seen_bodies)
+
         lines = []
 
         # モジュールタイトル
@@ -308,6 +345,191 @@ class MarkdownService(MarkdownServiceProtocol, LoggerMixin):
 
         return lines
 
+    def _process_module_compact(
+        self,
+        module_title: str,
+        module_data: dict[str, Any],
+        base_level: int,
+        seen_bodies: dict[str, str],
+    ) -> list[str]:
+        """Process a module with the compact profile.
+
+        Empty components are dropped, a module without any remaining component is
+        dropped entirely, and a component whose body was already rendered in this
+        document is replaced by a reference to the first occurrence.
+
+        Args:
+            module_title: Title of the module.
+            module_data: Module data.
+            base_level: Base header level for this module.
+            seen_bodies: Component body hashes already rendered, mapped to their titles.
+
+        Returns:
+            List of markdown lines.
+        """
+        lines = []
+        processed_titles: set[str] = set()
+
+        for component in module_data.get("components", []):
+            comp_title = component.get("title", "Unnamed Component")
+            if comp_title in processed_titles:
+                continue
+            processed_titles.add(comp_title)
+
+            body = self._render_compact_body(component, comp_title, base_level + 2)
+            if not body:
+                continue
+
+            # 重複ヘッダーを省略 (モジュール名と同じコンポーネント名)
+            if comp_title != module_title:
+                lines.append(f"{'#' * (base_level + 1)} {comp_title}")
+
+            digest = hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+            if digest in seen_bodies:
+                lines.append(f"*(= {seen_bodies[digest]})*")
+            else:
+                seen_bodies[digest] = comp_title
+                lines.append(body)
+            lines.append("")
+
+        if not lines:
+            return []
+        return [f"{'#' * base_level} {module_title}", *lines]
+
+    def _render_compact_body(self, component: dict[str, Any], comp_title: str, tab_header_level: int) -> str:
+        """Render a component body with the compact profile.
+
+        Args:
+            component: Component data.
+            comp_title: Component title.
+            tab_header_level: Header level for tabs.
+
+        Returns:
+            Component body markdown, or an empty string if there is no content.
+        """
+        component_data = component.get("data", {})
+
+        if "subtitle" in component_data and "info_texts" in component_data:
+            items = []
+            if component_data.get("subtitle"):
+                items.append(f"- name: **{component_data['subtitle']}**")
+            items.extend(f"- {text}" for text in component_data.get("info_texts", []))
+            return "\n".join(items)
+
+        if "tabs" in component_data:
+            blocks = []
+            for tab in component_data["tabs"]:
+                tab_title = tab.get("title", "Unnamed Tab")
+                tab_body = self._render_compact_parsed_content(tab.get("parsed_content", {}))
+                if not tab_body:
+                    continue
+                if tab_title == comp_title:
+                    blocks.append(tab_body)
+                else:
+                    blocks.append(f"{'#' * tab_header_level} {tab_title}\n{tab_body}")
+            return "\n\n".join(blocks)
+
+        if "parsed_content" in component_data:
+            parsed_content = component_data["parsed_content"]
+            if comp_title == "共鸣链" and parsed_content.get("tables"):
+                return self._render_compact_tables(parsed_content["tables"])
+            return self._render_compact_parsed_content(parsed_content)
+
+        return ""
+
+    def _render_compact_parsed_content(self, parsed_content: dict[str, Any]) -> str:
+        """Render parsed content with the compact profile.
+
+        The HTML converter already inlines tables into ``markdown_content``, so the
+        separately extracted tables are only emitted when the text has none.
+
+        Args:
+            parsed_content: Parsed content data.
+
+        Returns:
+            Compact markdown, or an empty string if there is no content.
+        """
+        markdown_content = parsed_content.get("markdown_content", "").strip()
+        tables = parsed_content.get("tables", [])
+
+        if _TABLE_LINE_PATTERN.search(markdown_content):
+            return self._minify_inline_tables(markdown_content)
+
+        blocks = [markdown_content] if markdown_content else []
+        table_markdown = self._render_compact_tables(tables)
+        if table_markdown:
+            blocks.append(table_markdown)
+
+        return "\n\n".join(blocks)
+
+    def _render_compact_tables(self, tables: list[list[list[str]]]) -> str:
+        """Render tables using minimal pipe-table syntax.
+
+        Args:
+            tables: List of table data.
+
+        Returns:
+            Markdown tables separated by blank lines.
+        """
+        rendered = []
+
+        for table in tables:
+            if not table:
+                continue
+
+            headers = table[0]
+            rows = [self._compact_table_row(headers), self._compact_table_row(["-"] * len(headers))]
+            rows.extend(self._compact_table_row(row) for row in table[1:])
+            rendered.append("\n".join(rows))
+
+        return "\n\n".join(rendered)
+
+    def _compact_table_row(self, cells: list[str]) -> str:
+        """Join table cells without padding.
+
+        Outer pipes are always kept: without them a row starting or ending with
+        an empty cell would lose that cell and shift the others.
+
+        Args:
+            cells: Cell contents.
+
+        Returns:
+            Table row markdown.
+        """
+        return f"|{'|'.join(cells)}|"
+
+    def _minify_inline_tables(self, markdown_content: str) -> str:
+        """Rewrite padded pipe tables embedded in converted markdown.
+
+        Args:
+            markdown_content: Markdown produced by the HTML converter.
+
+        Returns:
+            Markdown with minimal table syntax.
+        """
+        lines = []
+        for line in markdown_content.split("\n"):
+            if _TABLE_LINE_PATTERN.fullmatch(line):
+                cells = line[2:-2].split(" | ")
+                if all(cell == "---" for cell in cells):
+                    cells = ["-"] * len(cells)
+                line = self._compact_table_row(cells)
+            lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def compact_whitespace(markdown: str) -> str:
+        """Strip trailing spaces and collapse runs of blank lines.
+
+        Args:
+            markdown: Markdown text.
+
+        Returns:
+            Markdown with at most one blank line between blocks.
+        """
+        markdown = _TRAILING_SPACE_PATTERN.sub("", markdown)
+        return _BLANK_LINES_PATTERN.sub("\n\n", markdown).strip() + "\n"
+
     def _generate_strategy_link_section(self, strategy_item_id: str) -> list[str]:
         """Generate strategy link section.
 
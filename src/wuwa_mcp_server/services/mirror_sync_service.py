@@ -0,0 +1,157 @@
+"""Service filling the offline mirror from the Kuro API."""
+
+import asyncio
+from collections import Counter
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+
+from ..core.config import APISettings
+from ..core.logging_config import LoggerMixin
+from ..infrastructure.api.kuro_api_client import KuroAPIClient
+from ..infrastructure.cache import content_hash
+from ..infrastructure.mirror import MirrorStore
+from .character_service import find_strategy_item_id
+
+
+class MirrorSyncService(LoggerMixin):
+    """Downloads both catalogues, every entry detail and every linked strategy page.
+
+    A sync after the first fetches only the entries whose catalogue record
+    changed (by content hash) or whose content is missing from the store. A
+    strategy page is fetched again when the character page linking to it was.
+    An entry that fails to download keeps its previously mirrored content.
+    Content the previous manifest refers to is kept for one more sync, so a
+    running offline server that has not read the new manifest yet can still
+    serve it.
+    """
+
+    def __init__(
+        self,
+        api_client: KuroAPIClient,
+        store: MirrorStore,
+        settings: APISettings,
+        concurrency: int = 4,
+    ):
+        """Initialize mirror sync service.
+
+        Args:
+            api_client: Client for the live Kuro API.
+            store: Content store to fill.
+            settings: API settings identifying the upstream being mirrored.
+            concurrency: Maximum entry details fetched at once.
+        """
+        self.api_client = api_client
+        self.store = store
+        self.upstream = f"{settings.base_url}|{settings.character_catalogue_id}|{settings.artifacts_catalogue_id}"
+        self.concurrency = max(concurrency, 1)
+
+    async def sync(self, full: bool = False) -> dict[str, int]:
+        """Bring the mirror up to date.
+
+        Args:
+            full: Fetch every entry again instead of only changed ones.
+
+        Returns:
+            Counts of catalogue records, mirrored entries, fetched, unchanged
+            and failed entries, and content files pruned.
+
+        Raises:
+            APIException: If a catalogue cannot be fetched; the mirror is left unchanged.
+        """
+        current = await asyncio.to_thread(self.store.load_manifest)
+        previous = None if full else current
+        if previous is not None and previous.get("upstream") != self.upstream:
+            self.logger.info("Mirror was synced from another upstream, fetching everything")
+            previous = None
+        old_entries: dict[str, dict[str, Any]] = previous["entries"] if previous else {}
+
+        entries: dict[str, dict[str, Any]] = {}
+        # Strategy page ID -> whether it must be fetched again
+        strategies: dict[str, bool] = {}
+        stats: Counter[str] = Counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self.api_client as client:
+            characters = await client.fetch_character_list()
+            artifacts = await client.fetch_artifacts_list()
+
+            async def fetch(entry_id: str, record_hash: str | None, is_character: bool) -> bool:
+                async with semaphore:
+                    try:
+                        detail = await client.fetch_entry_detail(entry_id)
+                    except Exception as e:
+                        self.logger.warning("Failed to mirror entry %s: %s", entry_id, e)
+                        stats["failed"] += 1
+                        if entry_id in old_entries:
+                            entries[entry_id] = old_entries[entry_id]
+                        return False
+                digest = await asyncio.to_thread(self.store.write_entry, detail)
+                entries[entry_id] = {
+                    "hash": digest,
+                    "record": record_hash,
+                    "strategy": find_strategy_item_id(detail) if is_character else None,
+                }
+                stats["fetched"] += 1
+                return True
+
+            async def sync_record(record: dict[str, Any], is_character: bool) -> None:
+                entry_id = str((record.get("content") or {}).get("linkId") or "")
+                if not entry_id:
+                    return
+                record_hash = content_hash(record)
+                old = old_entries.get(entry_id)
+                if old is not None and old["record"] == record_hash and self.store.has_entry(old["hash"]):
+                    entries[entry_id] = old
+                    stats["unchanged"] += 1
+                    refetch_strategy = False
+                else:
+                    refetch_strategy = await fetch(entry_id, record_hash, is_character)
+                strategy_id = entries.get(entry_id, {}).get("strategy")
+                if strategy_id:
+                    strategies[strategy_id] = strategies.get(strategy_id, False) or refetch_strategy
+
+            await asyncio.gather(
+                *(sync_record(record, True) for record in characters),
+                *(sync_record(record, False) for record in artifacts),
+            )
+
+            async def sync_strategy(strategy_id: str, refetch: bool) -> None:
+                old = old_entries.get(strategy_id)
+                if not refetch and old is not None and self.store.has_entry(old["hash"]):
+                    entries[strategy_id] = old
+                    stats["unchanged"] += 1
+                else:
+                    await fetch(strategy_id, None, False)
+
+            await asyncio.gather(
+                *(
+                    sync_strategy(strategy_id, refetch)
+                    for strategy_id, refetch in strategies.items()
+                    if strategy_id not in entries
+                )
+            )
+
+        manifest = {
+            "upstream": self.upstream,
+            "synced_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "catalogues": {"characters": characters, "artifacts": artifacts},
+            "entries": entries,
+        }
+        await asyncio.to_thread(self.store.write_manifest, manifest)
+        keep = {entry["hash"] for entry in entries.values()}
+        if current is not None:
+            keep.update(entry["hash"] for entry in current["entries"].values())
+        pruned = await asyncio.to_thread(self.store.prune, keep)
+
+        report = {
+            "characters": len(characters),
+            "artifacts": len(artifacts),
+            "entries": len(entries),
+            "fetched": stats["fetched"],
+            "unchanged": stats["unchanged"],
+            "failed": stats["failed"],
+            "pruned": pruned,
+        }
+        self.logger.info("Mirror sync completed: %s", report)
+        return report
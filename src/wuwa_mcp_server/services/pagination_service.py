@@ -0,0 +1,256 @@
+"""Pagination service for splitting oversized tool output into cursor-addressed pages."""
+
+import hashlib
+import itertools
+import re
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ..core.config import PaginationSettings
+from ..core.exceptions import ValidationException
+from ..core.logging_config import LoggerMixin
+from ..core.metrics import record_cache_lookup
+from ..infrastructure.cache import CacheBackend
+from ..infrastructure.cache import MemoryCacheBackend
+from ..infrastructure.cache import build_cache_key
+
+_SECTION_HEADER_PATTERN = re.compile(r"^#{1,6} ", re.MULTILINE)
+# Delimiter row below a table's header row, e.g. "| --- | :-: |" or "|-|-|"
+_TABLE_DELIMITER_PATTERN = re.compile(r"^\|(\s*:?-+:?\s*\|)+$")
+
+
+@dataclass(frozen=True)
+class _Chunk:
+    """Piece of a document that a page may start with."""
+
+    text: str
+    # Placed between the previous chunk and this one when both are on one page
+    joiner: str = "\n\n"
+    # Header and delimiter rows of the table this row belongs to, repeated
+    # above it when it starts a page
+    table_header: str = ""
+
+
+class PaginationService(LoggerMixin):
+    """Service for paginating rendered documents at section boundaries.
+
+    Rendered documents are split once and kept in a cache with a TTL, so
+    follow-up pages are served without re-fetching or re-parsing.
+    """
+
+    def __init__(self, settings: PaginationSettings | None = None, cache: CacheBackend | None = None):
+        """Initialize pagination service.
+
+        Args:
+            settings: Pagination settings. Creates default if None.
+            cache: Cache backend for split pages. Pass a shared backend so a cursor
+                can be resolved by any worker. Creates an in-process LRU cache if None.
+        """
+        self.settings = settings or PaginationSettings()
+        self.cache = cache or MemoryCacheBackend(self.settings.cache_ttl, self.settings.cache_max_entries)
+
+    async def paginate(
+        self,
+        cache_key: str,
+        render: Callable[[], Awaitable[str]],
+        max_page_tokens: int = 0,
+    ) -> str:
+        """Render a document and return its first page.
+
+        Args:
+            cache_key: Key identifying the request (tool, entity, format).
+            render: Coroutine factory producing the full document.
+            max_page_tokens: Per-call approximate token budget. Uses settings if 0.
+
+        Returns:
+            The whole document if it fits in one page, otherwise the first page
+            followed by a footer carrying the cursor of the next page.
+        """
+        document = await render()
+
+        max_bytes, max_tokens = self._resolve_budget(max_page_tokens)
+        if not max_bytes and not max_tokens:
+            return document
+
+        pages = self.split_pages(document, max_bytes, max_tokens)
+        if len(pages) == 1:
+            return document
+
+        doc_id = hashlib.blake2b(f"{cache_key}\0{document}".encode(), digest_size=8).hexdigest()
+        await self.cache.set(build_cache_key("page", doc_id), pages, self.settings.cache_ttl)
+        self.logger.debug("Split document '%s' into %s pages (doc_id=%s)", cache_key, len(pages), doc_id)
+        return self._format_page(doc_id, pages, 0)
+
+    async def get_page(self, cursor: str) -> str:
+        """Return a cached page by cursor.
+
+        Args:
+            cursor: Cursor returned in the footer of a previous page.
+
+        Returns:
+            The requested page, with a footer if more pages follow.
+
+        Raises:
+            ValidationException: If the cursor is malformed, unknown or expired.
+        """
+        doc_id, _, index_text = cursor.strip().partition(".")
+        if not doc_id or not index_text.isdigit():
+            raise ValidationException("cursor", cursor, "malformed cursor")
+
+        pages = await self.cache.get(build_cache_key("page", doc_id))
+        record_cache_lookup("page", hit=pages is not None)
+        index = int(index_text)
+        if pages is None:
+            raise ValidationException("cursor", cursor, "cursor expired or unknown; repeat the call without a cursor")
+        if index >= len(pages):
+            raise ValidationException("cursor", cursor, f"page {index + 1} out of range ({len(pages)} pages)")
+
+        return self._format_page(doc_id, pages, index)
+
+    @classmethod
+    def split_pages(cls, document: str, max_bytes: int = 0, max_tokens: int = 0) -> list[str]:
+        """Split a markdown document into pages at section boundaries.
+
+        Sections are packed greedily. A single section larger than the budget is
+        split at paragraph boundaries, then at line boundaries. Lines of one
+        paragraph stay on adjacent lines, a table's header row stays with its
+        delimiter row and is repeated above rows continued on the next page,
+        and a heading stays with the text that follows it.
+
+        Args:
+            document: Markdown document.
+            max_bytes: Maximum UTF-8 bytes per page (0 disables).
+            max_tokens: Maximum approximate tokens per page (0 disables).
+
+        Returns:
+            List of pages; a single page if the document fits.
+        """
+
+        def fits(text: str) -> bool:
+            if max_bytes and len(text.encode("utf-8")) > max_bytes:
+                return False
+            return not (max_tokens and cls.estimate_tokens(text) > max_tokens)
+
+        if fits(document):
+            return [document]
+
+        pages: list[str] = []
+        current = ""
+        for chunk in cls._iter_chunks(document, fits):
+            candidate = f"{current}{chunk.joiner}{chunk.text}" if current else chunk.text
+            if current and not fits(candidate):
+                pages.append(current)
+                current = f"{chunk.table_header}\n{chunk.text}" if chunk.table_header else chunk.text
+            else:
+                current = candidate
+        if current:
+            pages.append(current)
+
+        return pages
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Approximate the token count of a text.
+
+        CJK and other non-ASCII characters count as one token each; ASCII text
+        counts as one token per four characters.
+
+        Args:
+            text: Text to measure.
+
+        Returns:
+            Approximate token count.
+        """
+        non_ascii = sum(1 for char in text if ord(char) > 127)
+        return non_ascii + (len(text) - non_ascii + 3) // 4
+
+    @classmethod
+    def _iter_chunks(cls, document: str, fits: Callable[[str], bool]) -> Iterator[_Chunk]:
+        """Yield the chunks of a document, carrying headings into the chunk after them."""
+        carried: _Chunk | None = None
+        for chunk in cls._iter_blocks(document, fits):
+            if carried is not None:
+                chunk = _Chunk(f"{carried.text}{chunk.joiner}{chunk.text}", carried.joiner)
+                carried = None
+            if all(_SECTION_HEADER_PATTERN.match(line) for line in chunk.text.split("\n") if line):
+                carried = chunk
+                continue
+            yield chunk
+        if carried is not None:
+            yield carried
+
+    @classmethod
+    def _iter_blocks(cls, document: str, fits: Callable[[str], bool]) -> Iterator[_Chunk]:
+        """Yield sections, splitting oversized ones into paragraphs and lines."""
+        starts = [match.start() for match in _SECTION_HEADER_PATTERN.finditer(document)]
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        bounds = [*starts, len(document)]
+
+        for start, end in itertools.pairwise(bounds):
+            section = document[start:end].strip("\n")
+            if not section:
+                continue
+            if fits(section):
+                yield _Chunk(section)
+                continue
+            for paragraph in section.split("\n\n"):
+                paragraph = paragraph.strip("\n")
+                if not paragraph:
+                    continue
+                if fits(paragraph):
+                    yield _Chunk(paragraph)
+                else:
+                    yield from cls._iter_lines(paragraph)
+
+    @staticmethod
+    def _iter_lines(paragraph: str) -> Iterator[_Chunk]:
+        """Yield the lines of a paragraph, keeping each table header row with its delimiter row."""
+        lines = [line for line in paragraph.split("\n") if line]
+        joiner = "\n\n"
+        table_header = ""
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            if line.startswith("|") and index + 1 < len(lines) and _TABLE_DELIMITER_PATTERN.match(lines[index + 1]):
+                table_header = f"{line}\n{lines[index + 1]}"
+                yield _Chunk(table_header, joiner)
+                index += 2
+            else:
+                if not line.startswith("|"):
+                    table_header = ""
+                yield _Chunk(line, joiner, table_header)
+                index += 1
+            # The first line follows the previous paragraph, the others the previous line
+            joiner = "\n"
+
+    def _format_page(self, doc_id: str, pages: list[str], index: int) -> str:
+        """Append the pagination footer to a page."""
+        footer = f"*(Page {index + 1}/{len(pages)}"
+        if index + 1 < len(pages):
+            footer += f" · next_cursor: `{doc_id}.{index + 1}`"
+        return f"{pages[index]}\n\n---\n{footer})*"
+
+    def _resolve_budget(self, max_page_tokens: int) -> tuple[int, int]:
+        """Resolve the (bytes, tokens) budget for a call."""
+        if max_page_tokens and max_page_tokens > 0:
+            return self.settings.page_max_bytes, max_page_tokens
+        return self.settings.page_max_bytes, self.settings.page_max_tokens
+
+
+# Factory function for dependency injection
+def create_pagination_service(
+    settings: PaginationSettings | None = None, cache: CacheBackend | None = None
+) -> PaginationService:
+    """Create pagination service.
+
+    Args:
+        settings: Optional pagination settings.
+        cache: Optional cache backend for split pages.
+
+    Returns:
+        PaginationService instance.
+    """
+    return PaginationService(settings, cache)
@@ -0,0 +1,111 @@
+"""Rendered-output caching shared by the tool services."""
+
+from typing import Any
+
+from ..core.exceptions import ValidationException
+from ..core.metrics import record_cache_lookup
+from ..domain.value_objects import OutputFormat
+from ..infrastructure.cache import CacheBackend
+from ..infrastructure.cache import IdentityMemo
+from .json_service import JSONService
+
+
+class RenderCacheMixin:
+    """Output format handling and rendered-output caching for tool services.
+
+    Expects the service to set ``cache``, ``memo`` and ``json_service`` and to
+    provide ``logger`` (see LoggerMixin).
+    """
+
+    cache: CacheBackend | None
+    memo: IdentityMemo | None
+    json_service: JSONService
+
+    def _resolve_output_format(self, output_format: str | OutputFormat) -> OutputFormat:
+        """Resolve and validate the requested output format.
+
+        Args:
+            output_format: Requested output format.
+
+        Returns:
+            Resolved output format.
+
+        Raises:
+            ValidationException: If the output format is not supported.
+        """
+        try:
+            return OutputFormat.from_value(output_format)
+        except ValueError as e:
+            raise ValidationException("output_format", output_format, str(e)) from e
+
+    def _format_error(self, message: str, output_format: OutputFormat) -> str:
+        """Format a user-facing error message for the requested output format.
+
+        Args:
+            message: Error message.
+            output_format: Output format.
+
+        Returns:
+            Plain message for markdown, JSON error object otherwise.
+        """
+        if output_format is OutputFormat.JSON:
+            return self.json_service.generate_error_json(message)
+        return message
+
+    async def _load_rendered(self, cache_key: str) -> str | None:
+        """Load previously rendered output from the cache.
+
+        Args:
+            cache_key: Rendered-output cache key.
+
+        Returns:
+            Cached output, or None on a miss or without a cache.
+        """
+        if self.cache is None:
+            return None
+        rendered = await self.cache.get(cache_key)
+        record_cache_lookup("render", hit=rendered is not None)
+        if rendered is not None:
+            self.logger.debug("Rendered-output cache hit: %s", cache_key)
+        return rendered
+
+    async def _store_rendered(self, cache_key: str, rendered: str) -> str:
+        """Store successfully rendered output in the cache.
+
+        Args:
+            cache_key: Rendered-output cache key.
+            rendered: Rendered output.
+
+        Returns:
+            The rendered output, unchanged.
+        """
+        if self.cache is not None:
+            await self.cache.set(cache_key, rendered)
+        return rendered
+
+    def _recall_rendered(self, variant: str, *sources: Any) -> str | None:
+        """Get output previously rendered from exactly these raw entries.
+
+        Args:
+            variant: Tool and output format the output was rendered for.
+            *sources: Raw entries the output was rendered from.
+
+        Returns:
+            Memoized output, or None on a miss or without a memo.
+        """
+        if self.memo is None:
+            return None
+        rendered = self.memo.get(variant, *sources)
+        record_cache_lookup("memo", hit=rendered is not None)
+        return rendered
+
+    def _remember_rendered(self, variant: str, rendered: str, *sources: Any) -> None:
+        """Memoize output rendered from these raw entries.
+
+        Args:
+            variant: Tool and output format the output was rendered for.
+            rendered: Rendered output.
+            *sources: Raw entries the output was rendered from.
+        """
+        if self.memo is not None:
+            self.memo.set(variant, rendered, *sources)
@@ -0,0 +1,8 @@
+"""ASGI components for the HTTP transport."""
+
+from .batch_middleware import JSONRPCBatchMiddleware
+from .compression_middleware import CompressionMiddleware
+from .etag_middleware import ETagMiddleware
+from .log_filters import StatelessTeardownFilter
+
+__all__ = ["CompressionMiddleware", "ETagMiddleware", "JSONRPCBatchMiddleware", "StatelessTeardownFilter"]
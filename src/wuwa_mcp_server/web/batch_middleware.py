@@ -0,0 +1,228 @@
+"""JSON-RPC batch support for the streamable-HTTP transport."""
+
+import asyncio
+import json
+from typing import Any
+
+from ..core.logging_config import LoggerMixin
+
+_SESSION_HEADER = b"mcp-session-id"
+
+
+class JSONRPCBatchMiddleware(LoggerMixin):
+    """ASGI middleware that accepts JSON-RPC batch arrays on the MCP endpoint.
+
+    Each message of a batch is dispatched to the wrapped app as its own POST,
+    concurrently under a per-request cap, and the responses are returned in one
+    JSON array. ``initialize`` messages run first so the session they open is
+    used by the rest of the batch. Single-object requests pass through untouched.
+    """
+
+    def __init__(self, app, path: str = "/mcp", max_concurrency: int = 4, max_batch_size: int = 32):
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            path: MCP endpoint path.
+            max_concurrency: Maximum messages of one batch processed at once.
+            max_batch_size: Maximum number of messages accepted in one batch.
+        """
+        self.app = app
+        self.path = path
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_batch_size = max_batch_size
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"].rstrip("/") != self.path.rstrip("/"):
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        if not body.lstrip().startswith(b"["):
+            await self.app(scope, self._replay(body, receive), send)
+            return
+
+        try:
+            messages = json.loads(body)
+        except json.JSONDecodeError as e:
+            await self._send_json(send, 400, self._error(None, -32700, f"Parse error: {e}"))
+            return
+
+        if not messages:
+            await self._send_json(send, 400, self._error(None, -32600, "Invalid Request: empty batch"))
+            return
+        if len(messages) > self.max_batch_size:
+            message = f"Invalid Request: batch of {len(messages)} exceeds limit of {self.max_batch_size}"
+            await self._send_json(send, 400, self._error(None, -32600, message))
+            return
+
+        responses, session_id = await self._dispatch_batch(scope, messages)
+
+        headers = [(_SESSION_HEADER, session_id)] if session_id else []
+        if not responses:
+            # Batch of notifications and responses only
+            await self._send(send, 202, b"", headers)
+            return
+        await self._send_json(send, 200, responses, headers)
+
+    async def _dispatch_batch(self, scope, messages: list[Any]) -> tuple[list[dict[str, Any]], bytes | None]:
+        """Dispatch all messages of a batch and collect their responses in order."""
+        session_id = dict(scope["headers"]).get(_SESSION_HEADER)
+        results: list[list[dict[str, Any]]] = [[] for _ in messages]
+
+        # initialize opens the session the other messages belong to, so it runs first
+        pending = []
+        for index, message in enumerate(messages):
+            if isinstance(message, dict) and message.get("method") == "initialize":
+                results[index], new_session_id = await self._dispatch_one(scope, message, session_id)
+                session_id = new_session_id or session_id
+            else:
+                pending.append(index)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(index: int) -> None:
+            async with semaphore:
+                results[index], _ = await self._dispatch_one(scope, messages[index], session_id)
+
+        await asyncio.gather(*(run(index) for index in pending))
+        self.logger.debug("Processed JSON-RPC batch of %s messages", len(messages))
+
+        return [response for result in results for response in result], session_id
+
+    async def _dispatch_one(
+        self, scope, message: Any, session_id: bytes | None
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        """Run one message through the wrapped app as a standalone POST.
+
+        Returns:
+            JSON-RPC responses produced for the message and the session ID the
+            app returned, if any.
+        """
+        if not isinstance(message, dict):
+            return [self._error(None, -32600, "Invalid Request")], None
+
+        body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        headers = [
+            (name, value) for name, value in scope["headers"] if name not in (b"content-length", _SESSION_HEADER)
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        if session_id:
+            headers.append((_SESSION_HEADER, session_id))
+
+        sub_scope = {**scope, "headers": headers}
+        status, response_headers, response_body = await self._capture(sub_scope, body)
+
+        responses = self._parse_response(response_headers, response_body)
+        if status >= 400 and not responses:
+            responses = [self._error(message.get("id"), -32603, f"HTTP {status}")]
+        # Notifications never get a response entry
+        if "id" not in message:
+            responses = []
+
+        return responses, response_headers.get(_SESSION_HEADER)
+
+    async def _capture(self, scope, body: bytes) -> tuple[int, dict[bytes, bytes], bytes]:
+        """Call the wrapped app and capture its complete response."""
+        request_sent = False
+        done = asyncio.Event()
+        status = 500
+        headers: dict[bytes, bytes] = {}
+        chunks: list[bytes] = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(event) -> None:
+            nonlocal status
+            if event["type"] == "http.response.start":
+                status = event["status"]
+                headers.update((name.lower(), value) for name, value in event.get("headers", []))
+            elif event["type"] == "http.response.body":
+                chunks.append(event.get("body", b""))
+                if not event.get("more_body", False):
+                    done.set()
+
+        await self.app(scope, receive, send)
+        done.set()
+        return status, headers, b"".join(chunks)
+
+    def _parse_response(self, headers: dict[bytes, bytes], body: bytes) -> list[dict[str, Any]]:
+        """Extract JSON-RPC messages from a JSON or SSE response body."""
+        if not body:
+            return []
+
+        content_type = headers.get(b"content-type", b"").decode("latin-1")
+        if content_type.startswith("text/event-stream"):
+            payloads = [
+                line[5:].strip()
+                for line in body.decode("utf-8").splitlines()
+                if line.startswith("data:") and line[5:].strip()
+            ]
+        else:
+            payloads = [body.decode("utf-8")]
+
+        responses = []
+        for payload in payloads:
+            try:
+                parsed = json.loads(payload)
+            except json.JSONDecodeError:
+                continue
+            responses.extend(parsed if isinstance(parsed, list) else [parsed])
+        # Only responses belong in the batch reply; server requests/notifications are dropped
+        return [item for item in responses if isinstance(item, dict) and ("result" in item or "error" in item)]
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+        """Build a JSON-RPC error response."""
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        """Read the full request body."""
+        chunks = []
+        while True:
+            event = await receive()
+            if event["type"] == "http.disconnect":
+                break
+            chunks.append(event.get("body", b""))
+            if not event.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _replay(body: bytes, receive):
+        """Create a receive callable that yields an already-read body once."""
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return replay
+
+    async def _send_json(self, send, status: int, payload: Any, headers: list[tuple[bytes, bytes]] | None = None):
+        """Send a JSON response."""
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        await self._send(send, status, body, [(b"content-type", b"application/json"), *(headers or [])])
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, headers: list[tuple[bytes, bytes]]) -> None:
+        """Send a complete response."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-length", str(len(body)).encode()), *headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
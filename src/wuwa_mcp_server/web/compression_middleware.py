@@ -0,0 +1,324 @@
+"""Negotiated response compression for the streamable-HTTP transport."""
+
+import gzip
+import hashlib
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+
+from ..core.logging_config import LoggerMixin
+from ..core.metrics import record_cache_lookup
+from .jsonrpc import split_result
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Supported content codings in order of preference
+CONTENT_CODINGS = ("zstd", "br", "gzip")
+# Codings whose separately compressed parts join into one body: raw deflate
+# blocks inside a single gzip member, and consecutive zstd frames
+_JOINABLE_CODINGS = ("zstd", "gzip")
+# gzip member header: deflate, no flags, no mtime, unknown OS
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def coded_etag(etag: str, coding: str) -> str:
+    """Tag a strong ETag with a content coding, e.g. ``"<hash>-gzip"``.
+
+    A strong tag identifies the exact bytes sent, so each coding gets its own.
+    """
+    return f'{etag[:-1]}-{coding}"'
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk so SSE events arrive promptly."""
+
+    def __init__(self, encoding: str, middleware: "CompressionMiddleware"):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=middleware.zstd_level).compressobj()
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=middleware.brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(middleware.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "zstd":
+            return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware(LoggerMixin):
+    """ASGI middleware compressing JSON and SSE responses with zstd, brotli or gzip.
+
+    The encoding is negotiated from ``Accept-Encoding`` (q-values first, then
+    zstd > br > gzip). Complete bodies below ``minimum_size`` are sent as is.
+    SSE streams are compressed incrementally.
+
+    With gzip and zstd, the ``result`` member of a complete JSON-RPC response
+    is compressed on its own and kept by content hash. A tool result served
+    again, typically from the rendered-output cache, then only costs
+    compressing the small envelope that carries the request id; the kept
+    result is joined to it as further deflate blocks of the same gzip member
+    or as a further zstd frame.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        zstd_level: int = 3,
+        cache_max_entries: int = 64,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            minimum_size: Complete bodies smaller than this many bytes are not compressed.
+            gzip_level: gzip compression level (1-9).
+            brotli_quality: brotli quality (0-11); mid values keep CPU cost low.
+            zstd_level: zstd compression level.
+            cache_max_entries: Compressed tool results kept for reuse (0 disables reuse).
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+        self.cache_max_entries = cache_max_entries
+        # (result digest, coding) -> compressed result
+        self._results: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+
+        available = {"zstd": ZSTD_AVAILABLE, "br": BROTLI_AVAILABLE, "gzip": True}
+        self.encodings = [encoding for encoding in CONTENT_CODINGS if available[encoding]]
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        await self.app(scope, receive, _CompressingSend(self, encoding, send, if_none_match))
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        """Pick the response encoding for an ``Accept-Encoding`` header.
+
+        Args:
+            accept_encoding: Raw header value.
+
+        Returns:
+            Chosen encoding, or None to send the response uncompressed.
+        """
+        weights: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            name, _, params = item.strip().partition(";")
+            name = name.strip().lower()
+            if not name:
+                continue
+            weight = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    weight = float(params[2:])
+                except ValueError:
+                    weight = 0.0
+            weights[name] = weight
+
+        wildcard = weights.get("*", 0.0)
+        best, best_weight = None, 0.0
+        for encoding in self.encodings:
+            weight = weights.get(encoding, wildcard)
+            if weight > best_weight:
+                best, best_weight = encoding, weight
+        return best
+
+    def compress_body(self, encoding: str, body: bytes) -> bytes:
+        """Compress a complete body.
+
+        Args:
+            encoding: Negotiated encoding.
+            body: Uncompressed body.
+
+        Returns:
+            Compressed body.
+        """
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(body)
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compress_response(self, encoding: str, body: bytes) -> bytes:
+        """Compress a complete body, reusing the compressed result of a JSON-RPC response.
+
+        Args:
+            encoding: Negotiated encoding.
+            body: Uncompressed body.
+
+        Returns:
+            Compressed body.
+        """
+        parts = split_result(body) if encoding in _JOINABLE_CODINGS and self.cache_max_entries > 0 else None
+        if parts is None:
+            return self.compress_body(encoding, body)
+
+        head, result, tail = parts
+        compressed_result = self._compress_result(encoding, result)
+        if encoding == "zstd":
+            compressor = zstandard.ZstdCompressor(level=self.zstd_level)
+            return compressor.compress(head) + compressed_result + compressor.compress(tail)
+
+        crc = zlib.crc32(tail, zlib.crc32(result, zlib.crc32(head)))
+        return b"".join(
+            (
+                _GZIP_HEADER,
+                self._deflate(head, zlib.Z_SYNC_FLUSH),
+                compressed_result,
+                self._deflate(tail, zlib.Z_FINISH),
+                struct.pack("<II", crc, len(body) & 0xFFFFFFFF),
+            )
+        )
+
+    def _compress_result(self, encoding: str, result: bytes) -> bytes:
+        """Compress a serialized result on its own, or reuse it if compressed before."""
+        key = (hashlib.blake2b(result, digest_size=16).digest(), encoding)
+        compressed = self._results.get(key)
+        record_cache_lookup("compressed", hit=compressed is not None)
+        if compressed is not None:
+            self._results.move_to_end(key)
+            return compressed
+
+        if encoding == "zstd":
+            compressed = zstandard.ZstdCompressor(level=self.zstd_level).compress(result)
+        else:
+            # Byte-aligned and not final, so the envelope's closing blocks can follow
+            compressed = self._deflate(result, zlib.Z_SYNC_FLUSH)
+        self._results[key] = compressed
+        while len(self._results) > self.cache_max_entries:
+            self._results.popitem(last=False)
+        return compressed
+
+    def _deflate(self, data: bytes, mode: int) -> bytes:
+        """Raw deflate blocks of data that refer to nothing before it, ended by a flush."""
+        compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush(mode)
+
+
+class _CompressingSend:
+    """Send wrapper deciding per response whether and how to compress it."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send, if_none_match: str = ""):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.if_none_match = if_none_match
+        self.start_message: dict[str, Any] | None = None
+        self.stream: _StreamCompressor | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            if message["status"] == 304:
+                # Bodiless, but must vary and be tagged like the 200 it stands in for
+                headers = MutableHeaders(raw=message.setdefault("headers", []))
+                headers.add_vary_header("Accept-Encoding")
+                self._tag_not_modified(headers)
+                self.passthrough = True
+                await self.send(message)
+                return
+            headers = Headers(raw=message.get("headers", []))
+            content_type = headers.get("content-type", "")
+            if "content-encoding" in headers or not content_type.startswith(_COMPRESSIBLE_TYPES):
+                self.passthrough = True
+                await self.send(message)
+                return
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            chunk = self.stream.compress(body) if body else b""
+            if not more_body:
+                chunk += self.stream.finish()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            # Complete body in one message: compress it whole if it is worth it
+            if len(body) >= self.middleware.minimum_size:
+                body = self.middleware.compress_response(self.encoding, body)
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(body))
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = coded_etag(etag, self.encoding)
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": body, "more_body": False})
+            return
+
+        # Streaming body (SSE): compress incrementally, flushing every chunk
+        self.stream = _StreamCompressor(self.encoding, self.middleware)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["content-length"]
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": self.stream.compress(body), "more_body": True})
+
+    def _tag_not_modified(self, headers: MutableHeaders) -> None:
+        """Give a 304 the coded tag the 200 would have carried.
+
+        The 200 is compressed, and its tag coded, only when its body reaches
+        the minimum size, which a bodiless 304 no longer tells. A client that
+        holds a coded variant of the tag received such a compressed body, so
+        the 304 then carries the tag for the coding negotiated now.
+        """
+        etag = headers.get("etag")
+        if not etag or etag.startswith("W/"):
+            return
+        held = {candidate.strip().removeprefix("W/") for candidate in self.if_none_match.split(",")}
+        if any(coded_etag(etag, coding) in held for coding in CONTENT_CODINGS):
+            headers["ETag"] = coded_etag(etag, self.encoding)
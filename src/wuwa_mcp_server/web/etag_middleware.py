@@ -0,0 +1,139 @@
+"""ETag and conditional replies for JSON-RPC results on the streamable-HTTP transport."""
+
+import hashlib
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+
+from ..core.logging_config import LoggerMixin
+from ..core.metrics import HTTP_NOT_MODIFIED
+from .compression_middleware import CONTENT_CODINGS
+from .jsonrpc import split_result
+
+
+def compute_etag(result: bytes) -> str:
+    """Compute a strong ETag from the serialized bytes of a JSON-RPC result.
+
+    Args:
+        result: Serialized ``result`` member of a JSON-RPC response.
+
+    Returns:
+        Quoted entity tag.
+    """
+    return f'"{hashlib.blake2b(result, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an entity tag.
+
+    Tags carrying a content-coding suffix added by the compression middleware
+    (``"<hash>-gzip"``) match the uncompressed tag as well, so clients can send
+    back whatever tag they were given. Only the suffixes of the codings that
+    middleware uses are removed.
+
+    Args:
+        if_none_match: Raw header value.
+        etag: Quoted entity tag of the current result.
+
+    Returns:
+        True if the client already holds this result.
+    """
+    expected = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        candidate = candidate.removeprefix("W/").strip('"')
+        if candidate == expected or any(candidate == f"{expected}-{coding}" for coding in CONTENT_CODINGS):
+            return True
+    return False
+
+
+class ETagMiddleware(LoggerMixin):
+    """ASGI middleware tagging JSON-RPC results and answering unchanged ones with 304.
+
+    The tag is a hash of the ``result`` member only, so the same rendered tool
+    output gets the same tag whatever the JSON-RPC request id. When a POST
+    carries a matching ``If-None-Match``, the body is dropped and a bodiless
+    ``304 Not Modified`` is sent instead. Only complete single-message JSON
+    responses are tagged, which is why enabling ETags turns JSON responses on
+    by default. SSE streams, used with ``MCP_JSON_RESPONSE=false``, send their
+    headers before the result exists and pass through untouched, as do batch
+    replies.
+    """
+
+    def __init__(self, app, path: str = "/mcp"):
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application.
+            path: MCP endpoint path.
+        """
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"].rstrip("/") != self.path.rstrip("/"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: dict[str, Any] | None = None
+        passthrough = False
+
+        async def send_with_etag(message: dict[str, Any]) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message.get("headers", [])).get("content-type", "")
+                if message["status"] != 200 or not content_type.startswith("application/json"):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                # Streamed body: not a single complete result, leave it alone
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            etag = self._etag_for(body)
+            if etag is None:
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["ETag"] = etag
+            if if_none_match and etag_matches(if_none_match, etag):
+                HTTP_NOT_MODIFIED.inc()
+                await send(self._not_modified(start_message, etag))
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+    @staticmethod
+    def _etag_for(body: bytes) -> str | None:
+        """Compute the ETag of a single JSON-RPC success response body."""
+        parts = split_result(body)
+        return compute_etag(parts[1]) if parts is not None else None
+
+    @staticmethod
+    def _not_modified(start_message: dict[str, Any], etag: str) -> dict[str, Any]:
+        """Build the start message of a bodiless 304 reply keeping session headers."""
+        dropped = {b"content-length", b"content-type"}
+        headers = [(name, value) for name, value in start_message["headers"] if name.lower() not in dropped]
+        return {"type": "http.response.start", "status": 304, "headers": headers}
@@ -0,0 +1,26 @@
+"""Helpers for serialized JSON-RPC responses."""
+
+_RESULT_KEY = b'"result":'
+
+
+def split_result(body: bytes) -> tuple[bytes, bytes, bytes] | None:
+    """Split a single JSON-RPC success response body around its ``result`` member.
+
+    The SDK serializes responses as ``{"jsonrpc":...,"id":...,"result":...}``,
+    so the result is the tail of the body starting at the first ``"result":``
+    key; neither the version nor an encoded id can contain that sequence.
+
+    Args:
+        body: Serialized response.
+
+    Returns:
+        The envelope up to the result, the serialized result and the closing
+        brace, or None if the body is not a single success response.
+    """
+    if not body.startswith(b"{") or not body.endswith(b"}"):
+        return None
+    index = body.find(_RESULT_KEY)
+    if index < 0:
+        return None
+    start = index + len(_RESULT_KEY)
+    return body[:start], body[start:-1], body[-1:]
@@ -0,0 +1,21 @@
+"""Logging filters for the HTTP transport."""
+
+import logging
+
+import anyio
+
+
+class StatelessTeardownFilter(logging.Filter):
+    """Drop the message-router error the MCP SDK logs after every stateless request.
+
+    In stateless mode the SDK closes the per-request transport once the response
+    is sent, and its message router then logs a ``ClosedResourceError`` with a
+    full traceback. The request itself succeeded; rendering that traceback on
+    every call costs more CPU than serving the call.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False for the teardown error, True for everything else."""
+        if record.exc_info and record.getMessage() == "Error in message router":
+            return not isinstance(record.exc_info[1], anyio.ClosedResourceError)
+        return True
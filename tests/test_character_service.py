@@ -0,0 +1,56 @@
+"""Rendered-output caching of character info."""
+
+import asyncio
+
+from wuwa_mcp_server.infrastructure.cache import IdentityMemo
+from wuwa_mcp_server.infrastructure.cache import MemoryCacheBackend
+from wuwa_mcp_server.parsers.content_parser import StrategyBasedContentParser
+from wuwa_mcp_server.services.character_service import CharacterService
+from wuwa_mcp_server.services.markdown_service import MarkdownService
+
+CHARACTER = {
+    "title": "今汐",
+    "modules": [
+        {
+            "title": "角色攻略",
+            "components": [{"content": '<a href="https://wiki.kurobbs.com/mc/item/5000">攻略</a>'}],
+        }
+    ],
+}
+STRATEGY = {"title": "今汐攻略", "modules": []}
+
+
+class FlakyStrategyRepository:
+    """Finds the character; its strategy page fails to load the first time."""
+
+    def __init__(self):
+        self.strategy_failures = 1
+
+    async def find_by_name(self, name):
+        return CHARACTER
+
+    async def get_character_detail(self, entry_id):
+        if self.strategy_failures:
+            self.strategy_failures -= 1
+            raise ConnectionError("upstream unavailable")
+        return STRATEGY
+
+
+def test_output_without_failed_strategy_page_is_not_cached():
+    cache = MemoryCacheBackend()
+    service = CharacterService(
+        FlakyStrategyRepository(), StrategyBasedContentParser(), MarkdownService(), cache=cache, memo=IdentityMemo()
+    )
+
+    async def scenario():
+        degraded = await service.get_character_info("今汐")
+        stored_after_failure = len(cache)
+        complete = await service.get_character_info("今汐")
+        return degraded, stored_after_failure, complete
+
+    degraded, stored_after_failure, complete = asyncio.run(scenario())
+
+    assert stored_after_failure == 0
+    assert degraded != complete
+    assert len(cache) == 1
+    assert len(service.memo) == 1
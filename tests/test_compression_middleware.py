@@ -0,0 +1,64 @@
+"""Compression of tool results, reusing the compressed result of repeated ones."""
+
+import json
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from wuwa_mcp_server.core.metrics import CACHE_REQUESTS
+from wuwa_mcp_server.web import CompressionMiddleware
+from wuwa_mcp_server.web import ETagMiddleware
+from wuwa_mcp_server.web.compression_middleware import ZSTD_AVAILABLE
+
+TEXT = "\n".join(f"| 攻击 | {level} | {level * 13} |" for level in range(1, 200))
+RESULT = json.dumps({"content": [{"type": "text", "text": TEXT}], "isError": False}, separators=(",", ":"))
+
+
+async def tool_call(request):
+    request_id = (await request.json())["id"]
+    body = f'{{"jsonrpc":"2.0","id":{request_id},"result":{RESULT}}}'
+    return Response(body.encode(), media_type="application/json")
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = Starlette(routes=[Route("/mcp", tool_call, methods=["POST"])])
+    app.add_middleware(ETagMiddleware, path="/mcp")
+    app.add_middleware(CompressionMiddleware)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "coding",
+    ["gzip", pytest.param("zstd", marks=pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed"))],
+)
+def test_repeated_result_reuses_its_compressed_bytes(client, coding):
+    hits = CACHE_REQUESTS.labels("compressed", "hit")
+    hits_before = hits.value
+
+    responses = [
+        client.post("/mcp", json={"jsonrpc": "2.0", "id": request_id}, headers={"Accept-Encoding": coding})
+        for request_id in (1, 22)
+    ]
+
+    for request_id, response in zip((1, 22), responses, strict=True):
+        assert response.headers["content-encoding"] == coding
+        assert int(response.headers["content-length"]) < len(RESULT) // 2
+        assert response.json() == {"jsonrpc": "2.0", "id": request_id, "result": json.loads(RESULT)}
+    assert hits.value == hits_before + 1
+
+
+def test_not_modified_keeps_the_coded_tag(client):
+    first = client.post("/mcp", json={"jsonrpc": "2.0", "id": 1}, headers={"Accept-Encoding": "gzip"})
+    second = client.post(
+        "/mcp",
+        json={"jsonrpc": "2.0", "id": 2},
+        headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+    )
+
+    assert first.headers["etag"].endswith('-gzip"')
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
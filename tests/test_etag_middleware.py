@@ -0,0 +1,64 @@
+"""ETags and 304 replies for tool results."""
+
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from wuwa_mcp_server.core.config import ServerSettings
+from wuwa_mcp_server.core.metrics import HTTP_NOT_MODIFIED
+from wuwa_mcp_server.web import ETagMiddleware
+from wuwa_mcp_server.web.etag_middleware import compute_etag
+from wuwa_mcp_server.web.etag_middleware import etag_matches
+
+RESULT = b'{"content":[{"type":"text","text":"# \xe4\xbb\x8a\xe6\xb1\x90"}],"isError":false}'
+
+
+async def tool_call(request):
+    request_id = (await request.json())["id"]
+    body = b'{"jsonrpc":"2.0","id":%d,"result":%s}' % (request_id, RESULT)
+    return Response(body, media_type="application/json")
+
+
+def _client(*middleware) -> TestClient:
+    app = Starlette(routes=[Route("/mcp", tool_call, methods=["POST"])])
+    for cls, options in middleware:
+        app.add_middleware(cls, **options)
+    return TestClient(app)
+
+
+def test_etag_matches_only_known_coding_suffixes():
+    etag = compute_etag(RESULT)
+    tag = etag.strip('"')
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"{tag}-gzip", "other"', etag)
+    assert etag_matches(f'W/"{tag}-zstd"', etag)
+    assert not etag_matches(f'"{tag}-other"', etag)
+    assert not etag_matches(f'"{tag[:8]}-{tag[8:]}"', etag)
+
+
+def test_etag_turns_json_responses_on_unless_set(monkeypatch):
+    monkeypatch.delenv("MCP_ETAG", raising=False)
+    monkeypatch.delenv("MCP_JSON_RESPONSE", raising=False)
+    assert ServerSettings().json_response
+
+    monkeypatch.setenv("MCP_ETAG", "false")
+    assert not ServerSettings().json_response
+
+    monkeypatch.setenv("MCP_ETAG", "true")
+    monkeypatch.setenv("MCP_JSON_RESPONSE", "false")
+    assert not ServerSettings().json_response
+
+
+def test_unchanged_result_is_answered_with_counted_304():
+    client = _client((ETagMiddleware, {"path": "/mcp"}))
+
+    first = client.post("/mcp", json={"jsonrpc": "2.0", "id": 1})
+    not_modified_before = HTTP_NOT_MODIFIED.labels().value
+    second = client.post("/mcp", json={"jsonrpc": "2.0", "id": 2}, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.headers["etag"] == compute_etag(RESULT)
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert HTTP_NOT_MODIFIED.labels().value == not_modified_before + 1
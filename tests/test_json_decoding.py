@@ -0,0 +1,19 @@
+"""Decoding upstream response bodies with each installed JSON decoder."""
+
+import pytest
+
+from wuwa_mcp_server.infrastructure.api.json_decoding import available_decoders
+
+DECODERS = available_decoders()
+
+
+@pytest.mark.parametrize("name", DECODERS)
+def test_decoder_reads_raw_bytes(name):
+    assert DECODERS[name]('{"名称": [1, 2.5, null]}'.encode()) == {"名称": [1, 2.5, None]}
+
+
+@pytest.mark.parametrize("name", DECODERS)
+@pytest.mark.parametrize("content", [b'{"code": 200,', b"<html>502 Bad Gateway</html>", b"", b"\xff\xfe"])
+def test_decoder_raises_value_error_on_malformed_bytes(name, content):
+    with pytest.raises(ValueError):
+        DECODERS[name](content)
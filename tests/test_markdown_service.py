@@ -0,0 +1,28 @@
+"""Compact markdown rendering."""
+
+from wuwa_mcp_server.services.markdown_service import MarkdownService
+
+
+def _artifact(parsed_content: dict) -> dict:
+    return {
+        "title": "套装",
+        "modules": {"属性": {"components": [{"title": "数据", "data": {"parsed_content": parsed_content}}]}},
+    }
+
+
+def test_compact_table_keeps_empty_edge_cells():
+    table = [["", "1级", "90级"], ["攻击", "10", ""], ["", "", ""]]
+    markdown = MarkdownService().generate_artifact_markdown(
+        _artifact({"markdown_content": "", "tables": [table]}), compact=True
+    )
+
+    assert "||1级|90级|\n|-|-|-|\n|攻击|10||\n||||" in markdown
+
+
+def test_compact_inline_table_keeps_empty_edge_cells():
+    inline = "|  | 1级 |  |\n| --- | --- | --- |\n| 攻击 |  | 30 |"
+    markdown = MarkdownService().generate_artifact_markdown(
+        _artifact({"markdown_content": inline, "tables": []}), compact=True
+    )
+
+    assert "||1级||\n|-|-|-|\n|攻击||30|" in markdown
@@ -0,0 +1,61 @@
+"""Offline mirror kept current while a server is running."""
+
+import asyncio
+import os
+
+from wuwa_mcp_server.core.config import APISettings
+from wuwa_mcp_server.infrastructure.mirror import MirrorAPIClient
+from wuwa_mcp_server.infrastructure.mirror import MirrorStore
+from wuwa_mcp_server.services.mirror_sync_service import MirrorSyncService
+
+
+class FakeKuroAPIClient:
+    """Serves one character whose page changes on every sync."""
+
+    def __init__(self):
+        self.revision = 0
+
+    async def __aenter__(self):
+        self.revision += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def fetch_character_list(self):
+        return [{"content": {"linkId": "1000"}, "name": "今汐", "revision": self.revision}]
+
+    async def fetch_artifacts_list(self):
+        return []
+
+    async def fetch_entry_detail(self, entry_id):
+        return {"title": "今汐", "revision": self.revision}
+
+
+def _sync(service: MirrorSyncService, store: MirrorStore) -> None:
+    asyncio.run(service.sync())
+    # Manifest replacements within one clock tick must still be told apart
+    mtime = store.manifest_path.stat().st_mtime_ns + service.api_client.revision * 1_000_000_000
+    os.utime(store.manifest_path, ns=(mtime, mtime))
+
+
+def test_running_server_survives_sync(tmp_path):
+    store = MirrorStore(str(tmp_path))
+    service = MirrorSyncService(FakeKuroAPIClient(), store, APISettings())
+    client = MirrorAPIClient(store)
+
+    async def served_revision() -> int:
+        return (await client.fetch_entry_detail("1000"))["revision"]
+
+    _sync(service, store)
+    manifest = asyncio.run(client._get_manifest())
+    _sync(service, store)
+
+    # Content of the manifest the server still holds has not been pruned
+    assert store.read_entry(manifest["entries"]["1000"]["hash"])["revision"] == 1
+    # and the server moves on to the new manifest
+    assert asyncio.run(served_revision()) == 2
+
+    _sync(service, store)
+    assert len(list(store.entries_path.glob("*.json"))) == 2
+    assert asyncio.run(served_revision()) == 3
@@ -0,0 +1,50 @@
+"""Splitting oversized tool output into pages."""
+
+from wuwa_mcp_server.services.pagination_service import PaginationService
+
+ROWS = [f"|row{i}|val{i}|" for i in range(30)]
+ITEMS = [f"- 技能{i} 描述" for i in range(20)]
+DOCUMENT = "\n".join(
+    [
+        "# 今汐",
+        "",
+        "## 属性",
+        "",
+        "#### 数据",
+        "",
+        "|a|b|",
+        "|-|-|",
+        *ROWS,
+        "",
+        "#### 技能",
+        "",
+        *ITEMS,
+    ]
+)
+
+
+def _content_lines(pages: list[str]) -> list[str]:
+    """Lines of the pages, without the table headers repeated on continuation pages."""
+    pages = [pages[0], *(page.removeprefix("|a|b|\n|-|-|\n") for page in pages[1:])]
+    return [line for page in pages for line in page.split("\n") if line]
+
+
+def test_split_table_keeps_rows_adjacent_and_repeats_header():
+    pages = PaginationService.split_pages(DOCUMENT, max_bytes=200)
+
+    table_pages = [page for page in pages if "|row" in page]
+    assert len(table_pages) > 1
+    for page in table_pages:
+        table = page[page.index("|a|b|") :].split("\n\n")[0]
+        assert table.startswith("|a|b|\n|-|-|\n|row")
+    assert _content_lines(pages) == [line for line in DOCUMENT.split("\n") if line]
+
+
+def test_split_keeps_headings_with_their_body():
+    pages = PaginationService.split_pages(DOCUMENT, max_bytes=200)
+
+    assert len(pages) > 2
+    for page in pages:
+        assert not page.rstrip().split("\n")[-1].startswith("#")
+    assert "#### 技能\n\n- 技能0 描述" in "\n".join(pages)
+    assert "\n- 技能1 描述\n- 技能2 描述" in "\n".join(pages)
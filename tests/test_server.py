@@ -0,0 +1,72 @@
+"""Command-line entry point."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from wuwa_mcp_server import server
+from wuwa_mcp_server.core import config
+from wuwa_mcp_server.core import container
+from wuwa_mcp_server.infrastructure.mirror import MirrorStore
+
+
+@pytest.fixture
+def offline_mirror(tmp_path, monkeypatch):
+    store = MirrorStore(str(tmp_path / "mirror"))
+    digest = store.write_entry({"title": "今汐", "modules": []})
+    record = {"content": {"contentUrl": "/mc/item/1000", "linkId": "1000"}, "id": 100, "name": "今汐"}
+    store.write_manifest(
+        {
+            "upstream": "test",
+            "synced_at": "2026-01-01T00:00:00+00:00",
+            "catalogues": {"characters": [record], "artifacts": []},
+            "entries": {"1000": {"hash": digest, "record": None, "strategy": None}},
+        }
+    )
+    monkeypatch.setenv("MIRROR_OFFLINE", "true")
+    # Recorded so that main() overwriting it is undone after the test
+    monkeypatch.setenv("MIRROR_PATH", "")
+    monkeypatch.setenv("TRANSPORT", "stdio")
+    monkeypatch.setattr(config, "_settings", None)
+    monkeypatch.setattr(container, "_global_container", None)
+    monkeypatch.setattr(server, "container", None)
+    return store
+
+
+def _run_main(monkeypatch, *args: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["wuwa-mcp-server", *args])
+    server.main()
+
+
+def test_serve_mirror_path_reaches_offline_server(offline_mirror, monkeypatch):
+    servers = []
+    create_base_server = server._create_base_server
+
+    def create_stopped_server():
+        mcp = create_base_server()
+        monkeypatch.setattr(mcp, "run", lambda: servers.append(mcp))
+        return mcp
+
+    monkeypatch.setattr(server, "_create_base_server", create_stopped_server)
+    _run_main(monkeypatch, "serve", "--mirror-path", str(offline_mirror.path))
+
+    assert asyncio.run(server.get_app_container().get_kuro_api_client().fetch_character_list())[0]["name"] == "今汐"
+    result = asyncio.run(servers[0].call_tool("get_character_info", {"character_name": "今汐"}))
+    assert "# 今汐" in str(result)
+
+
+def test_serve_mirror_path_reaches_worker_processes(offline_mirror, monkeypatch):
+    import uvicorn
+
+    runs = []
+    monkeypatch.setenv("TRANSPORT", "http")
+    monkeypatch.setenv("MCP_STATELESS_HTTP", "true")
+    monkeypatch.setenv("CACHE_BACKEND", "memory")
+    monkeypatch.setattr(uvicorn, "run", lambda app, **options: runs.append((app, options)))
+    _run_main(monkeypatch, "serve", "--mirror-path", str(offline_mirror.path), "--workers", "2")
+
+    assert runs[0][1]["workers"] == 2
+    assert os.environ["MIRROR_PATH"] == str(offline_mirror.path)
+    assert config.ApplicationSettings().mirror.path == str(offline_mirror.path)